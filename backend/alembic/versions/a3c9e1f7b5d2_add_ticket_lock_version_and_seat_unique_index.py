@@ -0,0 +1,92 @@
+"""add_ticket_lock_version_and_seat_unique_index
+
+Revision ID: a3c9e1f7b5d2
+Revises: f8b3c2d5e6a1
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e1f7b5d2'
+down_revision: Union[str, Sequence[str], None] = 'f8b3c2d5e6a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 좌석 LOCK 펜싱 토큰
+    op.add_column('tickets', sa.Column('lock_version', sa.BigInteger(), server_default='0', nullable=False))
+
+    # 같은 좌석의 중복 티켓 정리 (좌석 번호가 있는 티켓만, NULL 좌석은 서로 다른 좌석으로 취급)
+    # - 예매가 걸린 티켓이 둘 이상인 좌석(중복 판매)은 자동으로 합치지 않고 목록을 남긴 뒤 중단
+    # - 그 외에는 예매가 없는 중복 티켓만 삭제 (bookings.ticket_id는 변경하지 않음)
+    conn = op.get_bind()
+    seat_partition = "event_id, coalesce(schedule_id, 0), seat_row, seat_number"
+    conflicts = conn.execute(sa.text(f"""
+        SELECT event_id, coalesce(schedule_id, 0) AS schedule_id, seat_row, seat_number, count(*) AS ticket_count
+        FROM tickets AS t
+        WHERE seat_row IS NOT NULL AND seat_number IS NOT NULL
+          AND EXISTS (SELECT 1 FROM bookings AS b WHERE b.ticket_id = t.id)
+        GROUP BY {seat_partition}
+        HAVING count(*) > 1
+    """)).fetchall()
+    if conflicts:
+        for row in conflicts:
+            logger.error(
+                "중복 판매 좌석: event_id=%s schedule_id=%s seat=%s-%s (예매된 티켓 %s개)",
+                row.event_id, row.schedule_id, row.seat_row, row.seat_number, row.ticket_count,
+            )
+        raise RuntimeError(
+            f"예매가 걸린 티켓이 중복된 좌석 {len(conflicts)}곳이 있어 유니크 인덱스를 만들 수 없습니다. "
+            "예매를 수동으로 정리한 뒤 다시 실행하세요."
+        )
+
+    deleted = conn.execute(sa.text(f"""
+        DELETE FROM tickets
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT
+                    id,
+                    has_booking,
+                    first_value(id) OVER (
+                        PARTITION BY {seat_partition}
+                        ORDER BY has_booking DESC, id
+                    ) AS keep_id
+                FROM (
+                    SELECT
+                        t.id, t.event_id, t.schedule_id, t.seat_row, t.seat_number,
+                        EXISTS (SELECT 1 FROM bookings AS b WHERE b.ticket_id = t.id) AS has_booking
+                    FROM tickets AS t
+                    WHERE t.seat_row IS NOT NULL AND t.seat_number IS NOT NULL
+                ) AS flagged
+            ) AS ranked
+            WHERE id <> keep_id AND NOT has_booking
+        )
+    """)).rowcount
+    if deleted:
+        logger.info("예매가 없는 중복 좌석 티켓 %s개 삭제", deleted)
+
+    op.create_index(
+        'uq_tickets_event_schedule_seat',
+        'tickets',
+        ['event_id', sa.text('coalesce(schedule_id, 0)'), 'seat_row', 'seat_number'],
+        unique=True,
+        postgresql_where=sa.text('seat_row IS NOT NULL AND seat_number IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+    upgrade에서 삭제한 티켓은 예매가 없는 중복 행뿐이므로 복원하지 않음"""
+    op.drop_index('uq_tickets_event_schedule_seat', table_name='tickets')
+    op.drop_column('tickets', 'lock_version')
@@ -0,0 +1,49 @@
+"""add_booking_outbox_table
+
+Revision ID: b5d8f2a6c3e9
+Revises: a3c9e1f7b5d2
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d8f2a6c3e9'
+down_revision: Union[str, Sequence[str], None] = 'a3c9e1f7b5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('booking_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_type', sa.String(length=50), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('schedule_id', sa.Integer(), nullable=True),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # 릴레이: 미전달 행만 담는 부분 인덱스
+    op.create_index(
+        'ix_booking_outbox_unpublished',
+        'booking_outbox',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('published_at IS NULL')
+    )
+    # 보관 기간이 지난 전달 완료 행 정리
+    op.create_index('ix_booking_outbox_published_at', 'booking_outbox', ['published_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_booking_outbox_published_at', table_name='booking_outbox')
+    op.drop_index('ix_booking_outbox_unpublished', table_name='booking_outbox')
+    op.drop_table('booking_outbox')
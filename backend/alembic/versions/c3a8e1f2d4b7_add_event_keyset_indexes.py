@@ -0,0 +1,31 @@
+"""add_event_keyset_indexes
+
+Revision ID: c3a8e1f2d4b7
+Revises: 551d455d7baf
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a8e1f2d4b7'
+down_revision: Union[str, Sequence[str], None] = '551d455d7baf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 이벤트 목록 keyset 페이지네이션용 복합 인덱스 (정렬 키, id)
+    op.create_index('ix_events_created_at_id', 'events', ['created_at', 'id'], unique=False)
+    op.create_index('ix_events_sales_open_date_id', 'events', ['sales_open_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_sales_open_date_id', table_name='events')
+    op.drop_index('ix_events_created_at_id', table_name='events')
@@ -0,0 +1,43 @@
+"""add_event_catalog_indexes
+
+Revision ID: d7e2b9a4c1f6
+Revises: c3a8e1f2d4b7
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e2b9a4c1f6'
+down_revision: Union[str, Sequence[str], None] = 'c3a8e1f2d4b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 카탈로그 필터 + 기본 정렬(created_at, id)용 복합 인덱스
+    op.create_index('ix_events_genre_created_at_id', 'events', ['genre', 'created_at', 'id'], unique=False)
+    op.create_index('ix_events_sub_genre_created_at_id', 'events', ['sub_genre', 'created_at', 'id'], unique=False)
+    op.create_index('ix_events_is_hot_created_at_id', 'events', ['is_hot', 'created_at', 'id'], unique=False)
+    op.create_index('ix_events_venue_id', 'events', ['venue_id'], unique=False)
+    # 공연 일정 기간 필터
+    op.create_index(
+        'ix_event_schedules_event_id_start_datetime',
+        'event_schedules',
+        ['event_id', 'start_datetime'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_event_schedules_event_id_start_datetime', table_name='event_schedules')
+    op.drop_index('ix_events_venue_id', table_name='events')
+    op.drop_index('ix_events_is_hot_created_at_id', table_name='events')
+    op.drop_index('ix_events_sub_genre_created_at_id', table_name='events')
+    op.drop_index('ix_events_genre_created_at_id', table_name='events')
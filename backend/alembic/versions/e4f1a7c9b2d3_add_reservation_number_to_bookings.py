@@ -0,0 +1,59 @@
+"""add_reservation_number_to_bookings
+
+Revision ID: e4f1a7c9b2d3
+Revises: d7e2b9a4c1f6
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f1a7c9b2d3'
+down_revision: Union[str, Sequence[str], None] = 'd7e2b9a4c1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('bookings', sa.Column('reservation_number', sa.String(length=20), nullable=True))
+
+    # 기존 예매 백필: 기존 조회 로직과 같은 기준(사용자, 이벤트, 초 단위 예매 시각)으로 묶고
+    # 그룹의 가장 작은 booking ID로 예약번호 생성 (예매 시각이 없으면 단독 그룹)
+    op.execute("""
+        UPDATE bookings AS b
+        SET reservation_number = 'M' || lpad(g.first_id::text, 9, '0')
+        FROM (
+            SELECT
+                bk.id,
+                min(bk.id) OVER (
+                    PARTITION BY
+                        bk.user_id,
+                        t.event_id,
+                        date_trunc('second', bk.booked_at),
+                        CASE WHEN bk.booked_at IS NULL THEN bk.id END
+                ) AS first_id
+            FROM bookings AS bk
+            JOIN tickets AS t ON t.id = bk.ticket_id
+        ) AS g
+        WHERE b.id = g.id
+    """)
+
+    op.create_index('ix_bookings_user_id_booked_at_id', 'bookings', ['user_id', 'booked_at', 'id'], unique=False)
+    op.create_index(
+        'ix_bookings_user_id_reservation_number',
+        'bookings',
+        ['user_id', 'reservation_number'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_user_id_reservation_number', table_name='bookings')
+    op.drop_index('ix_bookings_user_id_booked_at_id', table_name='bookings')
+    op.drop_column('bookings', 'reservation_number')
@@ -0,0 +1,29 @@
+"""add_bookings_status_booked_at_index
+
+Revision ID: f8b3c2d5e6a1
+Revises: e4f1a7c9b2d3
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8b3c2d5e6a1'
+down_revision: Union[str, Sequence[str], None] = 'e4f1a7c9b2d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 결제 대기 예매 만료 처리: 상태별 오래된 순 조회
+    op.create_index('ix_bookings_status_booked_at', 'bookings', ['status', 'booked_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_status_booked_at', table_name='bookings')
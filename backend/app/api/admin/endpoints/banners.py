@@ -2,12 +2,13 @@ from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.orm import Session, joinedload
 from typing import List
 from datetime import datetime
-from app.database import get_db
+from app.database import get_db, replica_router, CATALOG_WRITE_SCOPE
 from app.models.user import User
 from app.models.banner import Banner
 from app.models.event import Event
 from app.schemas.banner import BannerCreate, BannerUpdate, BannerResponse
 from app.core.dependencies import get_current_admin
+from app.services.cache_service import cache_service, BANNERS_NAMESPACE
 
 router = APIRouter()
 
@@ -61,6 +62,9 @@ def create_banner(
     )
     db.add(banner)
     db.commit()
+    # 공개 배너 피드 캐시 무효화
+    cache_service.bump_namespace(BANNERS_NAMESPACE)
+    replica_router.mark_write(CATALOG_WRITE_SCOPE)
     db.refresh(banner)
     
     # 이벤트 정보를 포함하여 반환
@@ -102,6 +106,9 @@ def update_banner(
         banner.exposure_end = banner_data.exposure_end
     
     db.commit()
+    # 공개 배너 피드 캐시 무효화
+    cache_service.bump_namespace(BANNERS_NAMESPACE)
+    replica_router.mark_write(CATALOG_WRITE_SCOPE)
     
     # 이벤트 정보를 포함하여 반환
     banner = (
@@ -124,6 +131,9 @@ def delete_banner(
     
     db.delete(banner)
     db.commit()
+    # 공개 배너 피드 캐시 무효화
+    cache_service.bump_namespace(BANNERS_NAMESPACE)
+    replica_router.mark_write(CATALOG_WRITE_SCOPE)
     return None
 
 @router.post("/delete-multiple", status_code=status.HTTP_204_NO_CONTENT)
@@ -136,5 +146,8 @@ def delete_banners(
     for banner in banners:
         db.delete(banner)
     db.commit()
+    # 공개 배너 피드 캐시 무효화
+    cache_service.bump_namespace(BANNERS_NAMESPACE)
+    replica_router.mark_write(CATALOG_WRITE_SCOPE)
     return None
 
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, status, Form, File, UploadFile, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, status, Form, File, UploadFile, HTTPException, Query, Response
+from sqlalchemy.orm import Session, joinedload, selectinload
 from typing import List, Optional
 from datetime import datetime
-from app.database import get_db
+from app.database import get_db, replica_router, CATALOG_WRITE_SCOPE
 from app.models.user import User
 from app.models.event import Event, EventGenre, EventSubGenre, TicketReceiptMethod
 from app.models.event_schedule import EventSchedule
@@ -11,29 +11,42 @@ from app.models.event_description_image import EventDescriptionImage
 from app.models.venue import Venue
 from app.schemas.event import EventResponse, EventScheduleCreate, EventSeatGradeCreate
 from app.core.dependencies import get_current_admin
+from app.core.pagination import keyset_paginate
+from app.api.v1.endpoints.events import resolve_event_sort
 from app.services.file_upload import save_upload_file
+from app.services.cache_service import cache_service, EVENTS_NAMESPACE, BANNERS_NAMESPACE, seat_map_namespace
+from app.services.search_index import search_index
 import json
 
 router = APIRouter()
 
 @router.get("/", response_model=List[EventResponse])
 def get_all_events(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=100),
+    sort: str = "created_at",
+    skip: int = Query(0, ge=0, deprecated=True),
     current_admin: User = Depends(get_current_admin),
     db: Session = Depends(get_db)
 ):
-    events = (
+    """관리자용 이벤트 목록 조회 (커서 기반 페이지네이션, 다음 커서는 X-Next-Cursor 헤더)
+    연관 데이터는 selectinload로 조회하여 행 수가 곱해지지 않도록 함"""
+    sort_column, descending = resolve_event_sort(sort)
+    query = (
         db.query(Event)
         .options(
-            joinedload(Event.schedules),
-            joinedload(Event.seat_grades),
-            joinedload(Event.description_images)
+            selectinload(Event.schedules),
+            selectinload(Event.seat_grades),
+            selectinload(Event.description_images)
         )
-        .offset(skip)
-        .limit(limit)
-        .all()
     )
+    events, next_cursor = keyset_paginate(
+        query, sort, sort_column, Event.id, cursor, limit,
+        descending=descending, offset=0 if cursor else skip
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return events
 
 @router.post("/", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
@@ -199,6 +212,11 @@ async def create_event(
     db.commit()
     db.refresh(new_event)
     
+    # 공개 이벤트 목록 캐시 무효화 및 검색 인덱스 반영
+    cache_service.bump_namespace(EVENTS_NAMESPACE)
+    replica_router.mark_write(CATALOG_WRITE_SCOPE)
+    search_index.upsert(new_event)
+    
     return new_event
 
 @router.get("/{event_id}", response_model=EventResponse)
@@ -402,4 +420,12 @@ async def update_event(
     db.commit()
     db.refresh(event)
     
+    # 공개 이벤트 목록 및 좌석 배치도 캐시 무효화
+    cache_service.bump_namespace(EVENTS_NAMESPACE)
+    replica_router.mark_write(CATALOG_WRITE_SCOPE)
+    cache_service.bump_namespace(seat_map_namespace(event.id))
+    # 배너 피드에 이벤트 정보가 포함되므로 함께 무효화
+    cache_service.bump_namespace(BANNERS_NAMESPACE)
+    search_index.upsert(event)
+    
     return event
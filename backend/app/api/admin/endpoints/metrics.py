@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.models.user import User
+from app.core.dependencies import get_current_admin
+from app.services.booking_events import get_booking_stats, outbox_lag
+from app.services.query_classifier import query_classifier
+from app.services.pool_metrics import pool_metrics
+from app.services.redis_service import redis_service
+
+router = APIRouter()
+
+@router.get("/ai")
+def get_ai_metrics(
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    AI 검색 로컬 처리 지표 (현재 워커 기준)
+    intent/keywords/title별 로컬 처리 횟수, LLM 위임 횟수, 로컬 처리율
+    """
+    return {"classifier": query_classifier.stats()}
+
+
+@router.get("/db")
+def get_db_pool_metrics(
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    DB 커넥션 풀 지표 (현재 워커 기준)
+    엔진별 체크아웃 중인 커넥션 수, 풀 크기/오버플로, 대기 시간, 풀 고갈 횟수
+    """
+    return {"pools": pool_metrics.snapshot()}
+
+
+@router.get("/redis")
+def get_redis_metrics(
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    Redis client-side caching 지표 (현재 워커 기준)
+    보관 항목 수, 조회/히트/미스, 서버 푸시 무효화 횟수, LRU 제거 횟수
+    """
+    return {"near_cache": redis_service.near_cache_stats()}
+
+
+@router.get("/outbox")
+def get_outbox_metrics(
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    예매 이벤트 아웃박스 지표
+    미전달 행 수, Stream 길이, 소비자 그룹별 미확인(pending)/미전달(lag) 메시지 수
+    """
+    return outbox_lag(db)
+
+
+@router.get("/bookings/{event_id}")
+def get_booking_metrics(
+    event_id: int,
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    이벤트 예매 통계 (예매 이벤트 소비자가 집계)
+    예매 좌석 수, 만료 취소 좌석 수, 매출
+    """
+    return {"event_id": event_id, **get_booking_stats(event_id)}
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.admin.endpoints import admin_users, events, venues, banners
+from app.api.admin.endpoints import admin_users, events, venues, banners, metrics
 
 admin_router = APIRouter()
 
@@ -7,3 +7,4 @@ admin_router.include_router(admin_users.router, prefix="/users", tags=["[admin]
 admin_router.include_router(events.router, prefix="/events", tags=["[admin] events"])
 admin_router.include_router(venues.router, prefix="/venues", tags=["[admin] venues"])
 admin_router.include_router(banners.router, prefix="/banners", tags=["[admin] banners"])
+admin_router.include_router(metrics.router, prefix="/metrics", tags=["[admin] metrics"])
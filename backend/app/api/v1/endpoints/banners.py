@@ -1,30 +1,83 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session, joinedload
-from typing import List
-from datetime import datetime
-from app.database import get_db
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy import func, true
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only
+from typing import List, Optional
+from datetime import datetime, timezone
+from app.database import get_read_db
+from app.core.config import settings
 from app.models.banner import Banner
-from app.models.event import Event
-from app.schemas.banner import BannerResponse
+from app.models.event import Event, EventGenre
+from app.schemas.banner import BannerCardResponse
+from app.services.cache_service import cache_service, CachedBody, BANNERS_NAMESPACE
+from app.api.v1.endpoints.events import EVENT_CARD_COLUMNS, EVENT_SCHEDULE_CARD_COLUMNS
 
 router = APIRouter()
 
-@router.get("/", response_model=List[BannerResponse])
+
+def seconds_until(boundary: Optional[datetime], now: datetime) -> Optional[int]:
+    """다음 노출 경계까지 남은 시간 (경계 직후에 만료되도록 1초 여유)"""
+    if boundary is None:
+        return None
+    if boundary.tzinfo is None:
+        # 타임존 정보가 없는 값은 서버 로컬 시간으로 간주
+        boundary = boundary.astimezone()
+    return int((boundary - now).total_seconds()) + 1
+
+
+@router.get("/", response_model=List[BannerCardResponse])
 def get_active_banners(
-    db: Session = Depends(get_db)
+    request: Request,
+    genre: Optional[EventGenre] = None,
+    db: Session = Depends(get_read_db)
 ):
-    """노출 기간 내의 활성 배너 목록 조회 (인증 불필요)"""
-    now = datetime.now()
-    
-    banners = (
-        db.query(Banner)
-        .options(joinedload(Banner.event).joinedload(Event.schedules))
-        .filter(
-            (Banner.exposure_start.is_(None) | (Banner.exposure_start <= now)),
-            (Banner.exposure_end.is_(None) | (Banner.exposure_end >= now))
+    """
+    노출 기간 내의 활성 배너 목록 조회 (인증 불필요, 캐싱 적용)
+    genre를 지정하면 해당 장르 배너와 장르 미지정(전체) 배너만 반환합니다.
+    """
+    def load_feed():
+        now = datetime.now(timezone.utc)
+        genre_filter = Banner.genre.is_(None) | (Banner.genre == genre) if genre else true()
+
+        banners = (
+            db.query(Banner)
+            # 배너 이벤트는 카드 컬럼 + 회차 날짜만 조회
+            .options(
+                joinedload(Banner.event).load_only(*EVENT_CARD_COLUMNS),
+                selectinload(Banner.event, Event.schedules).load_only(*EVENT_SCHEDULE_CARD_COLUMNS),
+            )
+            .filter(
+                genre_filter,
+                (Banner.exposure_start.is_(None) | (Banner.exposure_start <= now)),
+                (Banner.exposure_end.is_(None) | (Banner.exposure_end >= now))
+            )
+            .order_by(Banner.order)
+            .all()
         )
-        .order_by(Banner.order)
-        .all()
-    )
-    return banners
 
+        # 다음 노출 경계(시작 예정 배너의 시작 시각, 노출 중인 배너의 종료 시각)에 캐시가 만료되도록 TTL 계산
+        next_start, next_end = (
+            db.query(
+                func.min(Banner.exposure_start).filter(Banner.exposure_start > now),
+                func.min(Banner.exposure_end).filter(Banner.exposure_end >= now),
+            )
+            .filter(genre_filter)
+            .one()
+        )
+        boundaries = [s for s in (seconds_until(next_start, now), seconds_until(next_end, now)) if s is not None]
+        ttl = max(1, min(boundaries + [settings.BANNER_CACHE_TTL]))
+
+        return CachedBody(
+            value=[BannerCardResponse.model_validate(b).model_dump(mode="json") for b in banners],
+            ttl=ttl,
+        )
+
+    # 노출 경계에 정확히 만료되므로 stale 응답은 허용하지 않음
+    return cache_service.cached_response(
+        request,
+        BANNERS_NAMESPACE,
+        f"feed:{genre.name if genre else 'all'}",
+        load_feed,
+        ttl=settings.BANNER_CACHE_TTL,
+        stale_ttl=0,
+        local_ttl=settings.BANNER_LOCAL_CACHE_TTL,
+    )
@@ -1,29 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, func, String
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request
+from sqlalchemy.orm import Session, joinedload, selectinload, noload, load_only
+from sqlalchemy import exists
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Dict, Any, Literal, Set, Union
 from pydantic import BaseModel
-from app.database import get_db
-from app.models.event import Event
+from app.database import get_read_db, get_async_read_db
+from app.models.event import Event, EventGenre, EventSubGenre
 from app.models.event_schedule import EventSchedule
 from app.models.event_seat_grade import EventSeatGrade
-from app.schemas.event import EventResponse
+from app.schemas.event import EventResponse, EventCardResponse
 from app.core.config import settings
+from app.core.pagination import keyset_paginate
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.services.redis_service import redis_service
+from app.services.cache_service import cache_service, CachedBody, EVENTS_NAMESPACE
+from app.services.search_index import search_index
+from app.services.ai_cache import ai_cache, KEYWORDS, INTENT, SEARCH
+from app.services.llm_gateway import llm_gateway
+from app.services.query_classifier import query_classifier
 import openai
+import asyncio
 import json
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 router = APIRouter()
 
-# OpenAI 클라이언트 초기화 (API 키가 있는 경우에만)
-openai_client = None
-if settings.OPENAI_API_KEY:
-    openai_client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-
 
 # ============================================================================
 # 개선된 검색 알고리즘: 2단계 필터링 방식
@@ -42,7 +45,7 @@ if settings.OPENAI_API_KEY:
 # [개선된 방식 - 효율적]
 # 1. 사용자 쿼리에서 키워드 추출 (LLM 사용, 가벼운 작업)
 #    예: "조용필 콘서트 예매해줘" → ["조용필", "콘서트"]
-# 2. SQL 쿼리로 1차 필터링 (DB에서 빠르게)
+# 2. 검색 인덱스로 1차 필터링 (메모리 역색인, 관련도 순)
 #    제목, 설명, 장르, 장소 등에서 키워드 검색
 #    예: 10,000개 → 5개로 축소
 # 3. 필터링된 결과만 LLM에게 전달하여 최종 선택
@@ -63,10 +66,22 @@ async def extract_keywords_from_query(query: str) -> List[str]:
     - "서울에서 열리는 뮤지컬 찾아줘" → ["서울", "뮤지컬"]
     - "락 메탈 공연" → ["락", "메탈", "락/메탈"]
     """
-    if not openai_client:
+    if not llm_gateway.enabled:
         # LLM이 없으면 간단한 키워드 추출 (공백 기준)
         return [word.strip() for word in query.split() if len(word.strip()) > 1]
     
+    # 명확한 질의는 로컬에서 처리 (모든 키워드가 카탈로그에 존재하는 경우)
+    # 로컬 분류기는 색인 LOCK을 잡으므로 (색인 동기화 중 대기 가능) 스레드에서 실행
+    local = await asyncio.to_thread(query_classifier.extract_keywords, query)
+    query_classifier.record("keywords", local=query_classifier.is_confident(local))
+    if query_classifier.is_confident(local):
+        return local.value
+    
+    # 같은 질의는 캐시된 키워드 사용
+    cached_keywords = await ai_cache.get_async(KEYWORDS, query)
+    if cached_keywords is not None:
+        return cached_keywords
+    
     try:
         system_prompt = """당신은 검색 키워드 추출 도우미입니다.
 사용자의 자연어 쿼리에서 검색에 유용한 키워드만 추출해주세요.
@@ -93,89 +108,81 @@ async def extract_keywords_from_query(query: str) -> List[str]:
 
 위 쿼리에서 검색 키워드를 추출해주세요."""
 
-        response = openai_client.chat.completions.create(
-            model=settings.OPENAI_MODEL or "gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            response_format={"type": "json_object"},
+        ai_result = await llm_gateway.complete_json(
+            system_prompt,
+            user_prompt,
             temperature=0.1,  # 키워드 추출은 일관성이 중요하므로 낮은 temperature
         )
-        
-        ai_result = json.loads(response.choices[0].message.content)
         keywords = ai_result.get("keywords", [])
         
         # 키워드가 없거나 빈 리스트인 경우, 원본 쿼리를 단어로 분리
         if not keywords or len(keywords) == 0:
             keywords = [word.strip() for word in query.split() if len(word.strip()) > 1]
         
-        return keywords[:5]  # 최대 5개까지만 반환
+        keywords = keywords[:5]  # 최대 5개까지만 반환
+        await ai_cache.set_async(KEYWORDS, query, keywords, settings.AI_KEYWORD_CACHE_TTL)
+        return keywords
         
     except Exception as e:
-        # LLM 호출 실패 시, 간단한 키워드 추출로 폴백
-        # 불필요한 단어 제거
-        stop_words = ["예매", "예약", "찾아", "알려", "보여", "해줘", "해주세요", "하고", "싶어", "싶다"]
-        words = query.split()
-        keywords = [word.strip() for word in words if word.strip() not in stop_words and len(word.strip()) > 1]
-        return keywords[:5]
+        # LLM 호출 실패 시, 로컬 추출 결과(요청 표현/조사 제거)로 폴백
+        return local.value
 
 
-def filter_events_by_keywords(db: Session, keywords: List[str], limit: int = 50) -> List[Event]:
+def filter_events_by_keywords(
+    db: Session,
+    keywords: List[str],
+    limit: int = None,
+    load_schedules: bool = False,
+) -> List[Event]:
     """
-    키워드 기반으로 이벤트를 SQL 쿼리로 필터링합니다.
-    제목, 설명, 장르, 세부장르, 장소에서 키워드를 검색합니다.
+    키워드 기반으로 이벤트를 검색 인덱스에서 찾습니다.
+    제목, 설명, 장르, 세부장르, 장소를 bigram 역색인으로 검색하고 관련도 순으로 반환합니다.
     
     Args:
         db: 데이터베이스 세션
         keywords: 검색 키워드 리스트
         limit: 최대 반환 개수 (너무 많으면 LLM 처리 비용 증가)
+        load_schedules: 스케줄까지 함께 조회할지 여부 (응답을 후보에서 바로 만들 때)
     
     Returns:
-        필터링된 이벤트 리스트
+        관련도 순으로 정렬된 이벤트 리스트
     """
     if not keywords:
         return []
     
-    # 각 키워드에 대해 OR 조건으로 검색
-    # 제목, 설명, 장르, 세부장르, 장소에서 검색
-    conditions = []
-    for keyword in keywords:
-        keyword_lower = keyword.lower()
-        keyword_conditions = [
-            func.lower(Event.title).contains(keyword_lower),
-        ]
-        
-        # 설명이 None이 아닌 경우에만 검색 조건 추가
-        keyword_conditions.append(
-            func.lower(Event.description).contains(keyword_lower)
-        )
-        
-        # 장소가 None이 아닌 경우에만 검색 조건 추가
-        keyword_conditions.append(
-            func.lower(Event.location).contains(keyword_lower)
-        )
-        
-        # 장르는 enum이므로 문자열로 변환하여 검색
-        keyword_conditions.append(
-            func.cast(Event.genre, String).contains(keyword)
-        )
-        
-        # 세부장르도 enum이므로 문자열로 변환하여 검색
-        keyword_conditions.append(
-            func.cast(Event.sub_genre, String).contains(keyword)
-        )
-        
-        conditions.append(or_(*keyword_conditions))
-    
-    # 모든 키워드 조건을 OR로 연결
-    query = db.query(Event)
-    if conditions:
-        query = query.filter(or_(*conditions))
+    # 카탈로그가 바뀌었으면 변경분만 다시 색인
+    search_index.ensure_fresh(db)
+    ranked = search_index.search(keywords, limit=limit or settings.AI_SEARCH_CANDIDATE_LIMIT)
+    if not ranked:
+        return []
     
-    # 결과 제한 및 반환
-    filtered_events = query.limit(limit).all()
-    return filtered_events
+    # 관련도 순서 유지
+    event_ids = [event_id for event_id, _ in ranked]
+    query = db.query(Event).filter(Event.id.in_(event_ids))
+    if load_schedules:
+        query = query.options(selectinload(Event.schedules))
+    events_by_id = {event.id: event for event in query.all()}
+    return [events_by_id[event_id] for event_id in event_ids if event_id in events_by_id]
+
+
+def load_event_with_schedules(db: Session, event_id: int) -> Optional[Event]:
+    """스케줄을 포함한 이벤트 조회"""
+    return (
+        db.query(Event)
+        .options(joinedload(Event.schedules))
+        .filter(Event.id == event_id)
+        .first()
+    )
+
+
+def find_event_by_title(db: Session, query: str) -> Optional[Event]:
+    """제목이 정확히 일치하는 이벤트 (색인 동기화 포함, 동기 DB 호출이므로 스레드에서 실행)"""
+    search_index.ensure_fresh(db)
+    title_event_id = query_classifier.match_title(query)
+    query_classifier.record("title", local=title_event_id is not None)
+    if title_event_id is None:
+        return None
+    return load_event_with_schedules(db, title_event_id)
 
 class AISearchRequest(BaseModel):
     query: str
@@ -199,46 +206,193 @@ class KeywordExtractionResponse(BaseModel):
     keywords: List[str]  # 추출된 키워드 리스트
     confidence: float
 
-@router.get("/", response_model=List[EventResponse])
-def get_all_events(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+# 목록 정렬 키 (keyset 페이지네이션용, "-" 접두사는 내림차순)
+EVENT_SORT_COLUMNS = {
+    "created_at": Event.created_at,
+    "sales_open_date": Event.sales_open_date,
+}
+
+
+def resolve_event_sort(sort: str):
+    """정렬 파라미터 해석 → (정렬 컬럼, 내림차순 여부)"""
+    column = EVENT_SORT_COLUMNS.get(sort.lstrip("-"))
+    if column is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort: {sort} (가능한 값: {', '.join(EVENT_SORT_COLUMNS)})"
+        )
+    return column, sort.startswith("-")
+
+
+# 필드 프로젝션에서 별도 조회가 필요한 연관 관계
+EVENT_RELATION_FIELDS = {
+    "schedules": Event.schedules,
+    "seat_grades": Event.seat_grades,
+    "description_images": Event.description_images,
+}
+
+
+# 카드 응답(EventCardResponse)에 필요한 컬럼만 조회
+EVENT_CARD_COLUMNS = (
+    Event.id, Event.title, Event.location, Event.genre, Event.sub_genre, Event.is_hot,
+    Event.poster_image, Event.sales_open_date, Event.sales_end_date, Event.created_at,
+)
+EVENT_SCHEDULE_CARD_COLUMNS = (
+    EventSchedule.id, EventSchedule.event_id, EventSchedule.start_datetime, EventSchedule.end_datetime,
+)
+
+
+def event_card_options():
+    """카드 조회용 로더 옵션: 카드 컬럼 + 회차 날짜만, 좌석 등급/상세 이미지는 조회하지 않음"""
+    return (
+        load_only(*EVENT_CARD_COLUMNS),
+        selectinload(Event.schedules).load_only(*EVENT_SCHEDULE_CARD_COLUMNS),
+        noload(Event.seat_grades),
+        noload(Event.description_images),
+    )
+
+
+def parse_event_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """fields 파라미터 해석 (쉼표 구분, id는 항상 포함). None이면 전체 필드"""
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - set(EventResponse.model_fields)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Invalid fields: {', '.join(sorted(unknown))}")
+    return requested | {"id"}
+
+
+def build_catalog_query(
+    db: Session,
+    genre: Optional[EventGenre] = None,
+    sub_genre: Optional[EventSubGenre] = None,
+    is_hot: Optional[bool] = None,
+    sales_status: Optional[str] = None,
+    venue_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
 ):
-    """모든 사용자가 접근 가능한 이벤트 목록 조회 (캐싱 적용)"""
-    from app.services.redis_service import redis_service
-    import json
-    
-    cache_key = f"events:all:{skip}:{limit}"
-    
-    # 캐시 확인
-    try:
-        cached = redis_service.client.get(cache_key)
-        if cached:
-            return json.loads(cached)
-    except Exception:
-        pass
-    
-    # DB 조회
-    events = db.query(Event).offset(skip).limit(limit).all()
-    result = [EventResponse.from_orm(e) for e in events]
-    
-    # 캐시 저장 (5분)
-    try:
-        redis_service.client.setex(
-            cache_key,
-            300,
-            json.dumps([e.dict() for e in result], default=str)
+    """카탈로그 필터 조건이 적용된 이벤트 쿼리 생성"""
+    query = db.query(Event)
+    if genre is not None:
+        query = query.filter(Event.genre == genre)
+    if sub_genre is not None:
+        query = query.filter(Event.sub_genre == sub_genre)
+    if is_hot is not None:
+        query = query.filter(Event.is_hot == (1 if is_hot else 0))
+    if venue_id is not None:
+        query = query.filter(Event.venue_id == venue_id)
+
+    if sales_status:
+        now = datetime.now(timezone.utc)
+        if sales_status == "upcoming":
+            query = query.filter(Event.sales_open_date > now)
+        elif sales_status == "open":
+            query = query.filter(
+                (Event.sales_open_date.is_(None) | (Event.sales_open_date <= now)),
+                (Event.sales_end_date.is_(None) | (Event.sales_end_date >= now))
+            )
+        elif sales_status == "closed":
+            query = query.filter(Event.sales_end_date < now)
+
+    # 공연 일정 기간 필터: 기간 내 회차가 하나라도 있는 이벤트
+    if date_from is not None or date_to is not None:
+        schedule_conditions = [EventSchedule.event_id == Event.id]
+        if date_from is not None:
+            schedule_conditions.append(EventSchedule.start_datetime >= date_from)
+        if date_to is not None:
+            schedule_conditions.append(EventSchedule.start_datetime <= date_to)
+        query = query.filter(exists().where(*schedule_conditions))
+    return query
+
+
+@router.get("/", response_model=Union[List[EventCardResponse], List[EventResponse]])
+async def get_all_events(
+    request: Request,
+    genre: Optional[EventGenre] = None,
+    sub_genre: Optional[EventSubGenre] = None,
+    is_hot: Optional[bool] = None,
+    sales_status: Optional[Literal["upcoming", "open", "closed"]] = None,
+    venue_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    fields: Optional[str] = None,
+    view: Literal["card", "full"] = "card",
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=100),
+    sort: str = "created_at",
+    skip: int = Query(0, ge=0, deprecated=True),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """모든 사용자가 접근 가능한 이벤트 카탈로그 조회 (캐싱 적용)
+    관리자가 이벤트를 생성/수정하면 events 네임스페이스 세대가 올라가 즉시 반영됩니다.
+    캐시에는 최종 응답 본문이 압축되어 저장되며 히트 시 그대로 반환됩니다.
+
+    필터: genre, sub_genre, is_hot, sales_status(upcoming/open/closed), venue_id,
+    date_from/date_to(공연 회차 기간)
+    응답 형태: 기본은 카드(view=card, 목록 표시용 컬럼 + 회차 날짜만 조회),
+    view=full이면 상세 그래프(회차/좌석 등급/상세 이미지) 전체
+    필드 프로젝션: fields=id,title,poster_image 처럼 상세 스키마에서 필요한 필드만 요청 (연관 데이터는 요청 시에만 조회)
+
+    커서 기반 페이지네이션: 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환하며,
+    이 값을 cursor 파라미터로 전달하면 다음 페이지를 조회합니다.
+    (skip은 하위 호환용이며 커서를 사용하지 않을 때만 적용됩니다)"""
+    sort_column, descending = resolve_event_sort(sort)
+    field_set = parse_event_fields(fields)
+    # fields를 지정하면 상세 스키마 기준 프로젝션
+    card = view == "card" and field_set is None
+
+    def load_events(session: Session):
+        query = build_catalog_query(
+            session, genre, sub_genre, is_hot, sales_status, venue_id, date_from, date_to
         )
-    except Exception:
-        pass
-    
-    return result
+        if card:
+            query = query.options(*event_card_options())
+        else:
+            # 요청된 연관 관계만 selectinload, 나머지는 조회하지 않음
+            query = query.options(*[
+                selectinload(relation) if field_set is None or name in field_set else noload(relation)
+                for name, relation in EVENT_RELATION_FIELDS.items()
+            ])
+        events, next_cursor = keyset_paginate(
+            query, sort, sort_column, Event.id, cursor, limit,
+            descending=descending, offset=0 if cursor else skip
+        )
+        if card:
+            body = [EventCardResponse.model_validate(e).model_dump(mode="json") for e in events]
+        else:
+            body = [EventResponse.model_validate(e).model_dump(mode="json", include=field_set) for e in events]
+        return CachedBody(body, headers={"X-Next-Cursor": next_cursor} if next_cursor else {})
+
+    # 정규화된 필터 조합 단위로 캐싱 (파라미터 순서/필드 순서와 무관)
+    cache_key = ":".join(str(part) for part in (
+        "list",
+        genre.name if genre else "",
+        sub_genre.name if sub_genre else "",
+        "" if is_hot is None else int(is_hot),
+        sales_status or "",
+        venue_id or "",
+        date_from.isoformat() if date_from else "",
+        date_to.isoformat() if date_to else "",
+        ",".join(sorted(field_set)) if field_set else ("card" if card else "*"),
+        sort,
+        cursor or skip,
+        limit,
+    ))
+    # 캐시 미스 시 동기 쿼리 빌더를 비동기 세션 위에서 실행 (run_sync, 스레드풀 미사용)
+    return await cache_service.cached_response_async(
+        request,
+        EVENTS_NAMESPACE,
+        cache_key,
+        lambda: db.run_sync(load_events),
+        ttl=settings.EVENT_LIST_CACHE_TTL,
+    )
 
 @router.get("/{event_id}", response_model=EventResponse)
 def get_event_by_id(
     event_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
     x_queue_token: str | None = Header(None, alias="X-Queue-Token")
 ):
@@ -281,10 +435,108 @@ def get_event_by_id(
 
     return event
 
+def serialize_schedules(event: Event) -> Optional[List[Dict[str, Any]]]:
+    """날짜 선택용 스케줄 정보를 시작 시간 순으로 직렬화 (스케줄이 없으면 None)"""
+    if not event.schedules:
+        return None
+    return [
+        {
+            "id": schedule.id,
+            "start_datetime": schedule.start_datetime.isoformat(),
+            "end_datetime": schedule.end_datetime.isoformat() if schedule.end_datetime else None,
+            "running_time": schedule.running_time,
+        }
+        for schedule in sorted(event.schedules, key=lambda s: s.start_datetime)
+    ]
+
+def coerce_event_id(value: Any) -> Optional[int]:
+    """LLM 응답의 event_id를 정수로 변환 (문자열 "12" 허용, 정수로 볼 수 없으면 None)"""
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+async def cache_search_response(query: str, response: AISearchResponse) -> AISearchResponse:
+    """AI 검색 결과를 캐시에 저장하고 그대로 반환 (오류/폴백 응답은 캐싱하지 않음)"""
+    await ai_cache.set_async(SEARCH, query, response.model_dump(), settings.AI_SEARCH_CACHE_TTL)
+    return response
+
+async def fused_ai_search(db: Session, query: str) -> AISearchResponse:
+    """
+    단일 LLM 호출 검색 파이프라인
+    
+    1. 로컬 분류기로 키워드 추출 (LLM 호출 없음)
+    2. 검색 인덱스에서 후보 조회 (스케줄 포함, 한 번에)
+    3. 최소 필드만 담은 후보 목록으로 LLM 한 번 호출
+    4. 메모리에 있는 후보로 응답 생성 (선택된 이벤트 재조회 없음)
+    """
+    keywords = (await asyncio.to_thread(query_classifier.extract_keywords, query)).value
+    if not keywords:
+        return AISearchResponse(
+            event_id=None,
+            event_title=None,
+            confidence=0.0,
+            message="검색 키워드를 추출할 수 없습니다. 더 구체적으로 검색해주세요.",
+            schedules=None
+        )
+    
+    candidates = await asyncio.to_thread(filter_events_by_keywords, db, keywords, load_schedules=True)
+    if not candidates:
+        return await cache_search_response(query, AISearchResponse(
+            event_id=None,
+            event_title=None,
+            confidence=0.0,
+            message=f"'{', '.join(keywords)}' 키워드로 검색된 이벤트가 없습니다. 다른 키워드로 검색해보세요.",
+            schedules=None
+        ))
+    
+    # 토큰 절약을 위한 최소 스키마: i=ID, t=제목, g=장르, l=장소
+    compact_candidates = [
+        {
+            "i": event.id,
+            "t": event.title,
+            "g": "/".join(g.value for g in (event.genre, event.sub_genre) if g),
+            "l": event.location or "",
+        }
+        for event in candidates
+    ]
+    
+    system_prompt = """공연 검색 도우미입니다. 후보(i=ID, t=제목, g=장르, l=장소) 중 사용자 검색어에 가장 맞는 공연을 고르세요.
+JSON으로만 응답: {"event_id": 정수 또는 null, "confidence": 0.0~1.0, "reason": "짧은 한국어 이유"}
+맞는 후보가 없으면 event_id는 null, confidence는 0.0입니다."""
+    user_prompt = f"""검색어: "{query}"
+후보: {json.dumps(compact_candidates, ensure_ascii=False, separators=(",", ":"))}"""
+    
+    ai_result = await llm_gateway.complete_json(system_prompt, user_prompt, temperature=0.3)
+    event_id = coerce_event_id(ai_result.get("event_id"))
+    confidence = ai_result.get("confidence", 0.0)
+    reason = ai_result.get("reason", "")
+    
+    candidates_by_id = {event.id: event for event in candidates}
+    event = candidates_by_id.get(event_id)
+    if event is None or confidence < 0.3:
+        return await cache_search_response(query, AISearchResponse(
+            event_id=None,
+            event_title=None,
+            confidence=confidence if event is not None else 0.0,
+            message=f"검색 결과를 찾지 못했습니다. 다른 키워드로 검색해보세요. ({reason if reason else '관련 이벤트 없음'})",
+            schedules=None
+        ))
+    
+    return await cache_search_response(query, AISearchResponse(
+        event_id=event.id,
+        event_title=event.title,
+        confidence=confidence,
+        message=f"'{event.title}' 이벤트를 찾았습니다! ({reason})",
+        schedules=serialize_schedules(event)
+    ))
+
 @router.post("/search/ai", response_model=AISearchResponse)
 async def search_event_by_ai(
     request: AISearchRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     [개선된 방식] AI를 사용하여 자연어 쿼리로 이벤트 검색
@@ -293,19 +545,45 @@ async def search_event_by_ai(
     개선 후: 키워드 추출 → SQL 필터링 → 필터링된 결과만 LLM에게 전달 (효율적)
     
     처리 과정:
-    1. 사용자 쿼리에서 키워드 추출 (LLM 사용, 가벼운 작업)
-    2. SQL 쿼리로 1차 필터링 (DB에서 빠르게)
+    0. 제목이 정확히 일치하면 바로 반환 (로컬)
+    1. 사용자 쿼리에서 키워드 추출 (로컬 분류기, 불확실할 때만 LLM)
+    2. 검색 인덱스로 1차 필터링 (메모리 역색인, 관련도 순)
     3. 필터링된 결과만 LLM에게 전달하여 최종 선택
+    
+    AI_SEARCH_FUSED가 켜져 있으면 1~3단계를 LLM 한 번 호출로 처리합니다 (fused_ai_search).
     """
-    if not openai_client:
+    if not llm_gateway.enabled:
         raise HTTPException(
             status_code=503,
             detail="AI 검색 기능이 설정되지 않았습니다. OPENAI_API_KEY를 설정해주세요."
         )
     
+    # 같은 질의 + 같은 카탈로그 세대면 캐시된 결과 반환 (LLM 호출 생략)
+    cached_response = await ai_cache.get_async(SEARCH, request.query)
+    if cached_response is not None:
+        return AISearchResponse(**cached_response)
+    
     try:
         # ========================================================================
-        # STEP 1: 키워드 추출 (LLM 사용)
+        # STEP 0: 제목 정확 일치 (로컬, LLM 호출 없음)
+        # ========================================================================
+        # 예: "레미제라블 예매해줘" → 제목이 "레미제라블"인 이벤트
+        # DB 조회는 이벤트 루프를 막지 않도록 스레드에서 실행
+        event = await asyncio.to_thread(find_event_by_title, db, request.query)
+        if event:
+            return await cache_search_response(request.query, AISearchResponse(
+                event_id=event.id,
+                event_title=event.title,
+                confidence=1.0,
+                message=f"'{event.title}' 이벤트를 찾았습니다!",
+                schedules=serialize_schedules(event)
+            ))
+        
+        if settings.AI_SEARCH_FUSED:
+            return await fused_ai_search(db, request.query)
+        
+        # ========================================================================
+        # STEP 1: 키워드 추출 (로컬 분류기 → 불확실하면 LLM)
         # ========================================================================
         # 사용자 쿼리에서 검색에 유용한 키워드를 추출합니다.
         # 예: "조용필 콘서트 예매해줘" → ["조용필"]
@@ -321,22 +599,22 @@ async def search_event_by_ai(
             )
         
         # ========================================================================
-        # STEP 2: SQL 쿼리로 1차 필터링 (DB에서 빠르게)
+        # STEP 2: 검색 인덱스로 1차 필터링 (메모리 역색인)
         # ========================================================================
         # 키워드 기반으로 이벤트를 필터링합니다.
-        # 제목, 설명, 장르, 세부장르, 장소에서 검색합니다.
+        # 제목, 설명, 장르, 세부장르, 장소에서 검색하고 관련도 순으로 정렬합니다.
         # 예: 10,000개 → 5개로 축소
-        filtered_events = filter_events_by_keywords(db, keywords, limit=50)
+        filtered_events = await asyncio.to_thread(filter_events_by_keywords, db, keywords)
         
         if not filtered_events:
             # 필터링 결과가 없으면 키워드 기반 검색으로 폴백
-            return AISearchResponse(
+            return await cache_search_response(request.query, AISearchResponse(
                 event_id=None,
                 event_title=None,
                 confidence=0.0,
                 message=f"'{', '.join(keywords)}' 키워드로 검색된 이벤트가 없습니다. 다른 키워드로 검색해보세요.",
                 schedules=None
-            )
+            ))
         
         # ========================================================================
         # STEP 3: 필터링된 결과만 LLM에게 전달하여 최종 선택
@@ -375,38 +653,27 @@ async def search_event_by_ai(
 
 위 이벤트 목록 중에서 사용자 검색어와 가장 관련성 높은 이벤트를 찾아주세요."""
 
-        response = openai_client.chat.completions.create(
-            model=settings.OPENAI_MODEL or "gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            response_format={"type": "json_object"},
+        ai_result = await llm_gateway.complete_json(
+            system_prompt,
+            user_prompt,
             temperature=0.3,
         )
-        
-        ai_result = json.loads(response.choices[0].message.content)
-        event_id = ai_result.get("event_id")
+        event_id = coerce_event_id(ai_result.get("event_id"))
         confidence = ai_result.get("confidence", 0.0)
         reason = ai_result.get("reason", "")
         
         # 이벤트 ID가 유효한지 확인
         if event_id is None or confidence < 0.3:
-            return AISearchResponse(
+            return await cache_search_response(request.query, AISearchResponse(
                 event_id=None,
                 event_title=None,
                 confidence=confidence,
                 message=f"검색 결과를 찾지 못했습니다. 다른 키워드로 검색해보세요. ({reason if reason else '관련 이벤트 없음'})",
                 schedules=None
-            )
+            ))
         
         # 이벤트 존재 여부 확인 및 스케줄 정보 가져오기
-        event = (
-            db.query(Event)
-            .options(joinedload(Event.schedules))
-            .filter(Event.id == event_id)
-            .first()
-        )
+        event = await asyncio.to_thread(load_event_with_schedules, db, event_id)
         if not event:
             return AISearchResponse(
                 event_id=None,
@@ -417,25 +684,15 @@ async def search_event_by_ai(
             )
         
         # 스케줄 정보를 직렬화 가능한 형식으로 변환
-        schedules_data = None
-        if event.schedules:
-            schedules_data = [
-                {
-                    "id": schedule.id,
-                    "start_datetime": schedule.start_datetime.isoformat(),
-                    "end_datetime": schedule.end_datetime.isoformat() if schedule.end_datetime else None,
-                    "running_time": schedule.running_time,
-                }
-                for schedule in sorted(event.schedules, key=lambda s: s.start_datetime)
-            ]
+        schedules_data = serialize_schedules(event)
         
-        return AISearchResponse(
+        return await cache_search_response(request.query, AISearchResponse(
             event_id=event.id,
             event_title=event.title,
             confidence=confidence,
             message=f"'{event.title}' 이벤트를 찾았습니다! ({reason})",
             schedules=schedules_data
-        )
+        ))
         
     except openai.RateLimitError as e:
         # OpenAI API 할당량 초과 오류
@@ -462,32 +719,17 @@ async def search_event_by_ai(
             schedules=None
         )
     except Exception as e:
-        # AI 검색 실패 시, 간단한 키워드 기반 검색으로 폴백
+        # AI 검색 실패 시 (LLM 타임아웃/서킷 오픈 포함), 간단한 키워드 기반 검색으로 폴백
         # 개선된 방식: 키워드 추출 실패 시에도 SQL 필터링 시도
         try:
             # 간단한 키워드 추출 (공백 기준)
             simple_keywords = [word.strip() for word in request.query.split() if len(word.strip()) > 1]
-            filtered_events = filter_events_by_keywords(db, simple_keywords, limit=10)
+            filtered_events = await asyncio.to_thread(filter_events_by_keywords, db, simple_keywords, limit=10)
             
             if filtered_events:
                 # 첫 번째 결과 반환
-                event = (
-                    db.query(Event)
-                    .options(joinedload(Event.schedules))
-                    .filter(Event.id == filtered_events[0].id)
-                    .first()
-                )
-                schedules_data = None
-                if event and event.schedules:
-                    schedules_data = [
-                        {
-                            "id": schedule.id,
-                            "start_datetime": schedule.start_datetime.isoformat(),
-                            "end_datetime": schedule.end_datetime.isoformat() if schedule.end_datetime else None,
-                            "running_time": schedule.running_time,
-                        }
-                        for schedule in sorted(event.schedules, key=lambda s: s.start_datetime)
-                    ]
+                event = await asyncio.to_thread(load_event_with_schedules, db, filtered_events[0].id)
+                schedules_data = serialize_schedules(event) if event else None
                 return AISearchResponse(
                     event_id=event.id if event else None,
                     event_title=event.title if event else None,
@@ -508,19 +750,32 @@ async def search_event_by_ai(
 
 @router.post("/ai/intent", response_model=IntentClassificationResponse)
 async def classify_intent(
-    request: IntentClassificationRequest,
-    db: Session = Depends(get_db)
+    request: IntentClassificationRequest
 ):
     """
     사용자의 질문 의도를 분류합니다.
     "검색" 또는 "예매" 중 하나로 분류합니다.
     """
-    if not openai_client:
+    if not llm_gateway.enabled:
         raise HTTPException(
             status_code=503,
             detail="AI 기능이 설정되지 않았습니다. OPENAI_API_KEY를 설정해주세요."
         )
     
+    # 예매/검색 표현이 명확하면 로컬 규칙으로 분류
+    local = query_classifier.classify_intent(request.query)
+    query_classifier.record("intent", local=query_classifier.is_confident(local))
+    if query_classifier.is_confident(local):
+        return IntentClassificationResponse(
+            intent=local.value,
+            confidence=local.confidence,
+            message=f"의도: {local.value} ({local.reason})"
+        )
+    
+    cached_intent = await ai_cache.get_async(INTENT, request.query)
+    if cached_intent is not None:
+        return IntentClassificationResponse(**cached_intent)
+    
     try:
         system_prompt = """당신은 사용자의 의도를 분류하는 도우미입니다.
 사용자의 질문을 분석하여 다음 중 하나로 분류해주세요:
@@ -541,17 +796,11 @@ async def classify_intent(
 
 위 질문의 의도를 분류해주세요."""
 
-        response = openai_client.chat.completions.create(
-            model=settings.OPENAI_MODEL or "gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            response_format={"type": "json_object"},
+        ai_result = await llm_gateway.complete_json(
+            system_prompt,
+            user_prompt,
             temperature=0.3,
         )
-        
-        ai_result = json.loads(response.choices[0].message.content)
         intent = ai_result.get("intent", "search")
         confidence = ai_result.get("confidence", 0.5)
         reason = ai_result.get("reason", "")
@@ -560,11 +809,13 @@ async def classify_intent(
         if intent not in ["search", "booking"]:
             intent = "search"
         
-        return IntentClassificationResponse(
+        result = IntentClassificationResponse(
             intent=intent,
             confidence=confidence,
             message=f"의도: {intent} ({reason})"
         )
+        await ai_cache.set_async(INTENT, request.query, result.model_dump(), settings.AI_KEYWORD_CACHE_TTL)
+        return result
         
     except openai.RateLimitError:
         # OpenAI API 할당량 초과 오류
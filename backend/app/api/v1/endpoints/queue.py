@@ -2,22 +2,24 @@
 대기열 진입 및 상태 조회 API - 배치 처리 기반
 """
 from fastapi import APIRouter, Depends, HTTPException
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user_async
 from app.core.config import settings
 from app.models.user import User
 from app.models.event import Event
 from app.services.redis_service import redis_service
-from app.database import get_db
-from sqlalchemy.orm import Session
+from app.services import redis_keys
+from app.database import get_async_db
+from sqlalchemy.ext.asyncio import AsyncSession
 import time
 import secrets
 
 router = APIRouter()
 
 # Lua 스크립트: 배치 진행을 원자적으로 수행
-# KEYS[1] = queue_batch_last_time:event:{eid}
-# KEYS[2] = queue_batch_cursor:event:{eid}
-# KEYS[3] = queue:event:{eid}
+# KEYS[1] = redis_keys.queue_batch_last_time(eid)
+# KEYS[2] = redis_keys.queue_batch_cursor(eid)
+# KEYS[3] = redis_keys.queue(eid)
+# (해시 태그 모드에서는 세 키가 같은 이벤트 슬롯에 있어 Redis Cluster에서도 실행 가능)
 # ARGV[1] = batch_interval (초)
 # ARGV[2] = batch_size
 # ARGV[3] = current_time
@@ -76,6 +78,7 @@ redis.call('EXPIRE', last_time_key, 86400)
 
 return tostring(new_cursor)
 """
+redis_service.register_script("batch_advance", BATCH_ADVANCE_LUA)
 
 
 async def _try_advance_batch(event_id: int) -> float:
@@ -83,18 +86,21 @@ async def _try_advance_batch(event_id: int) -> float:
     배치 진행 시도 (Lua 스크립트로 원자적 실행)
     반환: 현재 커서 값 (score)
     """
-    last_time_key = f"queue_batch_last_time:event:{event_id}"
-    cursor_key = f"queue_batch_cursor:event:{event_id}"
-    queue_key = f"queue:event:{event_id}"
+    last_time_key = redis_keys.queue_batch_last_time(event_id)
+    cursor_key = redis_keys.queue_batch_cursor(event_id)
+    queue_key = redis_keys.queue(event_id)
 
     current_time = time.time()
-    result = redis_service.client.eval(
-        BATCH_ADVANCE_LUA,
-        3,
-        last_time_key, cursor_key, queue_key,
-        settings.QUEUE_BATCH_INTERVAL,
-        settings.QUEUE_BATCH_SIZE,
-        current_time
+    # 배치 간격이 지나지 않았으면 스크립트 없이 커서 반환 (두 키는 client-side caching으로 조회)
+    # 다른 워커가 배치를 진행하면 무효화 푸시로 갱신되며, 그 사이 이전 값을 읽어도 다음 폴링에서 반영됨
+    last_time, cursor = redis_service.get_near_many([last_time_key, cursor_key])
+    if last_time is not None and (current_time - float(last_time)) < settings.QUEUE_BATCH_INTERVAL:
+        return float(cursor or 0)
+
+    result = redis_service.run_script(
+        "batch_advance",
+        [last_time_key, cursor_key, queue_key],
+        [settings.QUEUE_BATCH_INTERVAL, settings.QUEUE_BATCH_SIZE, current_time]
     )
     return float(result)
 
@@ -104,7 +110,7 @@ def _is_user_released(event_id: int, user_id: int, cursor: float) -> bool:
     사용자가 배치 커서를 통과했는지 확인
     user_score <= cursor 이면 통과
     """
-    queue_key = f"queue:event:{event_id}"
+    queue_key = redis_keys.queue(event_id)
     user_score = redis_service.client.zscore(queue_key, str(user_id))
     if user_score is None:
         # 대기열에 없음 (이미 제거되었거나 진입하지 않음)
@@ -117,7 +123,7 @@ def _is_user_released(event_id: int, user_id: int, cursor: float) -> bool:
 async def _issue_queue_token(event_id: int, user_id: int) -> str:
     """대기열 토큰 발급"""
     token = secrets.token_urlsafe(32)
-    token_key = f"queue_token:event:{event_id}:user:{user_id}"
+    token_key = redis_keys.queue_token(event_id, user_id)
     redis_service.client.setex(token_key, settings.QUEUE_TOKEN_TTL, token)
     return token
 
@@ -125,7 +131,7 @@ async def _issue_queue_token(event_id: int, user_id: int) -> str:
 async def _record_queue_processing(event_id: int):
     """대기열 처리 완료 기록 (통계용)"""
     try:
-        history_key = f"queue_history:event:{event_id}"
+        history_key = redis_keys.queue_history(event_id)
         current_time = time.time()
         redis_service.client.zadd(history_key, {str(current_time): current_time})
         # 오래된 데이터 삭제 (1시간 이상)
@@ -139,7 +145,7 @@ async def _record_queue_processing(event_id: int):
 async def _get_recent_processing_rate(event_id: int) -> float:
     """최근 처리 속도 계산 (명/초)"""
     try:
-        history_key = f"queue_history:event:{event_id}"
+        history_key = redis_keys.queue_history(event_id)
         current_time = time.time()
         one_minute_ago = current_time - 60
         processed_count = redis_service.client.zcount(
@@ -179,7 +185,7 @@ def validate_queue_token(event_id: int, user_id: int, token: str) -> bool:
     대기열 토큰 검증 - O(1) 직접 조회
     events.py, tickets.py에서 import하여 사용
     """
-    token_key = f"queue_token:event:{event_id}:user:{user_id}"
+    token_key = redis_keys.queue_token(event_id, user_id)
     try:
         stored_token = redis_service.client.get(token_key)
         return stored_token == token
@@ -190,11 +196,11 @@ def validate_queue_token(event_id: int, user_id: int, token: str) -> bool:
 @router.post("/queue/enter/{event_id}")
 async def enter_queue(
     event_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """대기열 진입"""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await db.get(Event, event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -210,7 +216,7 @@ async def enter_queue(
             "batch_interval": settings.QUEUE_BATCH_INTERVAL,
         }
 
-    queue_key = f"queue:event:{event_id}"
+    queue_key = redis_keys.queue(event_id)
 
     try:
         # 이미 대기열에 있는지 확인
@@ -260,10 +266,10 @@ async def enter_queue(
 @router.get("/queue/status/{event_id}")
 async def get_queue_status(
     event_id: int,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_async)
 ):
     """대기열 상태 조회 (이벤트 단위 캐시 제거 - 데이터 누출 방지)"""
-    queue_key = f"queue:event:{event_id}"
+    queue_key = redis_keys.queue(event_id)
 
     try:
         # 배치 진행 시도
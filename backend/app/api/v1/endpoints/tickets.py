@@ -1,18 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request, Response
+from sqlalchemy.orm import Session, joinedload, aliased
+from sqlalchemy import select, func, and_, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_db, get_read_db, get_async_read_db, replica_router, user_write_scope, event_write_scope
 from app.models.ticket import Ticket, TicketGrade
-from app.models.booking import Booking, BookingStatus
+from app.models.booking import Booking, BookingStatus, format_reservation_number
 from app.models.event import Event
 from app.models.event_schedule import EventSchedule
 from app.models.event_seat_grade import EventSeatGrade
 from app.models.venue import Venue
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_current_user_async_read
 from app.models.user import User
-from app.services.redis_service import redis_service
+from app.core.config import settings
+from app.core.pagination import encode_cursor, decode_cursor
+from app.services.redis_service import redis_service, HOLD_LIMIT_EXCEEDED
+from app.services.cache_service import cache_service, seat_map_namespace
+from app.services.booking_events import BOOKING_CREATED, add_booking_event, dispatch_inline_events
+from app.services.seat_hold_service import (
+    seat_hold_service, SeatHold, SeatHoldLimitError, SeatUnavailableError, temporary_ticket_id
+)
 from pydantic import BaseModel
+from datetime import datetime, timezone
+import asyncio
+import uuid
 
 router = APIRouter()
 
@@ -30,11 +42,12 @@ class TicketResponse(BaseModel):
         from_attributes = True
 
 @router.get("/events/{event_id}/tickets", response_model=List[TicketResponse])
-def get_event_tickets(
+async def get_event_tickets(
+    request: Request,
     event_id: int,
     schedule_id: int | None = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async_read),
     x_queue_token: str | None = Header(None, alias="X-Queue-Token")
 ):
     """이벤트의 티켓 목록 조회
@@ -44,7 +57,8 @@ def get_event_tickets(
     from app.api.v1.endpoints.queue import validate_queue_token
 
     # 이벤트와 venue 정보 확인
-    event = db.query(Event).options(joinedload(Event.venue)).filter(Event.id == event_id).first()
+    result = await db.execute(select(Event).options(joinedload(Event.venue)).where(Event.id == event_id))
+    event = result.scalars().first()
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
@@ -59,7 +73,7 @@ def get_event_tickets(
                 }
             )
 
-        if not validate_queue_token(event_id, current_user.id, x_queue_token):
+        if not await asyncio.to_thread(validate_queue_token, event_id, current_user.id, x_queue_token):
             raise HTTPException(
                 status_code=403,
                 detail={
@@ -68,6 +82,27 @@ def get_event_tickets(
                 }
             )
     
+    # 좌석 배치도는 이벤트별 네임스페이스에 캐싱 (예매/관리자 수정 시 세대 증가로 무효화)
+    # 캐시 미스 시 기존 동기 조회 로직을 비동기 세션 위에서 실행 (run_sync, 스레드풀 미사용)
+    async def load_seat_map():
+        tickets = await db.run_sync(lambda session: _build_seat_map(session, event, schedule_id))
+        return [ticket.model_dump() for ticket in tickets]
+
+    return await cache_service.cached_response_async(
+        request,
+        seat_map_namespace(event_id),
+        f"schedule:{schedule_id or 'all'}",
+        load_seat_map,
+        ttl=settings.SEAT_MAP_CACHE_TTL,
+        stale_ttl=0,
+    )
+
+
+def _build_seat_map(db: Session, event: Event, schedule_id: int | None) -> List[TicketResponse]:
+    """좌석 배치도 생성
+    tickets 테이블에 데이터가 없으면 event_seat_grades를 기반으로 좌석을 생성"""
+    event_id = event.id
+
     # schedule_id가 제공된 경우 해당 스케줄 확인
     if schedule_id:
         schedule = db.query(EventSchedule).filter(
@@ -320,6 +355,7 @@ class CreateBookingRequest(BaseModel):
     total_price: float
     receipt_method: str  # "delivery" or "on_site"
     delivery_info: Optional[dict] = None
+    hold_id: Optional[str] = None  # 좌석 선택 시 받은 홀드 ID (예매 완료 후 홀드 해제)
 
 
 class SeatInfo(BaseModel):
@@ -335,6 +371,19 @@ class SeatLockResponse(BaseModel):
     success: bool
     message: str
     locked_seats: List[dict] = []
+    hold_id: Optional[str] = None
+    expires_at: Optional[str] = None
+
+class SeatHoldResponse(BaseModel):
+    hold_id: str
+    event_id: int
+    schedule_id: Optional[int] = None
+    seats: List[dict]
+    expires_at: str
+    max_expires_at: str
+
+class SeatReleaseResponse(BaseModel):
+    released_seats: int
 
 class BookingResponse(BaseModel):
     id: int
@@ -386,67 +435,106 @@ def lock_seats(
                 }
             )
     
-    locked_tickets = []
+    seats = [
+        {
+            "row": seat_info.row,
+            "number": seat_info.number,
+            "ticket_id": _find_ticket_id(db, request.event_id, request.schedule_id, seat_info.row, seat_info.number),
+        }
+        for seat_info in request.seats
+    ]
     
     try:
-        for seat_info in request.seats:
-            # 티켓이 이미 존재하는지 확인
-            ticket_query = db.query(Ticket).filter(
-                Ticket.event_id == request.event_id,
-                Ticket.seat_row == seat_info.row,
-                Ticket.seat_number == seat_info.number
-            )
-            if request.schedule_id:
-                ticket_query = ticket_query.filter(Ticket.schedule_id == request.schedule_id)
-            existing_ticket = ticket_query.first()
-            
-            # 티켓 ID 결정
-            if existing_ticket:
-                ticket_id = existing_ticket.id
-            else:
-                # 임시 ID 생성 (일관성을 위해 절대값 사용)
-                seat_key = f"{request.event_id}:{request.schedule_id or 0}:{seat_info.row}:{seat_info.number}"
-                ticket_id = -abs(hash(seat_key)) % 1000000
-            
-            # Redis LOCK 시도
-            lock_acquired = redis_service.try_lock_seat(ticket_id, user_id=current_user.id)
-            
-            # LOCK 실패 시, 같은 사용자가 이미 LOCK을 가지고 있는지 확인
-            if not lock_acquired:
-                lock_user_id = redis_service.get_lock_user_id(ticket_id)
-                if lock_user_id is not None and lock_user_id == current_user.id:
-                    lock_acquired = True
-            
-            if lock_acquired:
-                locked_tickets.append({
-                    "row": seat_info.row,
-                    "number": seat_info.number,
-                    "ticket_id": ticket_id
-                })
-            else:
-                # 하나라도 실패하면 모든 LOCK 해제
-                for locked in locked_tickets:
-                    redis_service.unlock_seat(locked["ticket_id"])
-                return SeatLockResponse(
-                    success=False,
-                    message=f"좌석 {seat_info.row}-{seat_info.number}번이 다른 사용자에 의해 처리 중입니다.",
-                    locked_seats=[]
-                )
-        
+        # 같은 사용자가 이미 잠근 좌석은 새 홀드로 이전, 하나라도 실패하면 모두 해제
+        hold = seat_hold_service.acquire(current_user.id, request.event_id, request.schedule_id, seats)
+    except SeatUnavailableError as e:
         return SeatLockResponse(
-            success=True,
-            message=f"{len(locked_tickets)}개의 좌석이 잠금되었습니다.",
-            locked_seats=locked_tickets
+            success=False,
+            message=f"좌석 {e.seat['row']}-{e.seat['number']}번이 다른 사용자에 의해 처리 중입니다.",
+            locked_seats=[]
+        )
+    except SeatHoldLimitError as e:
+        return SeatLockResponse(
+            success=False,
+            message=f"한 회차에서 최대 {e.limit}석까지 선택할 수 있습니다.",
+            locked_seats=[]
         )
     except Exception as e:
-        # 오류 발생 시 모든 LOCK 해제
-        for locked in locked_tickets:
-            redis_service.unlock_seat(locked["ticket_id"])
         return SeatLockResponse(
             success=False,
             message=f"좌석 잠금 중 오류가 발생했습니다: {str(e)}",
             locked_seats=[]
         )
+    
+    return SeatLockResponse(
+        success=True,
+        message=f"{len(hold.seats)}개의 좌석이 잠금되었습니다.",
+        locked_seats=hold.seats,
+        hold_id=hold.hold_id,
+        expires_at=_format_timestamp(hold.expires_at)
+    )
+
+
+@router.get("/seats/lock", response_model=List[SeatHoldResponse])
+def list_seat_holds(
+    current_user: User = Depends(get_current_user)
+):
+    """현재 사용자의 유효한 좌석 홀드 목록"""
+    return [_to_hold_response(hold) for hold in seat_hold_service.list_holds(current_user.id)]
+
+
+@router.post("/seats/lock/{hold_id}/heartbeat", response_model=SeatHoldResponse)
+def renew_seat_hold(
+    hold_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    좌석 홀드 연장 (예매 정보 입력 중 주기적으로 호출)
+    SEAT_LOCK_TIMEOUT만큼 연장하되 홀드 생성 후 SEAT_HOLD_MAX_LIFETIME을 넘기지 않음
+    """
+    hold = seat_hold_service.renew(current_user.id, hold_id)
+    if hold is None:
+        raise HTTPException(status_code=404, detail="좌석 홀드가 만료되었습니다. 좌석을 다시 선택해주세요.")
+    return _to_hold_response(hold)
+
+
+@router.delete("/seats/lock", response_model=SeatReleaseResponse)
+def release_seat_holds(
+    hold_id: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """좌석 홀드 해제 (hold_id가 없으면 현재 사용자의 모든 홀드)"""
+    return SeatReleaseResponse(released_seats=seat_hold_service.release(current_user.id, hold_id))
+
+
+def _find_ticket_id(db: Session, event_id: int, schedule_id: Optional[int], row: str, number: int) -> int:
+    """좌석 LOCK에 사용할 티켓 ID (티켓 행이 없으면 모든 워커에서 같은 임시 ID)"""
+    ticket_query = db.query(Ticket.id).filter(
+        Ticket.event_id == event_id,
+        Ticket.seat_row == row,
+        Ticket.seat_number == number
+    )
+    if schedule_id:
+        ticket_query = ticket_query.filter(Ticket.schedule_id == schedule_id)
+    ticket_id = ticket_query.scalar()
+    if ticket_id is not None:
+        return ticket_id
+    return temporary_ticket_id(event_id, schedule_id, row, number)
+
+
+def _format_timestamp(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _to_hold_response(hold: SeatHold) -> SeatHoldResponse:
+    return SeatHoldResponse(
+        hold_id=hold.hold_id,
+        event_id=hold.event_id,
+        schedule_id=hold.schedule_id,
+        seats=hold.seats,
+        expires_at=_format_timestamp(hold.expires_at),
+        max_expires_at=_format_timestamp(hold.max_expires_at)
+    )
 
 
 @router.post("/bookings", response_model=List[BookingResponse])
@@ -459,9 +547,9 @@ def create_bookings(
     """
     선택한 좌석에 대해 티켓을 생성하고 booking을 생성
     고트래픽 환경을 위한 다층 방어 전략:
-    1. Redis 분산 LOCK (빠른 차단)
-    2. DB 레벨 LOCK (최종 보장)
-    3. 트랜잭션으로 원자성 보장
+    1. Redis 분산 LOCK (빠른 차단, 펜싱 토큰 발급)
+    2. 펜싱 토큰 조건부 UPDATE + 좌석 유니크 인덱스 (LOCK 만료 후 늦은 쓰기까지 차단하는 최종 보장)
+    3. 트랜잭션으로 원자성 보장 (커밋 후 처리는 같은 트랜잭션의 아웃박스 이벤트로 전달)
     """
     from app.api.v1.endpoints.queue import validate_queue_token
 
@@ -501,74 +589,58 @@ def create_bookings(
     
     created_bookings = []
     locked_tickets = []  # LOCK 획득한 티켓 ID 추적
+    fence_tokens = []  # 좌석별 LOCK 펜싱 토큰 (locked_tickets와 같은 순서)
+    # 홀드로 잡은 좌석은 같은 값으로 이어받아 홀드 연장/해제 대상에 그대로 남김
+    lock_value = f"{current_user.id}:{request.hold_id or uuid.uuid4().hex}"
     
     try:
         # 1단계: 모든 좌석에 대해 Redis LOCK 시도
         for seat_info in request.seats:
-            # 티켓이 이미 존재하는지 확인 (row, number, event_id, schedule_id로)
-            ticket_query = db.query(Ticket).filter(
-                Ticket.event_id == request.event_id,
-                Ticket.seat_row == seat_info.row,
-                Ticket.seat_number == seat_info.number
-            )
-            if request.schedule_id:
-                ticket_query = ticket_query.filter(Ticket.schedule_id == request.schedule_id)
-            existing_ticket = ticket_query.first()
+            # 티켓 ID (티켓이 없으면 임시 ID, 실제 티켓은 2단계에서 생성)
+            ticket_id = _find_ticket_id(db, request.event_id, request.schedule_id, seat_info.row, seat_info.number)
             
-            # 티켓이 없으면 임시 ID 생성 (나중에 실제 생성)
-            # 일관성을 위해 문자열을 정규화하고 절대값 사용
-            if existing_ticket:
-                ticket_id = existing_ticket.id
-            else:
-                # 임시 ID: 일관성을 위해 정규화된 문자열 사용
-                seat_key = f"{request.event_id}:{request.schedule_id or 0}:{seat_info.row}:{seat_info.number}"
-                # Python hash는 실행마다 다를 수 있으므로 절대값 사용
-                ticket_id = -abs(hash(seat_key)) % 1000000
-            
-            # Redis LOCK 시도
-            # 먼저 기존 LOCK을 확인
-            lock_user_id = redis_service.get_lock_user_id(ticket_id)
-            
-            if lock_user_id is not None:
-                if lock_user_id == current_user.id:
-                    # 같은 사용자가 이미 LOCK을 가지고 있으면 재사용
-                    lock_acquired = True
-                else:
-                    # 다른 사용자가 LOCK을 가지고 있음
-                    # 타임아웃 대기 없이 바로 실패 처리
-                    lock_acquired = False
-            else:
-                # LOCK이 없으면 새로 획득 시도
-                lock_acquired = redis_service.try_lock_seat(ticket_id, user_id=current_user.id)
+            # Redis LOCK 시도 (같은 사용자의 LOCK은 재사용, 회차별 1인 최대 좌석 수 확인)
+            lock_result = redis_service.hold_seat(
+                ticket_id, lock_value, current_user.id, event_id=request.event_id, schedule_id=request.schedule_id
+            )
             
-            if not lock_acquired:
+            if lock_result <= 0:
                 # LOCK 실패 시 이미 LOCK한 것들 해제
-                for locked_id in locked_tickets:
-                    redis_service.unlock_seat(locked_id)
+                redis_service.release_seat_holds(
+                    locked_tickets, lock_value, current_user.id, request.event_id, request.schedule_id
+                )
+                if lock_result == HOLD_LIMIT_EXCEEDED:
+                    raise HTTPException(
+                        status_code=409,
+                        detail=f"한 회차에서 최대 {settings.SEAT_HOLD_MAX_PER_USER}석까지 예매할 수 있습니다."
+                    )
                 raise HTTPException(
                     status_code=409,
                     detail=f"좌석 {seat_info.row}-{seat_info.number}번이 다른 사용자에 의해 처리 중입니다. 다시 시도하시거나 다른 좌석을 선택해주세요."
                 )
             
             locked_tickets.append(ticket_id)
+            fence_tokens.append(lock_result)
         
-        # 2단계: DB 트랜잭션 내에서 실제 예약 처리
-        # 모든 좌석에 LOCK을 획득했으므로 이제 안전하게 처리 가능
-        for seat_info in request.seats:
-            # DB 레벨 LOCK으로 좌석 조회 (SELECT FOR UPDATE)
-            ticket_query = db.query(Ticket).filter(
-                Ticket.event_id == request.event_id,
-                Ticket.seat_row == seat_info.row,
-                Ticket.seat_number == seat_info.number
-            )
-            if request.schedule_id:
-                ticket_query = ticket_query.filter(Ticket.schedule_id == request.schedule_id)
-            
-            # SELECT FOR UPDATE로 LOCK 획득
-            ticket = ticket_query.with_for_update().first()
-            
-            # 티켓이 없으면 생성
-            if not ticket:
+        # 2단계: DB 트랜잭션 내에서 실제 예약 처리 (펜싱 토큰 조건부 쓰기, SELECT FOR UPDATE 없음)
+        # - 기존 티켓: lock_version < 내 토큰일 때만 갱신. 처리가 지연되어 LOCK이 만료되고 다른 사용자가
+        #   더 큰 토큰을 받았다면 0건 → 거부. UPDATE가 행 LOCK을 잡으므로 같은 좌석의 다른 쓰기는
+        #   커밋까지 대기한 뒤 다시 평가되어 아래 기존 예매 확인에서 걸러짐
+        # - 새 티켓: 좌석 유니크 인덱스로 중복 생성 차단 (IntegrityError → 409)
+        for seat_info, ticket_id, fence_token in zip(request.seats, locked_tickets, fence_tokens):
+            if ticket_id > 0:
+                fenced = db.execute(
+                    update(Ticket)
+                    .where(Ticket.id == ticket_id, Ticket.lock_version < fence_token)
+                    .values(lock_version=fence_token)
+                )
+                if fenced.rowcount == 0:
+                    raise HTTPException(
+                        status_code=409,
+                        detail=f"좌석 {seat_info.row}-{seat_info.number}번의 잠금 시간이 만료되었습니다. 좌석을 다시 선택해주세요."
+                    )
+            else:
+                # 티켓이 없으면 생성 (임시 ID로 LOCK을 잡은 좌석)
                 # TicketGrade enum 변환
                 try:
                     grade_enum = TicketGrade(seat_info.grade)
@@ -585,14 +657,16 @@ def create_bookings(
                     seat_row=seat_info.row,
                     seat_number=seat_info.number,
                     grade=grade_enum,
-                    price=seat_info.price
+                    price=seat_info.price,
+                    lock_version=fence_token
                 )
                 db.add(ticket)
                 db.flush()  # ID를 얻기 위해 flush
+                ticket_id = ticket.id
             
             # 이미 예약된 티켓인지 확인 (schedule_id 필터링)
             booking_query = db.query(Booking).filter(
-                Booking.ticket_id == ticket.id,
+                Booking.ticket_id == ticket_id,
                 Booking.status.in_([BookingStatus.CONFIRMED, BookingStatus.PENDING])
             )
             if request.schedule_id:
@@ -603,8 +677,9 @@ def create_bookings(
             
             if existing_booking:
                 # LOCK 해제
-                for locked_id in locked_tickets:
-                    redis_service.unlock_seat(locked_id)
+                redis_service.release_seat_holds(
+                    locked_tickets, lock_value, current_user.id, request.event_id, request.schedule_id
+                )
                 raise HTTPException(
                     status_code=400,
                     detail=f"Seat {seat_info.row}-{seat_info.number} is already booked"
@@ -613,7 +688,7 @@ def create_bookings(
             # Booking 생성
             booking = Booking(
                 user_id=current_user.id,
-                ticket_id=ticket.id,
+                ticket_id=ticket_id,
                 schedule_id=request.schedule_id,
                 status=BookingStatus.PENDING,
                 total_price=seat_info.price,
@@ -623,13 +698,31 @@ def create_bookings(
             db.add(booking)
             created_bookings.append(booking)
         
+        # 한 요청의 booking들을 같은 예약번호로 묶음 (첫 booking ID 기준)
+        db.flush()
+        reservation_number = format_reservation_number(created_bookings[0].id)
+        for booking in created_bookings:
+            booking.reservation_number = reservation_number
+        
+        # 커밋 후 처리(좌석 캐시 무효화, 좌석 배치도 세대 증가, LOCK/홀드 해제, 통계)는
+        # 같은 트랜잭션의 아웃박스 이벤트로 남겨 소비자가 처리 (요청 응답 시간에서 제외, 커밋 직후 장애에도 유실 없음)
+        # 아웃박스가 꺼져 있으면 커밋 직후 요청 안에서 바로 처리
+        add_booking_event(db, BOOKING_CREATED, request.event_id, request.schedule_id, {
+            "user_id": current_user.id,
+            "lock_value": lock_value,
+            "hold_id": request.hold_id,
+            "locked_ticket_ids": locked_tickets,
+            "ticket_ids": [booking.ticket_id for booking in created_bookings],
+            "booking_ids": [booking.id for booking in created_bookings],
+            "reservation_number": reservation_number,
+            "total_price": sum(booking.total_price for booking in created_bookings),
+        })
+        
         # 3단계: 트랜잭션 커밋
         db.commit()
-        
-        # 4단계: 성공 후 캐시 무효화 및 LOCK 해제
-        redis_service.invalidate_seat_cache(request.event_id, request.schedule_id)
-        for locked_id in locked_tickets:
-            redis_service.unlock_seat(locked_id)
+        # 복제 지연 동안 본인 예매 내역/좌석 배치도는 primary에서 읽도록 고정
+        replica_router.mark_write(user_write_scope(current_user.email), event_write_scope(request.event_id))
+        dispatch_inline_events(db)
         
         # 생성된 booking들을 응답 형식으로 변환
         result = []
@@ -651,9 +744,20 @@ def create_bookings(
         # HTTPException은 비즈니스 로직 예외이므로 rollback은 FastAPI의 의존성 주입 시스템이 자동으로 처리
         # 여기서는 LOCK만 해제하고 예외를 전파
         # LOCK 해제
-        for locked_id in locked_tickets:
-            redis_service.unlock_seat(locked_id)
+        redis_service.release_seat_holds(
+            locked_tickets, lock_value, current_user.id, request.event_id, request.schedule_id
+        )
         raise
+    except IntegrityError:
+        # 같은 좌석 티켓을 다른 요청이 먼저 생성함 (좌석 유니크 인덱스)
+        db.rollback()
+        redis_service.release_seat_holds(
+            locked_tickets, lock_value, current_user.id, request.event_id, request.schedule_id
+        )
+        raise HTTPException(
+            status_code=409,
+            detail="다른 사용자가 먼저 예매한 좌석이 있습니다. 좌석을 다시 선택해주세요."
+        )
     except Exception as e:
         # 일반 예외는 DB 오류일 수 있으므로 rollback 시도
         try:
@@ -662,8 +766,9 @@ def create_bookings(
             # rollback이 이미 진행되었거나 필요 없는 경우 무시
             pass
         # LOCK 해제
-        for locked_id in locked_tickets:
-            redis_service.unlock_seat(locked_id)
+        redis_service.release_seat_holds(
+            locked_tickets, lock_value, current_user.id, request.event_id, request.schedule_id
+        )
         raise HTTPException(status_code=500, detail=f"Booking failed: {str(e)}")
 
 
@@ -689,89 +794,118 @@ class UserBookingResponse(BaseModel):
         from_attributes = True
 
 
+MY_BOOKINGS_SORT = "-booked_at"
+
+
 @router.get("/bookings/my", response_model=List[UserBookingResponse])
 def get_my_bookings(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    reservation_number: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """현재 사용자의 예매 내역 조회"""
-    # 사용자의 모든 예매 조회
-    bookings = db.query(Booking).filter(
-        Booking.user_id == current_user.id
-    ).options(
-        joinedload(Booking.ticket).joinedload(Ticket.event).joinedload(Event.schedules),
-        joinedload(Booking.ticket).joinedload(Ticket.event).joinedload(Event.venue)
-    ).order_by(Booking.booked_at.desc()).all()
-    
-    # 같은 시간(초 단위까지)에 예매한 booking들을 그룹화
-    from datetime import datetime
-    booking_groups = {}
-    
-    for booking in bookings:
-        if not booking.ticket or not booking.ticket.event:
-            continue
-        
-        # booked_at을 초 단위로 반올림하여 그룹화 키 생성
-        if booking.booked_at:
-            # 초 단위로 반올림 (같은 초에 예매한 것들을 같은 그룹으로)
-            booked_at_rounded = booking.booked_at.replace(microsecond=0)
-            group_key = f"{booking.user_id}_{booking.ticket.event_id}_{booked_at_rounded.isoformat()}"
-        else:
-            # booked_at이 없으면 booking_id를 키로 사용
-            group_key = f"{booking.user_id}_{booking.id}"
-        
-        if group_key not in booking_groups:
-            booking_groups[group_key] = []
-        booking_groups[group_key].append(booking)
-    
-    result = []
-    # 각 그룹에 대해 예약번호 생성 (그룹의 첫 번째 booking ID 사용)
-    for group_key, group_bookings in booking_groups.items():
-        # 그룹의 첫 번째 booking ID를 기준으로 예약번호 생성
-        first_booking = group_bookings[0]
-        reservation_number = f"M{first_booking.id:09d}"
-        
-        for booking in group_bookings:
-            if not booking.ticket or not booking.ticket.event:
-                continue
-                
-            event = booking.ticket.event
-            ticket = booking.ticket
-            
-            # 스케줄 정보 가져오기 (첫 번째 스케줄 사용)
-            schedule = None
-            if event.schedules and len(event.schedules) > 0:
-                schedule = event.schedules[0]
-            
-            schedule_date = None
-            schedule_time = None
-            if schedule:
-                schedule_date = schedule.start_datetime.strftime("%Y.%m.%d") if schedule.start_datetime else None
-                schedule_time = schedule.start_datetime.strftime("%H:%M") if schedule.start_datetime else None
-            
-            # venue 이름 가져오기
-            venue_name = event.location
-            if event.venue and event.venue.name:
-                venue_name = event.venue.name
-            
-            result.append(UserBookingResponse(
-                id=ticket.id if ticket.id else 0,
-                booking_id=booking.id,
-                event_id=event.id,
-                event_title=event.title,
-                event_poster_image=event.poster_image,
-                venue_name=venue_name,
-                schedule_date=schedule_date,
-                schedule_time=schedule_time,
-                seat_row=ticket.seat_row,
-                seat_number=ticket.seat_number,
-                grade=ticket.grade.value if ticket.grade else "A",
-                price=booking.total_price,
-                status=booking.status.value,
-                booked_at=booking.booked_at.isoformat() if booking.booked_at else "",
-                reservation_number=reservation_number,
-                quantity=1
-            ))
-    
-    return result
+    """현재 사용자의 예매 내역 조회 (예약번호 단위 커서 페이지네이션)
 
+    limit은 예약(예약번호 그룹) 개수이며 한 예약의 좌석들은 같은 페이지에 함께 반환됩니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환하고,
+    첫 페이지에는 전체 예약 수를 X-Total-Count 헤더로 반환합니다.
+    reservation_number를 지정하면 해당 예약만 조회합니다.
+    """
+    # 1단계: 예약번호별 그룹을 SQL에서 집계하고 (최근 예매 시각, 첫 booking ID) 기준으로 페이지 조회
+    booked_at = func.max(Booking.booked_at).label("booked_at")
+    first_id = func.min(Booking.id).label("first_id")
+    group_query = (
+        db.query(Booking.reservation_number, booked_at, first_id)
+        .filter(Booking.user_id == current_user.id)
+        .group_by(Booking.reservation_number)
+    )
+    if reservation_number:
+        group_query = group_query.filter(Booking.reservation_number == reservation_number)
+    if cursor:
+        last_booked_at, last_id = decode_cursor(cursor, MY_BOOKINGS_SORT)
+        group_query = group_query.having(or_(
+            booked_at < last_booked_at,
+            and_(booked_at == last_booked_at, first_id < last_id),
+        ))
+    groups = group_query.order_by(booked_at.desc(), first_id.desc()).limit(limit + 1).all()
+
+    if len(groups) > limit:
+        groups = groups[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            MY_BOOKINGS_SORT, groups[-1].booked_at, groups[-1].first_id
+        )
+    if not cursor:
+        total = db.query(func.count(func.distinct(Booking.reservation_number))).filter(
+            Booking.user_id == current_user.id
+        )
+        if reservation_number:
+            total = total.filter(Booking.reservation_number == reservation_number)
+        response.headers["X-Total-Count"] = str(total.scalar())
+    if not groups:
+        return []
+
+    # 2단계: 페이지에 포함된 예약의 좌석만 필요한 컬럼으로 조회
+    # 회차는 예매한 회차, 없으면 이벤트의 첫 회차 시작 시각
+    booked_schedule = aliased(EventSchedule)
+    first_schedule_start = (
+        select(func.min(EventSchedule.start_datetime))
+        .where(EventSchedule.event_id == Event.id)
+        .correlate(Event)
+        .scalar_subquery()
+    )
+    rows = (
+        db.query(
+            Booking.id.label("booking_id"),
+            Booking.total_price,
+            Booking.status,
+            Booking.booked_at,
+            Booking.reservation_number,
+            Ticket.id.label("ticket_id"),
+            Ticket.seat_row,
+            Ticket.seat_number,
+            Ticket.grade,
+            Event.id.label("event_id"),
+            Event.title,
+            Event.poster_image,
+            Event.location,
+            Venue.name.label("venue_name"),
+            func.coalesce(booked_schedule.start_datetime, first_schedule_start).label("start_datetime"),
+        )
+        .join(Ticket, Booking.ticket_id == Ticket.id)
+        .join(Event, Ticket.event_id == Event.id)
+        .outerjoin(Venue, Event.venue_id == Venue.id)
+        .outerjoin(booked_schedule, Booking.schedule_id == booked_schedule.id)
+        .filter(
+            Booking.user_id == current_user.id,
+            Booking.reservation_number.in_([group.reservation_number for group in groups]),
+        )
+        .order_by(Booking.id)
+        .all()
+    )
+
+    group_order = {group.reservation_number: index for index, group in enumerate(groups)}
+    rows.sort(key=lambda row: group_order[row.reservation_number])
+
+    return [
+        UserBookingResponse(
+            id=row.ticket_id,
+            booking_id=row.booking_id,
+            event_id=row.event_id,
+            event_title=row.title,
+            event_poster_image=row.poster_image,
+            venue_name=row.venue_name or row.location,
+            schedule_date=row.start_datetime.strftime("%Y.%m.%d") if row.start_datetime else None,
+            schedule_time=row.start_datetime.strftime("%H:%M") if row.start_datetime else None,
+            seat_row=row.seat_row,
+            seat_number=row.seat_number,
+            grade=row.grade.value if row.grade else "A",
+            price=row.total_price,
+            status=row.status.value,
+            booked_at=row.booked_at.isoformat() if row.booked_at else "",
+            reservation_number=row.reservation_number,
+            quantity=1
+        )
+        for row in rows
+    ]
@@ -4,6 +4,17 @@ from pydantic import ConfigDict
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # DB 커넥션 풀 설정 (동기/비동기 엔진 공통, 워커당)
+    DB_POOL_MODE: str = "queue"      # queue: 앱 측 QueuePool / null: PgBouncer(트랜잭션 풀링) 사용 시 앱 측 풀 미사용
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 3.0     # 커넥션 대기 최대 시간 (초), 초과 시 503으로 즉시 실패
+    DB_POOL_RECYCLE: int = 1800      # 커넥션 재사용 최대 시간 (초)
+    DB_POOL_PRE_PING: bool = True    # 체크아웃 시 커넥션 유효성 확인
+    # 읽기 복제본 설정 (쉼표로 구분한 URL 목록, 비우면 모든 읽기를 primary에서 처리)
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_RETRY_INTERVAL: int = 10    # 연결 실패한 복제본을 제외하는 시간 (초)
+    READ_YOUR_WRITES_TTL: int = 5       # 쓰기 후 해당 사용자/이벤트 읽기를 primary로 고정하는 시간 (초)
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -14,15 +25,68 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str | None = None
-    # 좌석 LOCK 타임아웃 (초) - 예매 정보 입력 시간을 고려하여 2분으로 증가
-    SEAT_LOCK_TIMEOUT: int = 120
+    # Redis Cluster 노드 목록 (쉼표로 구분한 host:port, 설정하면 Cluster 클라이언트 + 해시 태그 키 사용)
+    REDIS_CLUSTER_NODES: str = ""
+    # 이벤트 해시 태그 키 사용 여부 (False면 기존 키 형식을 유지하는 호환 모드)
+    REDIS_KEY_HASH_TAGS: bool = False
+    # client-side caching(RESP3 CLIENT TRACKING) 워커별 최대 항목 수 (0이면 비활성화, Redis 6 이상 필요)
+    REDIS_NEAR_CACHE_SIZE: int = 1000
+    # 좌석 LOCK 타임아웃 (초) - 홀드는 하트비트마다 이 시간만큼 연장되므로 짧게 유지 (이탈 시 빠르게 반환)
+    SEAT_LOCK_TIMEOUT: int = 60
+    # 좌석 홀드 최대 유지 시간 (초) - 하트비트로 연장해도 생성 후 이 시간을 넘길 수 없음
+    SEAT_HOLD_MAX_LIFETIME: int = 600
+    # 회차별 1인 최대 보유 좌석 수 (좌석 LOCK 스크립트에서 원자적으로 확인, 0이면 제한 없음)
+    SEAT_HOLD_MAX_PER_USER: int = 8
     # 대기열 배치 처리 설정
     QUEUE_BATCH_SIZE: int = 50       # 배치당 통과 인원
     QUEUE_BATCH_INTERVAL: int = 10   # 배치 간격 (초)
     QUEUE_TOKEN_TTL: int = 600       # 토큰 유효기간 (초, 10분)
+    # 결제 대기(PENDING) 예매 만료 처리 (여러 노드에서 켜도 Redis 리스로 한 노드만 실행)
+    # 주의: 아직 PENDING → CONFIRMED 전환(결제 확정) 경로가 없어 모든 예매가 PENDING으로 남음
+    #       켜면 완료된 예매까지 만료 취소되므로, 결제 확정 경로가 생기기 전까지는 반드시 끈 상태로 유지
+    BOOKING_REAPER_ENABLED: bool = False
+    PENDING_BOOKING_TTL: int = 900           # 결제 대기 예매 유지 시간 (초, 15분)
+    BOOKING_REAPER_INTERVAL: int = 30        # 만료 처리 주기 (초)
+    BOOKING_REAPER_BATCH_SIZE: int = 200     # 배치당 취소 건수
+    # 예매 이벤트 아웃박스 릴레이/소비자 (예매 후 캐시 무효화, LOCK 해제, 통계는 소비자가 처리하므로 기본 활성화)
+    # 끄면 아웃박스를 쓰지 않고 커밋 직후 요청 안에서 캐시 무효화/LOCK 해제를 바로 처리 (예매 통계는 집계하지 않음)
+    BOOKING_OUTBOX_ENABLED: bool = True
+    BOOKING_OUTBOX_RELAY_INTERVAL: float = 0.2  # 릴레이 주기 (초)
+    BOOKING_OUTBOX_LEASE_TTL: int = 5           # 릴레이 리스 유지 시간 (초, 갱신이 없으면 다른 노드가 넘겨받음)
+    BOOKING_OUTBOX_BATCH_SIZE: int = 200        # 릴레이 XADD/소비자 읽기 배치 크기
+    BOOKING_OUTBOX_RETENTION: int = 86400       # 전달 완료 행 보관 시간 (초)
+    BOOKING_STREAM_MAXLEN: int = 100000         # 예매 이벤트 Stream 최대 길이 (근사)
+    BOOKING_CONSUMER_BLOCK_MS: int = 1000       # 소비자 새 메시지 대기 시간 (밀리초)
+    BOOKING_CONSUMER_CLAIM_IDLE_MS: int = 30000 # 처리 중 멈춘 메시지를 다른 소비자가 회수하기까지 시간 (밀리초)
+    BOOKING_CONSUMER_MAX_DELIVERIES: int = 5    # 처리 실패 메시지 최대 전달 횟수 (넘으면 dead-letter Stream으로 이동 후 확인)
+    # 캐시 설정
+    EVENT_LIST_CACHE_TTL: int = 300  # 이벤트 목록 캐시 신선 유지 시간 (초)
+    CACHE_STALE_TTL: int = 60        # 만료 후 이전 값을 제공하는 시간 (초, stale-while-revalidate)
+    CACHE_EARLY_REFRESH_BETA: float = 1.0  # 확률적 조기 갱신 강도 (0이면 비활성화)
+    BANNER_CACHE_TTL: int = 3600     # 배너 피드 최대 캐시 시간 (초, 노출 경계가 더 가까우면 경계에서 만료)
+    BANNER_LOCAL_CACHE_TTL: int = 10 # 배너 피드 워커 메모리 캐시 시간 (초)
+    SEAT_MAP_CACHE_TTL: int = 60     # 좌석 배치도 캐시 시간 (초, 예매 시 즉시 무효화)
     # OpenAI 설정 (선택적)
     OPENAI_API_KEY: str | None = None
     OPENAI_MODEL: str | None = None
+    OPENAI_BASE_URL: str | None = None  # 호환 API 서버/테스트 스텁 주소 (없으면 기본값)
+    # LLM 호출 제한 설정
+    LLM_TIMEOUT: float = 8.0            # 호출별 응답 대기 시간 (초, 초과 시 로컬 검색으로 폴백)
+    LLM_MAX_CONCURRENCY: int = 16       # 워커당 동시 LLM 호출 수
+    LLM_QUEUE_TIMEOUT: float = 1.0      # 동시 호출 슬롯 대기 시간 (초)
+    LLM_BREAKER_THRESHOLD: int = 5      # 연속 실패 시 서킷 오픈 기준
+    LLM_BREAKER_RESET_TIMEOUT: int = 30 # 서킷 오픈 유지 시간 (초)
+    # AI 검색에서 LLM에 전달할 후보 이벤트 수 (검색 인덱스 관련도 상위 N개)
+    AI_SEARCH_CANDIDATE_LIMIT: int = 10
+    # 로컬 분류기 결과를 그대로 사용할 최소 신뢰도 (미만이면 LLM 호출)
+    LOCAL_CLASSIFIER_THRESHOLD: float = 0.8
+    # AI 검색을 단일 LLM 호출 파이프라인으로 처리 (False면 키워드 추출 + 선택 2회 호출)
+    AI_SEARCH_FUSED: bool = True
+    # AI 결과 캐시 설정
+    AI_KEYWORD_CACHE_TTL: int = 3600  # 키워드 추출/의도 분류 캐시 시간 (초)
+    AI_SEARCH_CACHE_TTL: int = 600    # 최종 검색 결과 캐시 시간 (초, 이벤트 변경 시 즉시 무효화)
+    AI_LOCAL_CACHE_SIZE: int = 1024   # 워커별 로컬 캐시 최대 항목 수
+    AI_LOCAL_CACHE_TTL: int = 60      # 워커별 로컬 캐시 최대 유지 시간 (초)
     
     model_config = ConfigDict(
         env_file=".env",
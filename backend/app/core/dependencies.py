@@ -1,16 +1,15 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, get_async_db, get_async_read_db
 from app.models.user import User
 from app.core.security import verify_token
 
 security = HTTPBearer()
 
-def get_current_user(
-  credentials: HTTPAuthorizationCredentials = Depends(security),
-  db: Session = Depends(get_db)
-) -> User:
+def _email_from_credentials(credentials: HTTPAuthorizationCredentials) -> str:
   token = credentials.credentials
   payload = verify_token(token)
 
@@ -27,8 +26,9 @@ def get_current_user(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials"
     )
-    
-  user = db.query(User).filter(User.email == email).first()
+  return email
+
+def _ensure_active_user(user: User | None) -> User:
   if user is None:
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
@@ -43,6 +43,33 @@ def get_current_user(
   
   return user
 
+def get_current_user(
+  credentials: HTTPAuthorizationCredentials = Depends(security),
+  db: Session = Depends(get_db)
+) -> User:
+  email = _email_from_credentials(credentials)
+  user = db.query(User).filter(User.email == email).first()
+  return _ensure_active_user(user)
+
+async def get_current_user_async(
+  credentials: HTTPAuthorizationCredentials = Depends(security),
+  db: AsyncSession = Depends(get_async_db)
+) -> User:
+  """get_current_user의 비동기 버전 (스레드풀을 거치지 않는 엔드포인트용)"""
+  email = _email_from_credentials(credentials)
+  result = await db.execute(select(User).where(User.email == email))
+  return _ensure_active_user(result.scalars().first())
+
+async def get_current_user_async_read(
+  credentials: HTTPAuthorizationCredentials = Depends(security),
+  db: AsyncSession = Depends(get_async_read_db)
+) -> User:
+  """get_current_user_async의 읽기 전용 버전
+  엔드포인트와 같은 get_async_read_db 세션으로 사용자를 조회 (요청당 세션 하나)"""
+  email = _email_from_credentials(credentials)
+  result = await db.execute(select(User).where(User.email == email))
+  return _ensure_active_user(result.scalars().first())
+
 def get_current_admin(
     current_user: User = Depends(get_current_user)
 ) -> User:
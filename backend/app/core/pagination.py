@@ -0,0 +1,113 @@
+"""
+커서(keyset) 기반 페이지네이션
+OFFSET 대신 마지막으로 본 (정렬 키, id) 이후의 행을 조회하므로 페이지 깊이와 무관하게 비용이 일정합니다.
+커서는 정렬 이름과 마지막 행의 값을 담은 불투명(opaque) 문자열입니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(sort: str, value: Any, row_id: int) -> str:
+    """커서 생성 (정렬 이름, 정렬 키 값, id)"""
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    payload = json.dumps([sort, value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """
+    커서 해석
+
+    Raises:
+        HTTPException: 형식이 잘못되었거나 다른 정렬에서 발급된 커서인 경우 (400)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["dt"])
+        row_id = int(row_id)
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if cursor_sort != sort:
+        raise HTTPException(status_code=400, detail="Cursor does not match sort order")
+    return value, row_id
+
+
+def keyset_paginate(
+    query: Query,
+    sort: str,
+    sort_column,
+    id_column,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = False,
+    offset: int = 0,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    (sort_column, id) 기준 keyset 페이지 조회
+
+    NULL 정렬 키는 방향과 관계없이 항상 마지막에 위치합니다.
+    정렬 키가 있는 구간은 (sort_column, id) 행 값 비교 + 같은 방향의 ORDER BY로 조회해
+    오름차순 (정렬 키, id) 인덱스를 그대로(내림차순은 역방향으로) 탐색하고,
+    그 구간이 끝나면 정렬 키가 NULL인 행을 id 순으로 이어서 조회합니다.
+
+    Args:
+        query: 필터가 적용된 쿼리
+        sort: 정렬 이름 (커서 검증용, 예: "created_at", "-sales_open_date")
+        sort_column: 정렬 컬럼
+        id_column: 동순위 정렬용 고유 컬럼
+        cursor: 이전 페이지에서 받은 커서 (None이면 첫 페이지)
+        limit: 페이지 크기
+        descending: 내림차순 여부
+        offset: 하위 호환용 OFFSET (커서를 사용하지 않는 기존 클라이언트용)
+
+    Returns:
+        (행 목록, 다음 페이지 커서 또는 None)
+    """
+    if offset and not cursor:
+        # 하위 호환 OFFSET 조회 (keyset 아님)
+        order = sort_column.desc() if descending else sort_column.asc()
+        rows = (
+            query.order_by(order.nulls_last(), id_column.desc() if descending else id_column.asc())
+            .offset(offset).limit(limit + 1).all()
+        )
+        return _page(rows, sort, sort_column, id_column, limit)
+
+    value, last_id = decode_cursor(cursor, sort) if cursor else (None, None)
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    rows = []
+    if not cursor or value is not None:
+        valued = query.filter(sort_column.isnot(None))
+        if cursor:
+            position = tuple_(sort_column, id_column)
+            valued = valued.filter(position < tuple_(value, last_id) if descending else position > tuple_(value, last_id))
+        if descending:
+            valued = valued.order_by(sort_column.desc(), id_column.desc())
+        else:
+            valued = valued.order_by(sort_column.asc(), id_column.asc())
+        rows = valued.limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        # 정렬 키가 NULL인 구간: id로만 진행
+        nulls = query.filter(sort_column.is_(None))
+        if cursor and value is None:
+            nulls = nulls.filter(id_column < last_id if descending else id_column > last_id)
+        nulls = nulls.order_by(id_column.desc() if descending else id_column.asc())
+        rows += nulls.limit(limit + 1 - len(rows)).all()
+    return _page(rows, sort, sort_column, id_column, limit)
+
+
+def _page(rows: List[Any], sort: str, sort_column, id_column, limit: int) -> Tuple[List[Any], Optional[str]]:
+    """limit + 1개 조회 결과를 페이지와 다음 커서로 분리"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(sort, getattr(last, sort_column.key), getattr(last, id_column.key))
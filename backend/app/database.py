@@ -1,12 +1,81 @@
+import asyncio
+import itertools
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from app.core.config import settings
+from app.core.security import verify_token
+from app.services.pool_metrics import pool_metrics
+from app.services.redis_service import redis_service
 
-engine = create_engine(settings.DATABASE_URL)
+
+def _pool_options(url: str, name: str, is_async: bool = False) -> dict:
+  """Settings 기반 커넥션 풀 옵션 (SQLite는 기본 풀 사용)
+
+  - queue: 워커별 QueuePool, DB_POOL_TIMEOUT 안에 커넥션을 못 받으면 TimeoutError(→ 503)
+  - null: PgBouncer 트랜잭션 풀링용, 앱 측 풀 없이 요청마다 연결
+  """
+  if url.startswith("sqlite"):
+    return {}
+  if settings.DB_POOL_MODE == "null":
+    options = dict(poolclass=pool_metrics.pool_class(name, NullPool))
+    if is_async:
+      # 트랜잭션 풀링에서는 서버 커넥션이 바뀌므로 asyncpg prepared statement 캐시를 끔
+      options["connect_args"] = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+      }
+    return options
+  return dict(
+    poolclass=pool_metrics.pool_class(name, AsyncAdaptedQueuePool if is_async else QueuePool),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+  )
+
+
+def _async_database_url(url: str) -> str:
+  """동기 드라이버 URL을 비동기 드라이버 URL로 변환 (postgresql → asyncpg)"""
+  scheme, rest = url.split("://", 1)
+  if scheme.startswith("postgresql"):
+    return f"postgresql+asyncpg://{rest}"
+  if scheme.startswith("sqlite"):
+    return f"sqlite+aiosqlite://{rest}"
+  return url
+
+
+def _create_engines(url: str, name: str):
+  """동기/비동기 엔진 생성 및 풀 지표 등록"""
+  sync_engine = create_engine(url, **_pool_options(url, name))
+  async_engine = create_async_engine(
+    _async_database_url(url), **_pool_options(url, f"{name}_async", is_async=True)
+  )
+  pool_metrics.register(name, sync_engine)
+  pool_metrics.register(f"{name}_async", async_engine.sync_engine)
+  return sync_engine, async_engine
+
+
+# 비동기 엔진/세션: 스레드풀을 거치지 않는 I/O 바운드 엔드포인트용
+engine, async_engine = _create_engines(settings.DATABASE_URL, "primary")
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+AsyncSessionLocal = async_sessionmaker(
+  bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 def get_db():
@@ -15,3 +84,158 @@ def get_db():
     yield db
   finally:
     db.close()
+
+async def get_async_db():
+  async with AsyncSessionLocal() as db:
+    yield db
+
+
+# ============================================================================
+# 읽기 전용 복제본(replica) 라우팅
+# ============================================================================
+# - DATABASE_REPLICA_URLS의 복제본을 라운드 로빈으로 사용
+# - 세션을 넘기기 전에 커넥션을 먼저 확보(pre-ping 포함)하고, 실패한 복제본은
+#   REPLICA_RETRY_INTERVAL 동안 제외 → 남은 복제본이 없으면 primary로 폴백
+# - 쓰기 직후 복제 지연으로 이전 데이터가 보이지 않도록 쓰기 범위(사용자/이벤트/카탈로그)를
+#   Redis에 짧게 표시하고, 해당 범위의 읽기는 READ_YOUR_WRITES_TTL 동안 primary로 보냄
+
+# 모든 읽기에 적용되는 전역 쓰기 범위 (관리자 카탈로그 수정)
+CATALOG_WRITE_SCOPE = "catalog"
+
+
+@dataclass
+class _Replica:
+  url: str
+  session_factory: sessionmaker
+  async_session_factory: async_sessionmaker
+  down_until: float = 0.0
+
+
+class ReplicaRouter:
+  """복제본 라운드 로빈 + 장애 제외 + read-your-writes 고정"""
+
+  def __init__(self, urls: List[str]):
+    self.replicas = []
+    for index, url in enumerate(urls):
+      sync_engine, async_engine = _create_engines(url, f"replica{index}")
+      self.replicas.append(_Replica(
+        url=url,
+        session_factory=sessionmaker(autocommit=False, autoflush=False, bind=sync_engine),
+        async_session_factory=async_sessionmaker(
+          bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        ),
+      ))
+    self._counter = itertools.count()
+    self._lock = threading.Lock()
+
+  @property
+  def enabled(self) -> bool:
+    return bool(self.replicas)
+
+  def mark_write(self, *scopes: str) -> None:
+    """쓰기 발생 표시 (이후 READ_YOUR_WRITES_TTL 동안 해당 범위의 읽기는 primary)"""
+    if not self.enabled or not scopes:
+      return
+    try:
+      pipe = redis_service.client.pipeline(transaction=False)
+      for scope in scopes:
+        pipe.set(f"recent_write:{scope}", 1, ex=settings.READ_YOUR_WRITES_TTL)
+      pipe.execute()
+    except Exception:
+      pass
+
+  def has_recent_write(self, *scopes: str) -> bool:
+    """범위 중 하나라도 최근 쓰기가 있는지 (Redis 장애 시 안전하게 primary 사용)"""
+    try:
+      return redis_service.client.exists(*[f"recent_write:{scope}" for scope in scopes]) > 0
+    except Exception:
+      return True
+
+  def candidates(self) -> List[_Replica]:
+    """현재 사용 가능한 복제본을 라운드 로빈 순서로 반환"""
+    now = time.monotonic()
+    with self._lock:
+      start = next(self._counter)
+    count = len(self.replicas)
+    ordered = [self.replicas[(start + i) % count] for i in range(count)]
+    return [replica for replica in ordered if replica.down_until <= now]
+
+  def mark_down(self, replica: _Replica) -> None:
+    replica.down_until = time.monotonic() + settings.REPLICA_RETRY_INTERVAL
+
+  def open_session(self):
+    """사용 가능한 복제본 세션 (커넥션 확보까지 확인), 모두 실패하면 primary 세션"""
+    for replica in self.candidates():
+      db = replica.session_factory()
+      try:
+        db.connection()
+        return db
+      except OperationalError:
+        db.close()
+        self.mark_down(replica)
+    return SessionLocal()
+
+  async def open_async_session(self) -> AsyncSession:
+    """open_session의 비동기 버전"""
+    for replica in self.candidates():
+      db = replica.async_session_factory()
+      try:
+        await db.connection()
+        return db
+      except (OperationalError, OSError):
+        await db.close()
+        self.mark_down(replica)
+    return AsyncSessionLocal()
+
+
+def _parse_replica_urls(value: Optional[str]) -> List[str]:
+  return [url.strip() for url in (value or "").split(",") if url.strip()]
+
+
+replica_router = ReplicaRouter(_parse_replica_urls(settings.DATABASE_REPLICA_URLS))
+
+
+def user_write_scope(email: str) -> str:
+  return f"user:{email}"
+
+
+def event_write_scope(event_id: int) -> str:
+  return f"event:{event_id}"
+
+
+def _read_scopes(request: Request) -> List[str]:
+  """요청의 read-your-writes 범위: 카탈로그 + 토큰 사용자 + 경로의 event_id"""
+  scopes = [CATALOG_WRITE_SCOPE]
+  authorization = request.headers.get("authorization", "")
+  if authorization.lower().startswith("bearer "):
+    payload = verify_token(authorization[7:])
+    if payload and payload.get("sub"):
+      scopes.append(user_write_scope(payload["sub"]))
+  event_id = request.path_params.get("event_id")
+  if event_id is not None:
+    scopes.append(event_write_scope(event_id))
+  return scopes
+
+
+def _use_primary(request: Request) -> bool:
+  return not replica_router.enabled or replica_router.has_recent_write(*_read_scopes(request))
+
+
+def get_read_db(request: Request):
+  """읽기 전용 엔드포인트용 세션 (복제본 우선, 최근 쓰기가 있으면 primary)"""
+  db = SessionLocal() if _use_primary(request) else replica_router.open_session()
+  try:
+    yield db
+  finally:
+    db.close()
+
+async def get_async_read_db(request: Request):
+  """get_read_db의 비동기 버전 (최근 쓰기 확인은 동기 Redis 호출이므로 스레드풀에서 실행)"""
+  use_primary = not replica_router.enabled or await asyncio.to_thread(
+    replica_router.has_recent_write, *_read_scopes(request)
+  )
+  db = AsyncSessionLocal() if use_primary else await replica_router.open_async_session()
+  try:
+    yield db
+  finally:
+    await db.close()
@@ -1,16 +1,42 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from app.api.v1.router import api_router
 from app.api.admin.router import admin_router
 from app.core.config import settings
 from app.middleware.rate_limit_middleware import RateLimitMiddleware
+from app.services.booking_reaper import booking_reaper
+from app.services.booking_events import outbox_relay, booking_consumers
 import os
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  # 결제 대기 예매 만료 처리기 (설정으로 켠 노드에서만 실행, 결제 확정 경로가 생기기 전까지 기본 꺼짐)
+  tasks = [asyncio.create_task(booking_reaper.run())] if settings.BOOKING_REAPER_ENABLED else []
+  # 예매 이벤트 아웃박스 릴레이(리스로 한 노드만 전달) + 소비자 그룹별 소비자
+  if settings.BOOKING_OUTBOX_ENABLED:
+    tasks.append(asyncio.create_task(outbox_relay.run()))
+    tasks.extend(asyncio.create_task(consumer.run()) for consumer in booking_consumers)
+  yield
+  for task in tasks:
+    task.cancel()
+  for task in tasks:
+    try:
+      await task
+    except asyncio.CancelledError:
+      pass
+
+
 app = FastAPI(
   title="Bookmate API",
   description="티켓팅 플랫폼 API",
-  version="1.0.0"
+  version="1.0.0",
+  lifespan=lifespan
 )
 
 app.add_middleware(
@@ -22,6 +48,7 @@ app.add_middleware(
   allow_credentials=True,
   allow_methods=["*"],
   allow_headers=["*"],
+  expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag"],
 )
 
 # Rate Limiting 미들웨어 추가 (메인 페이지 보호용)
@@ -33,6 +60,18 @@ os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 # 정적 파일 서빙 (업로드된 이미지 접근용)
 app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
+# DB 커넥션 풀 고갈 시 DB 계층에서 대기하지 않고 즉시 503 반환 (클라이언트가 재시도)
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+  return JSONResponse(
+    status_code=503,
+    content={
+      "error": "Service Unavailable",
+      "message": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+    },
+    headers={"Retry-After": "1"}
+  )
+
 app.include_router(api_router, prefix="/api/v1")
 app.include_router(admin_router, prefix="/api/admin")  
 
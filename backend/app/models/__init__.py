@@ -8,3 +8,4 @@ from app.models.event_schedule import EventSchedule
 from app.models.event_seat_grade import EventSeatGrade
 from app.models.event_description_image import EventDescriptionImage
 from app.models.banner import Banner
+from app.models.booking_outbox import BookingOutbox
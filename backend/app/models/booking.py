@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -24,8 +24,23 @@ class Booking(Base):
   transaction_id = Column(String)
   
   booked_at = Column(DateTime(timezone=True), server_default=func.now())
+  # 한 번의 예매 요청으로 생성된 booking 묶음 (그룹 첫 booking ID 기반, 예: M000000123)
+  reservation_number = Column(String(20), nullable=True)
   
   user = relationship("User", backref="bookings")
   ticket = relationship("Ticket", backref="bookings")
   schedule = relationship("EventSchedule", backref="bookings")
+
+  __table_args__ = (
+    # 내 예매 내역: 사용자별 최신순 조회 및 예약번호 그룹 집계
+    Index("ix_bookings_user_id_booked_at_id", "user_id", "booked_at", "id"),
+    Index("ix_bookings_user_id_reservation_number", "user_id", "reservation_number"),
+    # 결제 대기 예매 만료 처리: 상태별 오래된 순 조회
+    Index("ix_bookings_status_booked_at", "status", "booked_at"),
+  )
+
+
+def format_reservation_number(booking_id: int) -> str:
+  """예약번호 형식 (그룹의 첫 booking ID)"""
+  return f"M{booking_id:09d}"
   
\ No newline at end of file
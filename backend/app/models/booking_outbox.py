@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Index, text
+from sqlalchemy.sql import func
+from app.database import Base
+
+class BookingOutbox(Base):
+  """
+  예매 이벤트 아웃박스
+  예매 쓰기와 같은 트랜잭션에서 기록하고, 릴레이가 Redis Stream으로 전달한 뒤 published_at을 채움
+  """
+  __tablename__ = "booking_outbox"
+
+  id = Column(Integer, primary_key=True)
+  event_type = Column(String(50), nullable=False)  # 예: booking.created, booking.expired
+  event_id = Column(Integer, nullable=False)
+  schedule_id = Column(Integer, nullable=True)
+  payload = Column(JSON, nullable=False)
+
+  created_at = Column(DateTime(timezone=True), server_default=func.now())
+  published_at = Column(DateTime(timezone=True), nullable=True)
+
+  __table_args__ = (
+    # 릴레이: 미전달 행을 ID 순으로 조회 (전달된 행은 인덱스에서 빠짐)
+    Index("ix_booking_outbox_unpublished", "id", postgresql_where=text("published_at IS NULL")),
+    # 보관 기간이 지난 전달 완료 행 정리
+    Index("ix_booking_outbox_published_at", "published_at"),
+  )
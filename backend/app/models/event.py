@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -50,3 +50,14 @@ class Event(Base):
   seat_grades = relationship("EventSeatGrade", back_populates="event", cascade="all, delete-orphan")
   description_images = relationship("EventDescriptionImage", back_populates="event", cascade="all, delete-orphan")
   banners = relationship("Banner", back_populates="event", cascade="all, delete-orphan")
+
+  __table_args__ = (
+    # 목록 keyset 페이지네이션용 복합 인덱스 (정렬 키, id)
+    Index("ix_events_created_at_id", "created_at", "id"),
+    Index("ix_events_sales_open_date_id", "sales_open_date", "id"),
+    # 카탈로그 필터 + 기본 정렬(created_at, id)용 복합 인덱스
+    Index("ix_events_genre_created_at_id", "genre", "created_at", "id"),
+    Index("ix_events_sub_genre_created_at_id", "sub_genre", "created_at", "id"),
+    Index("ix_events_is_hot_created_at_id", "is_hot", "created_at", "id"),
+    Index("ix_events_venue_id", "venue_id"),
+  )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -15,3 +15,8 @@ class EventSchedule(Base):
 
     event = relationship("Event", back_populates="schedules")
 
+    __table_args__ = (
+        # 공연 일정 기간 필터 (이벤트별 회차 시작 시각)
+        Index("ix_event_schedules_event_id_start_datetime", "event_id", "start_datetime"),
+    )
+
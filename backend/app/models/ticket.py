@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, Enum, Float
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, String, Enum, Float, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -22,6 +22,20 @@ class Ticket(Base):
 
   grade = Column(Enum(TicketGrade), nullable=False)
   price = Column(Float, nullable=False)
+  # 마지막 예매 쓰기의 좌석 LOCK 펜싱 토큰 (더 큰 토큰으로만 갱신, LOCK 만료 후 늦은 쓰기 차단)
+  lock_version = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+  __table_args__ = (
+    # 좌석당 티켓 하나 (동시 예매가 같은 좌석 티켓을 중복 생성하지 않도록, 회차 없음은 0으로 취급)
+    # 좌석 번호가 없는 티켓은 제외 (NULL 좌석끼리는 같은 좌석이 아님)
+    Index(
+      "uq_tickets_event_schedule_seat",
+      "event_id", text("coalesce(schedule_id, 0)"), "seat_row", "seat_number",
+      unique=True,
+      postgresql_where=text("seat_row IS NOT NULL AND seat_number IS NOT NULL"),
+      sqlite_where=text("seat_row IS NOT NULL AND seat_number IS NOT NULL"),
+    ),
+  )
 
   event = relationship("Event", backref="tickets")
   schedule = relationship("EventSchedule", backref="tickets")
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
-from app.schemas.event import EventResponse
+from app.schemas.event import EventResponse, EventCardResponse
 from app.models.event import EventGenre
 
 class BannerCreate(BaseModel):
@@ -35,3 +35,19 @@ class BannerResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+class BannerCardResponse(BaseModel):
+    """공개 배너 피드용 (이벤트는 카드 필드만 포함)"""
+    id: int
+    order: int
+    event_id: int
+    genre: Optional[EventGenre] = None
+    link: Optional[str] = None
+    exposure_start: Optional[datetime] = None
+    exposure_end: Optional[datetime] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    event: Optional[EventCardResponse] = None
+
+    class Config:
+        from_attributes = True
@@ -82,3 +82,30 @@ class EventResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class EventScheduleCardResponse(BaseModel):
+    """목록/카드용 회차 (날짜 표시에 필요한 필드만)"""
+    id: int
+    start_datetime: datetime
+    end_datetime: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class EventCardResponse(BaseModel):
+    """목록/카드용 이벤트 (포스터, 제목, 장소, 장르, 회차 날짜). 상세 정보는 EventResponse 사용"""
+    id: int
+    title: str
+    location: Optional[str] = None
+    genre: Optional[EventGenre] = None
+    sub_genre: Optional[EventSubGenre] = None
+    is_hot: Optional[int] = 0
+    poster_image: Optional[str] = None
+    sales_open_date: Optional[datetime] = None
+    sales_end_date: Optional[datetime] = None
+    created_at: datetime
+    schedules: List[EventScheduleCardResponse] = []
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,102 @@
+"""
+AI 검색 결과 캐시: 프로세스 내 LRU(1차) + Redis(2차)
+
+인기 검색어(예매 오픈 시점의 아티스트 이름 등)는 같은 질의가 반복되므로
+키워드 추출, 의도 분류, 최종 검색 결과를 정규화된 질의 문자열 기준으로 캐싱해 LLM 호출을 줄입니다.
+- 키워드/의도: 카탈로그와 무관하므로 질의만으로 키를 만듭니다.
+- 검색 결과: events 네임스페이스 세대를 키에 포함하므로 이벤트가 변경되면 자동으로 무효화됩니다.
+- async 핸들러에서는 get_async/set_async 사용 (Redis 왕복을 스레드에서 실행해 이벤트 루프를 막지 않음)
+"""
+import asyncio
+import hashlib
+import json
+import re
+import unicodedata
+from typing import Any, Optional
+from app.core.config import settings
+from app.services.redis_service import redis_service
+from app.services.cache_service import cache_service, EVENTS_NAMESPACE
+from app.services.local_cache import LocalTTLCache
+
+# 캐시 종류
+KEYWORDS = "keywords"
+INTENT = "intent"
+SEARCH = "search"
+
+# 카탈로그 세대에 따라 무효화되는 캐시 종류
+VERSIONED_KINDS = {SEARCH}
+
+_PUNCTUATION = re.compile(r"[^\w\s/]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    질의 정규화 (NFKC, 소문자, 문장부호 제거, 공백 정리)
+    예: "  조용필  콘서트 예매해줘!! " → "조용필 콘서트 예매해줘"
+    """
+    text = unicodedata.normalize("NFKC", query or "").lower()
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class AIResultCache:
+    """AI 결과 2단계 캐시"""
+
+    def __init__(self):
+        self._local = LocalTTLCache(
+            maxsize=settings.AI_LOCAL_CACHE_SIZE,
+            ttl=settings.AI_LOCAL_CACHE_TTL,
+        )
+
+    def get(self, kind: str, query: str) -> Optional[Any]:
+        """캐시 조회 (로컬 → Redis 순), 미스면 None"""
+        key = self._key(kind, query)
+        if key is None:
+            return None
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        try:
+            raw = redis_service.client.get(key)
+            if raw is None:
+                return None
+            value = json.loads(raw)
+        except Exception:
+            # Redis 오류나 손상된 항목은 캐시 미스로 처리
+            return None
+        self._local.set(key, value)
+        return value
+
+    def set(self, kind: str, query: str, value: Any, ttl: int) -> None:
+        """캐시 저장 (로컬 + Redis)"""
+        key = self._key(kind, query)
+        if key is None:
+            return
+        self._local.set(key, value, ttl)
+        try:
+            redis_service.client.set(key, json.dumps(value, ensure_ascii=False), ex=ttl)
+        except Exception:
+            pass
+
+    async def get_async(self, kind: str, query: str) -> Optional[Any]:
+        """이벤트 루프용 캐시 조회 (세대 확인/Redis 조회를 스레드에서 실행)"""
+        return await asyncio.to_thread(self.get, kind, query)
+
+    async def set_async(self, kind: str, query: str, value: Any, ttl: int) -> None:
+        """이벤트 루프용 캐시 저장"""
+        await asyncio.to_thread(self.set, kind, query, value, ttl)
+
+    def _key(self, kind: str, query: str) -> Optional[str]:
+        normalized = normalize_query(query)
+        if not normalized:
+            return None
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        if kind in VERSIONED_KINDS:
+            version = cache_service.namespace_version(EVENTS_NAMESPACE)
+            return f"ai_cache:{kind}:v{version}:{digest}"
+        return f"ai_cache:{kind}:{digest}"
+
+
+# 싱글톤 인스턴스
+ai_cache = AIResultCache()
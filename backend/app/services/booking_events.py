@@ -0,0 +1,408 @@
+"""
+예매 이벤트: 트랜잭션 아웃박스 → Redis Stream → 소비자 그룹
+
+- 예매 쓰기(예매 생성, 만료 취소)와 같은 트랜잭션에서 booking_outbox에 이벤트 행 기록 (add_booking_event)
+- 릴레이: 미전달 행을 배치로 Stream(booking_events)에 XADD 후 published_at 기록
+  여러 노드에서 실행되어도 Redis 리스를 가진 한 노드만 전달 (SKIP LOCKED로 동시 실행도 안전)
+- 소비자: 소비자 그룹별로 Stream을 읽어 커밋 이후 처리를 수행하고 XACK
+  - seat_availability: 좌석 상태 캐시 무효화, 좌석 배치도 세대 증가, 좌석 LOCK/홀드 해제, 좌석 반환 이벤트 발행
+  - booking_stats: 이벤트별 예매/취소 좌석 수와 매출 집계
+- 전달은 최소 한 번(at-least-once): 릴레이가 XADD 후 커밋 전에 멈추거나 소비자가 XACK 전에 멈추면
+  같은 이벤트가 다시 처리되므로 소비자는 멱등하게 처리 (outbox_id 기준)
+- BOOKING_OUTBOX_ENABLED가 꺼져 있으면 아웃박스 대신 커밋 직후 좌석 후처리를 바로 실행 (dispatch_inline_events)
+"""
+import asyncio
+import json
+import logging
+import socket
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+import redis
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.booking_outbox import BookingOutbox
+from app.services import redis_keys
+from app.services.cache_service import cache_service, seat_map_namespace
+from app.services.redis_service import redis_service
+from app.services.seat_hold_service import seat_hold_service
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 종류
+BOOKING_CREATED = "booking.created"
+BOOKING_EXPIRED = "booking.expired"
+
+RELAY_LEASE_KEY = "booking_outbox_relay:lease"
+# 아웃박스가 꺼져 있을 때 커밋 후 바로 처리할 이벤트를 모아두는 Session.info 키
+INLINE_EVENTS_KEY = "inline_booking_events"
+# 통계 중복 집계 방지 표시 유지 시간 (초, 재전달은 이 시간 안에 일어남)
+STATS_DEDUPE_TTL = 86400
+
+# 아웃박스 ID가 처음이면 통계 HASH에 증감 반영 (같은 메시지가 다시 와도 한 번만 집계)
+# KEYS[1] = 통계 HASH, KEYS[2] = 반영 표시 키
+# ARGV[1] = 표시 TTL, ARGV[2..] = 필드, 증감값 쌍
+APPLY_BOOKING_STATS_LUA = """
+if not redis.call('SET', KEYS[2], '1', 'NX', 'EX', ARGV[1]) then
+    return 0
+end
+for i = 2, #ARGV, 2 do
+    redis.call('HINCRBYFLOAT', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+redis_service.register_script("apply_booking_stats", APPLY_BOOKING_STATS_LUA)
+
+
+def seat_availability_channel(event_id: int) -> str:
+    """좌석 반환 이벤트 발행 채널"""
+    return f"seat_availability:{event_id}"
+
+
+def add_booking_event(
+    db: Session, event_type: str, event_id: int, schedule_id: Optional[int], payload: dict
+) -> BookingOutbox:
+    """
+    예매 이벤트를 아웃박스에 기록 (커밋은 호출한 쪽 트랜잭션에서)
+    BOOKING_OUTBOX_ENABLED가 꺼져 있으면 기록하지 않고 세션에 모아두며,
+    호출한 쪽이 커밋 후 dispatch_inline_events로 바로 처리
+    """
+    row = BookingOutbox(event_type=event_type, event_id=event_id, schedule_id=schedule_id, payload=payload)
+    if settings.BOOKING_OUTBOX_ENABLED:
+        db.add(row)
+    else:
+        db.info.setdefault(INLINE_EVENTS_KEY, []).append(row)
+    return row
+
+
+def dispatch_inline_events(db: Session) -> None:
+    """
+    아웃박스가 꺼져 있을 때 커밋 후 모아둔 이벤트의 좌석 후처리를 요청 안에서 바로 실행
+    (좌석 캐시 무효화, 좌석 배치도 세대 증가, LOCK/홀드 해제, 좌석 반환 이벤트 발행. 예매 통계는 집계하지 않음)
+    """
+    consumer = SeatAvailabilityConsumer()
+    for row in db.info.pop(INLINE_EVENTS_KEY, []):
+        try:
+            consumer.handle(BookingEvent.from_row(row))
+        except Exception as e:
+            # 예매는 이미 커밋됨: 캐시/LOCK은 TTL로 정리되므로 실패해도 응답은 그대로
+            logger.error(f"Inline booking event {row.event_type} failed for event {row.event_id}: {e}")
+
+
+@dataclass
+class BookingEvent:
+    """Stream에서 읽은 예매 이벤트"""
+    outbox_id: int
+    event_type: str
+    event_id: int
+    schedule_id: Optional[int]
+    payload: Dict = field(default_factory=dict)
+
+    @classmethod
+    def from_row(cls, row: BookingOutbox) -> "BookingEvent":
+        return cls(row.id, row.event_type, row.event_id, row.schedule_id, row.payload)
+
+    @classmethod
+    def from_fields(cls, fields: Dict[str, str]) -> "BookingEvent":
+        return cls(
+            outbox_id=int(fields["outbox_id"]),
+            event_type=fields["type"],
+            event_id=int(fields["event_id"]),
+            schedule_id=int(fields["schedule_id"]) if fields.get("schedule_id") else None,
+            payload=json.loads(fields["payload"]),
+        )
+
+    def to_fields(self) -> Dict[str, str]:
+        return {
+            "outbox_id": self.outbox_id,
+            "type": self.event_type,
+            "event_id": self.event_id,
+            "schedule_id": self.schedule_id or "",
+            "payload": json.dumps(self.payload, ensure_ascii=False),
+        }
+
+
+class OutboxRelay:
+    """아웃박스 미전달 행을 Redis Stream으로 배치 전달"""
+
+    def __init__(self, batch_size: Optional[int] = None, interval: Optional[float] = None):
+        self.batch_size = batch_size or settings.BOOKING_OUTBOX_BATCH_SIZE
+        self.interval = interval or settings.BOOKING_OUTBOX_RELAY_INTERVAL
+        self.lease_ttl = settings.BOOKING_OUTBOX_LEASE_TTL
+        self.owner = str(uuid.uuid4())
+
+    def acquire_lease(self) -> bool:
+        """리스 획득 또는 연장 (다른 노드가 보유 중이면 False)"""
+        try:
+            if redis_service.client.set(RELAY_LEASE_KEY, self.owner, nx=True, ex=self.lease_ttl):
+                return True
+            return bool(redis_service.run_script("compare_and_expire", [RELAY_LEASE_KEY], [self.owner, self.lease_ttl]))
+        except Exception:
+            return False
+
+    def release_lease(self) -> None:
+        try:
+            redis_service.run_script("compare_and_delete", [RELAY_LEASE_KEY], [self.owner])
+        except Exception:
+            pass
+
+    def relay_once(self) -> int:
+        """미전달 행을 ID 순으로 모두 전달하고 전달 건수를 반환 (보관 기간이 지난 행은 배치 하나만큼 정리)"""
+        total = 0
+        db = SessionLocal()
+        try:
+            while True:
+                rows = (
+                    db.query(BookingOutbox)
+                    .filter(BookingOutbox.published_at.is_(None))
+                    .order_by(BookingOutbox.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                    .all()
+                )
+                if not rows:
+                    break
+
+                # 배치 전체를 한 번의 왕복으로 XADD (Stream 길이는 근사 MAXLEN으로 제한)
+                pipe = redis_service.client.pipeline(transaction=False)
+                for row in rows:
+                    pipe.xadd(
+                        redis_keys.booking_events(),
+                        BookingEvent.from_row(row).to_fields(),
+                        maxlen=settings.BOOKING_STREAM_MAXLEN,
+                        approximate=True,
+                    )
+                pipe.execute()
+
+                db.query(BookingOutbox).filter(BookingOutbox.id.in_([row.id for row in rows])).update(
+                    {BookingOutbox.published_at: datetime.now(timezone.utc)}, synchronize_session=False
+                )
+                db.commit()
+                total += len(rows)
+                if len(rows) < self.batch_size:
+                    break
+            self._purge(db)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return total
+
+    def _purge(self, db: Session) -> None:
+        """보관 기간이 지난 전달 완료 행 삭제"""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.BOOKING_OUTBOX_RETENTION)
+        expired_ids = [
+            row_id for (row_id,) in db.query(BookingOutbox.id)
+            .filter(BookingOutbox.published_at < cutoff)
+            .order_by(BookingOutbox.published_at)
+            .limit(self.batch_size)
+            .all()
+        ]
+        if expired_ids:
+            db.query(BookingOutbox).filter(BookingOutbox.id.in_(expired_ids)).delete(synchronize_session=False)
+            db.commit()
+
+    async def run(self) -> None:
+        """주기 실행 루프 (리스를 가진 노드에서만 전달, DB 작업은 스레드풀에서 실행)"""
+        try:
+            while True:
+                if self.acquire_lease():
+                    try:
+                        await asyncio.to_thread(self.relay_once)
+                    except Exception as e:
+                        logger.error(f"Booking outbox relay failed: {e}")
+                await asyncio.sleep(self.interval)
+        finally:
+            self.release_lease()
+
+
+class BookingEventConsumer(ABC):
+    """
+    예매 이벤트 소비자 (소비자 그룹 하나)
+    하위 클래스에서 group과 handle을 정의합니다. handle이 실패한 메시지는 XACK하지 않고 남겨두고,
+    BOOKING_CONSUMER_CLAIM_IDLE_MS가 지나면 (다른 노드 포함) 소비자가 회수해 다시 처리합니다.
+    BOOKING_CONSUMER_MAX_DELIVERIES번 전달되어도 실패하는 메시지는 dead-letter Stream으로 옮기고 XACK합니다.
+    """
+
+    group = ""
+
+    def __init__(self, consumer_name: Optional[str] = None):
+        self.consumer = consumer_name or f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self.batch_size = settings.BOOKING_OUTBOX_BATCH_SIZE
+        # XAUTOCLAIM 스캔 위치 (호출마다 이어서 스캔, 끝까지 돌면 Redis가 0-0을 돌려줌)
+        self._claim_cursor = "0-0"
+
+    @abstractmethod
+    def handle(self, event: BookingEvent) -> None:
+        """이벤트 하나 처리 (재전달될 수 있으므로 멱등하게 구현)"""
+
+    def ensure_group(self) -> None:
+        """소비자 그룹 생성 (Stream 처음부터 읽음, 이미 있으면 무시)"""
+        try:
+            redis_service.client.xgroup_create(redis_keys.booking_events(), self.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def consume_once(self, block_ms: Optional[int] = None) -> int:
+        """
+        멈춘 소비자의 메시지를 회수하고 새 메시지를 읽어 처리
+        (회수한 메시지가 있으면 새 메시지는 기다리지 않고 읽음)
+
+        Args:
+            block_ms: 새 메시지 대기 시간 (None이면 대기하지 않음)
+
+        Returns:
+            처리(XACK)한 메시지 수 (dead-letter로 옮긴 메시지 포함)
+        """
+        client = redis_service.client
+        stream = redis_keys.booking_events()
+        claimed = client.xautoclaim(
+            stream, self.group, self.consumer,
+            min_idle_time=settings.BOOKING_CONSUMER_CLAIM_IDLE_MS, start_id=self._claim_cursor, count=self.batch_size,
+        )
+        self._claim_cursor = claimed[0]
+        entries = claimed[1]
+        # 회수한 메시지의 전달 횟수 (새로 읽은 메시지는 1회)
+        deliveries = self._delivery_counts(stream, entries)
+
+        response = client.xreadgroup(
+            self.group, self.consumer, {stream: ">"}, count=self.batch_size, block=None if entries else block_ms
+        )
+        entries = entries + (response[0][1] if response else [])
+
+        handled = []
+        for message_id, fields in entries:
+            # MAXLEN으로 잘려 본문이 없는 메시지는 처리할 수 없으므로 확인만 함
+            if fields:
+                try:
+                    self.handle(BookingEvent.from_fields(fields))
+                except Exception as e:
+                    logger.error(f"Booking event consumer {self.group} failed on {message_id}: {e}")
+                    if deliveries.get(message_id, 1) < settings.BOOKING_CONSUMER_MAX_DELIVERIES:
+                        continue
+                    self._dead_letter(message_id, fields, e)
+            handled.append(message_id)
+        if handled:
+            client.xack(stream, self.group, *handled)
+        return len(handled)
+
+    def _delivery_counts(self, stream: str, entries: List) -> Dict[str, int]:
+        """회수한 메시지별 전달 횟수 (XPENDING, XAUTOCLAIM이 이미 이번 전달을 반영함)"""
+        if not entries:
+            return {}
+        pending = redis_service.client.xpending_range(
+            stream, self.group, min=entries[0][0], max=entries[-1][0], count=len(entries)
+        )
+        return {item["message_id"]: item["times_delivered"] for item in pending}
+
+    def _dead_letter(self, message_id: str, fields: Dict[str, str], error: Exception) -> None:
+        """처리 횟수 한도를 넘긴 메시지를 dead-letter Stream에 남김 (원본 필드 + 소비자 그룹/원본 ID/오류)"""
+        logger.error(f"Booking event consumer {self.group} moved {message_id} to dead letter: {error}")
+        redis_service.client.xadd(
+            redis_keys.booking_events_dead_letter(),
+            {**fields, "group": self.group, "message_id": message_id, "error": str(error)[:500]},
+            maxlen=settings.BOOKING_STREAM_MAXLEN,
+            approximate=True,
+        )
+
+    async def run(self) -> None:
+        """소비 루프 (Redis 오류 시 잠시 후 재시도)"""
+        while True:
+            try:
+                await asyncio.to_thread(self.ensure_group)
+                while True:
+                    await asyncio.to_thread(self.consume_once, settings.BOOKING_CONSUMER_BLOCK_MS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Booking event consumer {self.group} stopped: {e}")
+                await asyncio.sleep(1)
+
+
+class SeatAvailabilityConsumer(BookingEventConsumer):
+    """좌석 상태 캐시/좌석 배치도 갱신 + 예매된 좌석의 LOCK/홀드 해제 + 좌석 반환 이벤트 발행"""
+
+    group = "seat_availability"
+
+    def handle(self, event: BookingEvent) -> None:
+        redis_service.invalidate_seat_cache(event.event_id, event.schedule_id)
+        cache_service.bump_namespace(seat_map_namespace(event.event_id))
+
+        payload = event.payload
+        if event.event_type == BOOKING_CREATED:
+            # 예매에 사용한 LOCK 값이 그대로인 좌석만 해제 (사용자 좌석 수에서도 제외)
+            redis_service.release_seat_holds(
+                payload["locked_ticket_ids"], payload["lock_value"], payload["user_id"],
+                event.event_id, event.schedule_id,
+            )
+            if payload.get("hold_id"):
+                seat_hold_service.release(payload["user_id"], payload["hold_id"])
+        elif event.event_type == BOOKING_EXPIRED:
+            redis_service.client.publish(
+                seat_availability_channel(event.event_id),
+                json.dumps({
+                    "event_id": event.event_id,
+                    "schedule_id": event.schedule_id,
+                    "ticket_ids": payload["ticket_ids"],
+                    "reason": "expired",
+                }),
+            )
+
+
+class BookingStatsConsumer(BookingEventConsumer):
+    """이벤트별 예매 통계 집계 (예매 좌석 수, 취소 좌석 수, 매출)"""
+
+    group = "booking_stats"
+
+    def handle(self, event: BookingEvent) -> None:
+        payload = event.payload
+        seats = len(payload["ticket_ids"])
+        if event.event_type == BOOKING_CREATED:
+            increments = {"booked_seats": seats, "revenue": payload["total_price"]}
+        elif event.event_type == BOOKING_EXPIRED:
+            increments = {"booked_seats": -seats, "cancelled_seats": seats, "revenue": -payload["total_price"]}
+        else:
+            return
+        args = [STATS_DEDUPE_TTL]
+        for name, amount in increments.items():
+            args.extend([name, amount])
+        redis_service.run_script(
+            "apply_booking_stats",
+            [redis_keys.booking_stats(event.event_id), redis_keys.booking_stats_applied(event.event_id, event.outbox_id)],
+            args,
+        )
+
+
+def get_booking_stats(event_id: int) -> Dict[str, float]:
+    """이벤트 예매 통계 조회 (집계 전이면 0)"""
+    raw = redis_service.client.hgetall(redis_keys.booking_stats(event_id))
+    return {
+        "booked_seats": int(float(raw.get("booked_seats", 0))),
+        "cancelled_seats": int(float(raw.get("cancelled_seats", 0))),
+        "revenue": float(raw.get("revenue", 0)),
+    }
+
+
+def outbox_lag(db: Session) -> Dict:
+    """릴레이/소비자 지연 (미전달 행 수, Stream 길이, 그룹별 미확인 메시지 수)"""
+    unpublished = db.query(BookingOutbox).filter(BookingOutbox.published_at.is_(None)).count()
+    try:
+        stream_length = redis_service.client.xlen(redis_keys.booking_events())
+        groups = {
+            group["name"]: {"pending": group["pending"], "lag": group.get("lag")}
+            for group in redis_service.client.xinfo_groups(redis_keys.booking_events())
+        }
+    except redis.ResponseError:
+        # Stream이 아직 없음
+        stream_length, groups = 0, {}
+    return {"unpublished": unpublished, "stream_length": stream_length, "groups": groups}
+
+
+# 싱글톤 인스턴스
+outbox_relay = OutboxRelay()
+booking_consumers: List[BookingEventConsumer] = [SeatAvailabilityConsumer(), BookingStatsConsumer()]
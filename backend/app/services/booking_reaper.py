@@ -0,0 +1,133 @@
+"""
+결제 대기(PENDING) 예매 만료 처리기
+
+- PENDING_BOOKING_TTL이 지난 PENDING 예매를 (status, booked_at) 인덱스로 배치 조회해 일괄 취소
+- 배치 조회는 SELECT ... FOR UPDATE SKIP LOCKED로 결제 확정 중인 행과 충돌하지 않음
+- 취소와 같은 트랜잭션에서 이벤트/회차별 booking.expired 이벤트를 아웃박스에 기록
+  (좌석 캐시 무효화와 좌석 반환 이벤트 발행(채널: seat_availability:{event_id})은 소비자가 처리, booking_events.
+   아웃박스가 꺼져 있으면 커밋 직후 바로 처리)
+- 여러 노드에서 실행되어도 Redis 리스(lease)를 가진 한 노드만 처리
+
+현재는 예매를 CONFIRMED로 바꾸는 결제 확정 경로가 없어 모든 예매가 PENDING으로 남으므로
+BOOKING_REAPER_ENABLED(기본 False)를 켜지 않음 (결제 확정 경로 도입 후 활성화)
+"""
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from app.core.config import settings
+from app.database import SessionLocal, replica_router, event_write_scope
+from app.models.booking import Booking, BookingStatus
+from app.models.ticket import Ticket
+from app.services.booking_events import BOOKING_EXPIRED, add_booking_event, dispatch_inline_events
+from app.services.redis_service import redis_service
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY = "booking_reaper:lease"
+
+
+class BookingReaper:
+    """만료된 PENDING 예매 일괄 취소 + 좌석 반환"""
+
+    def __init__(
+        self,
+        pending_ttl: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        interval: Optional[int] = None,
+    ):
+        self.pending_ttl = pending_ttl or settings.PENDING_BOOKING_TTL
+        self.batch_size = batch_size or settings.BOOKING_REAPER_BATCH_SIZE
+        self.interval = interval or settings.BOOKING_REAPER_INTERVAL
+        # 리스는 몇 주기 동안 갱신이 없으면 다른 노드가 넘겨받을 수 있도록 만료
+        self.lease_ttl = self.interval * 3
+        self.owner = str(uuid.uuid4())
+
+    def acquire_lease(self) -> bool:
+        """리스 획득 또는 연장 (다른 노드가 보유 중이면 False)"""
+        try:
+            if redis_service.client.set(LEASE_KEY, self.owner, nx=True, ex=self.lease_ttl):
+                return True
+            # 리스 보유자일 때만 만료 시간 연장
+            return bool(redis_service.run_script("compare_and_expire", [LEASE_KEY], [self.owner, self.lease_ttl]))
+        except Exception:
+            return False
+
+    def release_lease(self) -> None:
+        try:
+            redis_service.run_script("compare_and_delete", [LEASE_KEY], [self.owner])
+        except Exception:
+            pass
+
+    def reap_once(self) -> int:
+        """만료된 PENDING 예매를 배치 단위로 모두 취소하고 취소 건수를 반환"""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.pending_ttl)
+        total = 0
+        db = SessionLocal()
+        try:
+            while True:
+                rows = (
+                    db.query(
+                        Booking.id, Booking.schedule_id, Booking.total_price,
+                        Ticket.id.label("ticket_id"), Ticket.event_id,
+                    )
+                    .join(Ticket, Booking.ticket_id == Ticket.id)
+                    .filter(Booking.status == BookingStatus.PENDING, Booking.booked_at < cutoff)
+                    .order_by(Booking.booked_at)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True, of=Booking)
+                    .all()
+                )
+                if not rows:
+                    break
+
+                db.query(Booking).filter(Booking.id.in_([row.id for row in rows])).update(
+                    {Booking.status: BookingStatus.CANCELLED}, synchronize_session=False
+                )
+                self._record_released(db, rows)
+                db.commit()
+                replica_router.mark_write(*{event_write_scope(row.event_id) for row in rows})
+                dispatch_inline_events(db)
+                total += len(rows)
+                if len(rows) < self.batch_size:
+                    break
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return total
+
+    def _record_released(self, db, rows) -> None:
+        """취소된 좌석을 이벤트/회차 단위 booking.expired 이벤트로 아웃박스에 기록"""
+        released = defaultdict(list)
+        for row in rows:
+            released[(row.event_id, row.schedule_id)].append(row)
+
+        for (event_id, schedule_id), group in released.items():
+            add_booking_event(db, BOOKING_EXPIRED, event_id, schedule_id, {
+                "ticket_ids": [row.ticket_id for row in group],
+                "booking_ids": [row.id for row in group],
+                "total_price": sum(row.total_price for row in group),
+            })
+
+    async def run(self) -> None:
+        """주기 실행 루프 (리스를 가진 노드에서만 처리, DB 작업은 스레드풀에서 실행)"""
+        try:
+            while True:
+                if self.acquire_lease():
+                    try:
+                        count = await asyncio.to_thread(self.reap_once)
+                        if count:
+                            logger.info(f"Expired {count} pending bookings")
+                    except Exception as e:
+                        logger.error(f"Booking reaper failed: {e}")
+                await asyncio.sleep(self.interval)
+        finally:
+            self.release_lease()
+
+
+# 싱글톤 인스턴스
+booking_reaper = BookingReaper()
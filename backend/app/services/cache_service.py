@@ -0,0 +1,354 @@
+"""
+버전 기반 캐시 서비스: 세대(generation) 카운터 네임스페이스 + 스탬피드 방지
+
+- 네임스페이스마다 세대 카운터(cache_gen:{namespace})를 두고, 캐시 키에 세대 번호를 포함
+  → 관리자 수정 시 카운터를 INCR 하면 이전 세대의 캐시는 즉시 도달 불가 (TTL로 자연 소멸)
+- 워커 내 단일 비행(single-flight): 같은 키는 한 스레드만 재계산
+- 확률적 조기 갱신(XFetch): 만료 직전에 일부 요청만 미리 재계산하여 동시 만료 방지
+- stale-while-revalidate: 만료 후 일정 시간은 이전 값을 반환하고, 한 요청만 재계산
+- 최종 응답 본문(JSON)을 gzip으로 압축해 저장하고 ETag와 함께 그대로 반환
+  → 캐시 히트 시 역직렬화/검증/재직렬화 없이 Redis GET 수준의 비용
+- 선택적 프로세스 내 1차 캐시(local_ttl): 세대 번호 조회만으로 응답 (Redis 엔트리 조회 생략)
+- 세대 번호는 client-side caching으로 조회 → local_ttl 히트 시 Redis 왕복 없음
+- 비동기 엔드포인트용 변형(cached_response_async): loader가 코루틴이고 단일 비행은 asyncio.Lock
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+from fastapi import Request, Response
+from app.core.config import settings
+from app.services.redis_service import redis_service
+from app.services.local_cache import LocalTTLCache
+
+# 네임스페이스 이름
+EVENTS_NAMESPACE = "events"
+BANNERS_NAMESPACE = "banners"
+
+
+def seat_map_namespace(event_id: int) -> str:
+    """이벤트별 좌석 배치도 캐시 네임스페이스"""
+    return f"seat_map:{event_id}"
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    Accept-Encoding 협상: gzip을 받을 수 있는지 (q=0은 거부)
+    gzip(x-gzip)을 명시했으면 그 q 값을, 없으면 *의 q 값을 따르고 둘 다 없으면 거부
+    """
+    qualities: Dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+@dataclass
+class CachedBody:
+    """
+    loader 반환용: 응답 본문과 함께 캐시할 헤더 (예: 다음 페이지 커서)
+    ttl을 지정하면 호출부의 ttl 대신 사용 (데이터에 따라 만료 시점이 정해지는 경우)
+    """
+    value: Any
+    headers: Dict[str, str] = field(default_factory=dict)
+    ttl: Optional[int] = None
+
+
+class CacheService:
+    """세대 카운터 기반 캐시 (Redis 저장, 워커 내 단일 비행)"""
+
+    # 키별 재계산 LOCK (스트라이핑으로 LOCK 개수를 고정)
+    LOCK_STRIPES = 128
+    # 프로세스 내 1차 캐시 최대 항목 수
+    LOCAL_CACHE_SIZE = 512
+
+    def __init__(self):
+        self._locks = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+        self._local = LocalTTLCache(maxsize=self.LOCAL_CACHE_SIZE, ttl=86400)
+        # asyncio.Lock은 이벤트 루프에 묶이므로 루프별로 생성
+        self._async_locks = None
+        self._async_locks_loop = None
+
+    def namespace_version(self, namespace: str) -> int:
+        """
+        네임스페이스의 현재 세대 번호 조회 (없으면 0)
+        모든 캐시 조회가 읽는 키이므로 client-side caching으로 조회 (INCR 시 서버 푸시로 무효화)
+        """
+        try:
+            value = redis_service.get_near(f"cache_gen:{namespace}")
+            return int(value) if value else 0
+        except Exception:
+            return 0
+
+    def bump_namespace(self, namespace: str) -> None:
+        """
+        네임스페이스 세대 증가 (명시적 무효화)
+        이전 세대의 캐시 키는 더 이상 조회되지 않으며 TTL로 정리됩니다.
+        """
+        try:
+            redis_service.client.incr(f"cache_gen:{namespace}")
+        except Exception:
+            pass
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: int,
+        stale_ttl: Optional[int] = None,
+        beta: Optional[float] = None,
+    ) -> Any:
+        """
+        캐시 조회 후 필요하면 loader로 재계산하여 값을 반환
+
+        Args:
+            namespace: 캐시 네임스페이스 (세대 카운터 단위)
+            key: 네임스페이스 내 캐시 키
+            loader: 캐시 미스 시 값을 계산하는 함수 (JSON 직렬화 가능한 값 또는 CachedBody 반환)
+            ttl: 신선(fresh) 유지 시간 (초)
+            stale_ttl: 만료 후 이전 값을 제공할 시간 (초), 기본값은 설정값 사용
+            beta: 조기 갱신 강도 (클수록 일찍 갱신), 기본값은 설정값 사용
+
+        Returns:
+            캐시된 값 또는 새로 계산된 값
+        """
+        entry = self._get_entry(namespace, key, loader, ttl, stale_ttl, beta)
+        return json.loads(gzip.decompress(entry["body"]))
+
+    def cached_response(
+        self,
+        request: Request,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: int,
+        stale_ttl: Optional[int] = None,
+        beta: Optional[float] = None,
+        local_ttl: Optional[float] = None,
+    ) -> Response:
+        """
+        캐시된 응답 본문을 그대로 Response로 반환 (get_or_compute와 같은 인자)
+
+        - If-None-Match가 ETag와 같으면 304
+        - 클라이언트가 gzip을 지원하면 압축된 본문을 그대로 전송, 아니면 압축 해제 후 전송
+        - local_ttl을 지정하면 엔트리를 워커 메모리에도 보관 (엔트리 만료 시각을 넘기지 않음)
+        """
+        entry = self._get_entry(namespace, key, loader, ttl, stale_ttl, beta, local_ttl)
+        return self._build_response(request, entry)
+
+    async def cached_response_async(
+        self,
+        request: Request,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: Optional[int] = None,
+        beta: Optional[float] = None,
+        local_ttl: Optional[float] = None,
+    ) -> Response:
+        """cached_response의 비동기 버전 (loader는 코루틴 함수, 예: AsyncSession 조회)
+        Redis 조회/저장은 동기 클라이언트이므로 이벤트 루프를 막지 않도록 스레드풀에서 실행"""
+        entry_key = await asyncio.to_thread(self._entry_key, namespace, key)
+        if local_ttl:
+            entry = self._local.get(entry_key)
+            if entry is not None and time.time() < entry["expiry"]:
+                return self._build_response(request, entry)
+
+        stale_ttl = settings.CACHE_STALE_TTL if stale_ttl is None else stale_ttl
+        beta = settings.CACHE_EARLY_REFRESH_BETA if beta is None else beta
+        lock = self._get_async_lock(entry_key)
+
+        entry = await asyncio.to_thread(self._read, entry_key)
+        if entry is not None and self._should_refresh(entry, beta):
+            # 만료(stale) 또는 조기 갱신 대상: 이미 재계산 중이면 기존 값 반환
+            if not lock.locked():
+                async with lock:
+                    entry = await self._compute_async(entry_key, loader, ttl, stale_ttl)
+        elif entry is None:
+            # 캐시 미스: 같은 키의 요청은 먼저 들어온 요청의 계산 결과를 기다림
+            async with lock:
+                entry = await asyncio.to_thread(self._read, entry_key)
+                if entry is None or time.time() >= entry["expiry"]:
+                    entry = await self._compute_async(entry_key, loader, ttl, stale_ttl)
+
+        if local_ttl:
+            remaining = entry["expiry"] - time.time()
+            if remaining > 0:
+                self._local.set(entry_key, entry, min(local_ttl, remaining))
+        return self._build_response(request, entry)
+
+    def _build_response(self, request: Request, entry: dict) -> Response:
+        """캐시 엔트리로 응답 생성 (ETag/304, gzip 협상)"""
+        headers = {**entry["headers"], "ETag": entry["etag"], "Vary": "Accept-Encoding"}
+
+        if request.headers.get("if-none-match") == entry["etag"]:
+            return Response(status_code=304, headers=headers)
+
+        if accepts_gzip(request.headers.get("accept-encoding")):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=entry["body"], media_type="application/json", headers=headers)
+        return Response(content=gzip.decompress(entry["body"]), media_type="application/json", headers=headers)
+
+    def _get_entry(
+        self,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: int,
+        stale_ttl: Optional[int],
+        beta: Optional[float],
+        local_ttl: Optional[float] = None,
+    ) -> dict:
+        """캐시 엔트리 조회/재계산 (프로세스 내 캐시 → Redis → loader)"""
+        entry_key = self._entry_key(namespace, key)
+        if not local_ttl:
+            return self._get_shared_entry(entry_key, loader, ttl, stale_ttl, beta)
+
+        # 세대 번호가 키에 포함되므로 다른 워커의 무효화도 즉시 반영됨
+        entry = self._local.get(entry_key)
+        if entry is not None and time.time() < entry["expiry"]:
+            return entry
+        entry = self._get_shared_entry(entry_key, loader, ttl, stale_ttl, beta)
+        remaining = entry["expiry"] - time.time()
+        if remaining > 0:
+            self._local.set(entry_key, entry, min(local_ttl, remaining))
+        return entry
+
+    def _entry_key(self, namespace: str, key: str) -> str:
+        """세대 번호가 포함된 캐시 키"""
+        return f"cache:{namespace}:v{self.namespace_version(namespace)}:{key}"
+
+    def _get_async_lock(self, entry_key: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._async_locks is None or self._async_locks_loop is not loop:
+            self._async_locks = [asyncio.Lock() for _ in range(self.LOCK_STRIPES)]
+            self._async_locks_loop = loop
+        return self._async_locks[hash(entry_key) % self.LOCK_STRIPES]
+
+    def _get_shared_entry(
+        self,
+        entry_key: str,
+        loader: Callable[[], Any],
+        ttl: int,
+        stale_ttl: Optional[int],
+        beta: Optional[float],
+    ) -> dict:
+        """Redis 캐시 엔트리 조회/재계산 (단일 비행 + 조기 갱신 + stale-while-revalidate)"""
+        stale_ttl = settings.CACHE_STALE_TTL if stale_ttl is None else stale_ttl
+        beta = settings.CACHE_EARLY_REFRESH_BETA if beta is None else beta
+
+        lock = self._locks[hash(entry_key) % self.LOCK_STRIPES]
+
+        entry = self._read(entry_key)
+        if entry is not None:
+            if not self._should_refresh(entry, beta):
+                return entry
+            # 만료(stale) 또는 조기 갱신 대상: LOCK을 얻은 요청만 재계산하고 나머지는 기존 값 반환
+            if not lock.acquire(blocking=False):
+                return entry
+            try:
+                return self._compute(entry_key, loader, ttl, stale_ttl)
+            finally:
+                lock.release()
+
+        # 캐시 미스: 같은 키의 요청은 먼저 들어온 요청의 계산 결과를 기다림
+        with lock:
+            entry = self._read(entry_key)
+            if entry is not None and time.time() < entry["expiry"]:
+                return entry
+            return self._compute(entry_key, loader, ttl, stale_ttl)
+
+    def _compute(self, entry_key: str, loader: Callable[[], Any], ttl: int, stale_ttl: int) -> dict:
+        """loader 실행 후 직렬화/압축한 본문을 계산 시간(delta)과 함께 저장"""
+        started = time.time()
+        return self._store(entry_key, loader(), started, ttl, stale_ttl)
+
+    async def _compute_async(
+        self, entry_key: str, loader: Callable[[], Awaitable[Any]], ttl: int, stale_ttl: int
+    ) -> dict:
+        """비동기 loader 실행 후 저장 (직렬화/압축과 Redis 저장은 스레드풀에서 실행)"""
+        started = time.time()
+        value = await loader()
+        return await asyncio.to_thread(self._store, entry_key, value, started, ttl, stale_ttl)
+
+    def _store(self, entry_key: str, value: Any, started: float, ttl: int, stale_ttl: int) -> dict:
+        """직렬화/압축한 본문을 ETag, 계산 시간(delta), 만료 시각과 함께 Redis에 저장"""
+        headers = {}
+        if isinstance(value, CachedBody):
+            ttl = value.ttl or ttl
+            value, headers = value.value, value.headers
+        body = json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+        finished = time.time()
+
+        entry = {
+            "body": gzip.compress(body),
+            "etag": f'"{hashlib.sha1(body).hexdigest()}"',
+            "headers": json.dumps(headers),
+            "delta": finished - started,
+            "expiry": finished + ttl,
+        }
+        try:
+            pipe = redis_service.binary_client.pipeline(transaction=True)
+            pipe.hset(entry_key, mapping=entry)
+            pipe.expire(entry_key, ttl + stale_ttl)
+            pipe.execute()
+        except Exception:
+            pass
+        return {**entry, "headers": headers}
+
+    def _read(self, entry_key: str) -> Optional[dict]:
+        """캐시 엔트리 조회 (압축 본문, ETag, 추가 헤더, 계산 시간, 만료 시각)"""
+        try:
+            raw = redis_service.binary_client.hgetall(entry_key)
+            if not raw or b"body" not in raw:
+                return None
+            return {
+                "body": raw[b"body"],
+                "etag": raw[b"etag"].decode(),
+                "headers": json.loads(raw.get(b"headers", b"{}")),
+                "delta": float(raw.get(b"delta", 0)),
+                "expiry": float(raw.get(b"expiry", 0)),
+            }
+        except Exception:
+            return None
+
+    @staticmethod
+    def _should_refresh(entry: dict, beta: float) -> bool:
+        """
+        재계산 필요 여부 (XFetch)
+        now - delta * beta * ln(rand) >= expiry 이면 갱신
+        계산이 오래 걸리는 키일수록 만료 전에 일찍 갱신됩니다.
+        """
+        now = time.time()
+        if now >= entry["expiry"]:
+            return True
+        if beta <= 0 or entry["delta"] <= 0:
+            return False
+        return now - entry["delta"] * beta * math.log(1.0 - random.random()) >= entry["expiry"]
+
+
+# 싱글톤 인스턴스
+cache_service = CacheService()
@@ -0,0 +1,203 @@
+"""
+LLM 게이트웨이: 비동기 OpenAI 호출 + 타임아웃 + 동시성 제한 + 서킷 브레이커
+
+동기 클라이언트는 응답을 기다리는 동안 워커의 이벤트 루프 전체(대기열 폴링 포함)를 멈추게 하므로
+모든 LLM 호출은 이 게이트웨이를 통해 AsyncOpenAI로 수행합니다.
+- 호출별 타임아웃: 초과 시 LLMUnavailableError (호출부는 로컬 키워드 검색으로 폴백)
+- 전역 세마포어: 워커당 동시 LLM 호출 수 제한, 대기 시간 초과 시 LLMUnavailableError
+- 서킷 브레이커: APIError/타임아웃이 연속되면 일정 시간 LLM 호출을 건너뜀
+"""
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+import openai
+from app.core.config import settings
+
+
+class LLMUnavailableError(Exception):
+    """LLM을 사용할 수 없음 (타임아웃, 동시성 초과, 서킷 오픈)"""
+    pass
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커
+
+    - closed: 정상 호출
+    - open: failure_threshold번 연속 실패 후 reset_timeout 동안 호출 차단
+    - half-open: reset_timeout 경과 후 한 번의 시험 호출만 허용, 성공하면 closed
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """호출 허용 여부"""
+        return self.enter() is not None
+
+    def enter(self) -> Optional[str]:
+        """
+        호출 허용 여부와 허용된 상태
+
+        Returns:
+            차단이면 None, 허용이면 "closed" 또는 "half-open" (half-open이면 이 호출이 시험 호출)
+        """
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return state
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return state
+            return None
+
+    def abandon_trial(self) -> None:
+        """시험 호출이 성공/실패 판정 없이 끝난 경우 (동시성 대기 초과, 취소 등) 시험 슬롯만 비움"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class LLMGateway:
+    """비동기 LLM 호출 게이트웨이 (워커 단위)"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.api_key = api_key or settings.OPENAI_API_KEY
+        self.base_url = base_url or settings.OPENAI_BASE_URL
+        self.model = model or settings.OPENAI_MODEL or "gpt-4o-mini"
+        self.timeout = timeout or settings.LLM_TIMEOUT
+        self.max_concurrency = max_concurrency or settings.LLM_MAX_CONCURRENCY
+        self.queue_timeout = queue_timeout or settings.LLM_QUEUE_TIMEOUT
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=settings.LLM_BREAKER_THRESHOLD,
+            reset_timeout=settings.LLM_BREAKER_RESET_TIMEOUT,
+        )
+        self._client: Optional[openai.AsyncOpenAI] = None
+        # 세마포어는 이벤트 루프에 묶이므로 루프별로 생성
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+
+    @property
+    def enabled(self) -> bool:
+        """API 키가 설정되어 있는지 여부"""
+        return bool(self.api_key)
+
+    async def complete_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.3,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        JSON 응답 형식으로 채팅 완성 호출
+
+        Raises:
+            LLMUnavailableError: 서킷 오픈, 동시성 대기 초과, 타임아웃
+            openai.APIError: OpenAI API 오류 (RateLimitError 포함)
+        """
+        if not self.enabled:
+            raise LLMUnavailableError("OPENAI_API_KEY가 설정되지 않았습니다")
+        admitted = self.breaker.enter()
+        if admitted is None:
+            raise LLMUnavailableError("LLM 서킷이 열려 있습니다")
+        try:
+            return await self._complete_json(system_prompt, user_prompt, temperature, timeout)
+        finally:
+            # 성공/실패가 기록되지 않은 시험 호출도 슬롯을 비워 half-open에 갇히지 않도록 함
+            # (성공/실패가 기록된 경우에는 이미 비어 있음)
+            if admitted == "half-open":
+                self.breaker.abandon_trial()
+
+    async def _complete_json(
+        self, system_prompt: str, user_prompt: str, temperature: float, timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        """세마포어 획득 후 호출하고 결과를 서킷 브레이커에 기록"""
+        semaphore = self._get_semaphore()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise LLMUnavailableError("LLM 동시 호출 수 초과")
+
+        try:
+            response = await asyncio.wait_for(
+                self._get_client().chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=temperature,
+                ),
+                timeout=timeout or self.timeout,
+            )
+        except asyncio.TimeoutError:
+            self.breaker.record_failure()
+            raise LLMUnavailableError("LLM 응답 시간 초과")
+        except openai.APIError:
+            self.breaker.record_failure()
+            raise
+        finally:
+            semaphore.release()
+
+        self.breaker.record_success()
+        return json.loads(response.choices[0].message.content)
+
+    def _get_client(self) -> openai.AsyncOpenAI:
+        if self._client is None:
+            self._client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                timeout=self.timeout,
+                # 재시도는 타임아웃 예산을 넘기므로 게이트웨이에서 하지 않음
+                max_retries=0,
+            )
+        return self._client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+
+# 싱글톤 인스턴스
+llm_gateway = LLMGateway()
@@ -0,0 +1,72 @@
+"""
+Redis 클라이언트 측 캐시(near cache) 저장소
+
+RESP3 CLIENT TRACKING으로 읽은 키를 워커 메모리에 보관하고, 서버가 키 변경 시 보내는
+무효화 푸시를 받으면 해당 항목을 삭제합니다 (redis-py 내장 client-side caching).
+이 모듈은 캐시 저장소에 히트/미스/무효화 지표를 더한 것입니다.
+
+- 최대 항목 수를 넘으면 LRU로 제거 (REDIS_NEAR_CACHE_SIZE, redis-py 버전과 무관하게 저장소에서 직접 처리)
+- 연결이 끊기면 redis-py가 저장소 전체를 비움 (끊긴 동안의 무효화 누락 방지)
+"""
+import threading
+from redis.cache import CacheEntryStatus, DefaultCache
+
+
+class NearCache(DefaultCache):
+    """지표를 집계하는 client-side caching 저장소 (클라이언트의 cache 인자로 전달)"""
+
+    def __init__(self, cache_config):
+        super().__init__(cache_config)
+        self._stats_lock = threading.Lock()
+        self.lookups = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.flushes = 0
+
+    def record_lookups(self, count: int = 1) -> None:
+        """near client 조회 명령 수 기록 (히트 = 조회 - 미스)"""
+        with self._stats_lock:
+            self.lookups += count
+
+    def set(self, entry) -> bool:
+        if not self.is_cachable(entry.cache_key):
+            return False
+        # 서버 응답을 기다리는 항목이 새로 만들어질 때가 캐시 미스
+        if entry.status == CacheEntryStatus.IN_PROGRESS:
+            with self._stats_lock:
+                self.misses += 1
+
+        self.collection[entry.cache_key] = entry
+        self.eviction_policy.touch(entry.cache_key)
+        while self.config.is_exceeds_max_size(self.size):
+            self.eviction_policy.evict_next()
+            with self._stats_lock:
+                self.evictions += 1
+        return True
+
+    def delete_by_redis_keys(self, redis_keys):
+        deleted = super().delete_by_redis_keys(redis_keys)
+        with self._stats_lock:
+            self.invalidations += sum(1 for value in deleted if value)
+        return deleted
+
+    def flush(self) -> int:
+        with self._stats_lock:
+            self.flushes += 1
+        return super().flush()
+
+    def snapshot(self) -> dict:
+        with self._stats_lock:
+            hits = max(self.lookups - self.misses, 0)
+            return {
+                "size": self.size,
+                "max_size": self.config.get_max_size(),
+                "lookups": self.lookups,
+                "hits": hits,
+                "misses": self.misses,
+                "hit_ratio": round(hits / self.lookups, 4) if self.lookups else 0.0,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "flushes": self.flushes,
+            }
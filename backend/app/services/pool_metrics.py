@@ -0,0 +1,106 @@
+"""
+DB 커넥션 풀 지표
+
+- 체크아웃/체크인은 풀 이벤트 리스너로 집계 (QueuePool/NullPool 공통)
+- 대기 시간은 풀 클래스를 감싸 connect() 소요 시간으로 측정 (커넥션 생성 시간 포함)
+- 풀 고갈(TimeoutError) 횟수를 함께 기록
+
+지표는 워커(프로세스) 단위이며 관리자 지표 API로 조회합니다.
+"""
+import threading
+import time
+from typing import Dict, Optional, Type
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+
+class PoolMetrics:
+    """풀 하나의 누적 지표"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.engine: Optional[Engine] = None
+        self.checked_out = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self._lock = threading.Lock()
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checked_out += 1
+            self.checkouts += 1
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        pool = self.engine.pool if self.engine is not None else None
+        with self._lock:
+            checkouts = self.checkouts
+            result = {
+                "pool_class": type(pool).__name__ if pool is not None else None,
+                "checked_out": self.checked_out,
+                "checkouts": checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total / checkouts * 1000, 3) if checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+        # QueuePool 계열만 크기/오버플로 개념이 있음 (NullPool은 None)
+        result["size"] = pool.size() if hasattr(pool, "size") else None
+        result["overflow"] = pool.overflow() if hasattr(pool, "overflow") else None
+        return result
+
+
+class PoolMetricsRegistry:
+    """엔진 이름별 PoolMetrics 관리"""
+
+    def __init__(self):
+        self._metrics: Dict[str, PoolMetrics] = {}
+
+    def get(self, name: str) -> PoolMetrics:
+        if name not in self._metrics:
+            self._metrics[name] = PoolMetrics(name)
+        return self._metrics[name]
+
+    def pool_class(self, name: str, base: Type[Pool]) -> Type[Pool]:
+        """connect() 대기 시간을 기록하는 풀 클래스
+        (클래스 속성으로 지표를 보관하므로 dispose() 후 재생성된 풀에도 유지됨)
+        """
+        metrics = self.get(name)
+
+        def connect(pool):
+            started = time.perf_counter()
+            try:
+                connection = base.connect(pool)
+            except exc.TimeoutError:
+                metrics.record_wait(time.perf_counter() - started, timed_out=True)
+                raise
+            metrics.record_wait(time.perf_counter() - started)
+            return connection
+
+        return type(f"Instrumented{base.__name__}", (base,), {"connect": connect})
+
+    def register(self, name: str, engine: Engine) -> None:
+        """엔진 풀에 체크아웃/체크인 리스너 등록 (비동기 엔진은 sync_engine 전달)"""
+        metrics = self.get(name)
+        metrics.engine = engine
+        event.listen(engine, "checkout", lambda *args: metrics.record_checkout())
+        event.listen(engine, "checkin", lambda *args: metrics.record_checkin())
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        return {name: metrics.snapshot() for name, metrics in self._metrics.items()}
+
+
+# 싱글톤 인스턴스
+pool_metrics = PoolMetricsRegistry()
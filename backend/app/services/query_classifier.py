@@ -0,0 +1,134 @@
+"""
+로컬 질의 분류기: LLM 호출 전 명확한 질의를 프로세스 내에서 처리
+
+- 의도 분류: 예매/검색 표현 사전(프롬프트에 나열된 키워드)으로 규칙 기반 분류
+- 키워드 추출: 요청 표현/불용어 제거 + 조사 제거, 모든 키워드가 검색 인덱스에 존재하면 확정
+- 제목 일치: 조사를 뗀 질의가 이벤트 제목과 정확히 같으면 바로 해당 이벤트
+
+신뢰도가 LOCAL_CLASSIFIER_THRESHOLD 미만이면 호출부에서 LLM으로 넘깁니다.
+"""
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.services.search_index import search_index, normalize
+
+# 예매 의도 표현
+BOOKING_PATTERN = re.compile(
+    r"예매|예약|티켓\s*(?:구매|구입|사)|좌석\s*(?:선택|골라|잡아)|표\s*(?:사|구해|끊)|사고\s*싶|구매"
+)
+# 검색 의도 표현
+SEARCH_PATTERN = re.compile(
+    r"찾아|검색|어떤|무슨|추천|보여|알려|있어\??$|있나요|뭐\s*있|언제"
+)
+
+# 검색어로 의미 없는 요청 표현 (단어 전체가 일치하면 제거)
+STOP_WORDS = {
+    "예매", "예약", "예매해줘", "예약해줘", "예매해주세요", "예약해주세요", "예매하고", "예약하고",
+    "찾아줘", "찾아주세요", "알려줘", "알려주세요", "보여줘", "보여주세요", "추천해줘", "추천해주세요",
+    "검색", "검색해줘", "해줘", "해주세요", "하고", "싶어", "싶다", "싶어요", "티켓", "좌석", "구매",
+    "공연", "어떤", "무슨", "있어", "있나요", "좀", "주세요", "언제", "뭐", "하는", "열리는", "있는",
+}
+# 단어 끝의 요청 어미 (예: "조용필콘서트예매해줘" → "조용필콘서트")
+REQUEST_SUFFIX = re.compile(
+    r"(?:예매|예약|검색|추천)?(?:해\s*줘|해\s*주세요|하고\s*싶어|하고\s*싶다|할래|하기)$"
+)
+# 단어 끝의 조사 (긴 것부터 매칭, 남는 부분이 2글자 이상일 때만 제거)
+PARTICLE_SUFFIX = re.compile(r"(에서|으로|이랑|까지|부터|은|는|이|가|을|를|의|에|로|도|만|랑|과|와)$")
+
+WORD_PATTERN = re.compile(r"[\w/]+")
+
+
+@dataclass
+class LocalResult:
+    """로컬 분류 결과"""
+    value: object
+    confidence: float
+    reason: str
+
+
+def strip_query(query: str) -> List[str]:
+    """요청 표현, 불용어, 조사를 제거한 검색어 목록"""
+    words = []
+    for word in WORD_PATTERN.findall(normalize(query)):
+        if word in STOP_WORDS:
+            continue
+        word = REQUEST_SUFFIX.sub("", word)
+        match = PARTICLE_SUFFIX.search(word)
+        if match and len(word) - len(match.group(1)) >= 2:
+            word = word[:match.start()]
+        if len(word) > 1 and word not in STOP_WORDS:
+            words.append(word)
+    return list(dict.fromkeys(words))
+
+
+class QueryClassifier:
+    """규칙 기반 로컬 분류기 + 로컬 처리율 지표 (워커 단위)"""
+
+    def __init__(self, threshold: Optional[float] = None):
+        self.threshold = threshold if threshold is not None else settings.LOCAL_CLASSIFIER_THRESHOLD
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def classify_intent(self, query: str) -> LocalResult:
+        """예매/검색 의도 분류"""
+        text = normalize(query)
+        booking = bool(BOOKING_PATTERN.search(text))
+        search = bool(SEARCH_PATTERN.search(text))
+        if booking and not search:
+            return LocalResult("booking", 0.9, "예매 표현 포함")
+        if search and not booking:
+            return LocalResult("search", 0.9, "검색 표현 포함")
+        if booking and search:
+            return LocalResult("search", 0.5, "예매/검색 표현이 함께 포함")
+        return LocalResult("search", 0.4, "판단 근거 없음")
+
+    def extract_keywords(self, query: str) -> LocalResult:
+        """검색 키워드 추출 (모든 키워드가 카탈로그에 존재하면 확정)"""
+        keywords = strip_query(query)[:5]
+        if not keywords:
+            return LocalResult([], 0.0, "키워드 없음")
+        if all(search_index.search([keyword], limit=1) for keyword in keywords):
+            return LocalResult(keywords, 0.9, "모든 키워드가 카탈로그에 존재")
+        return LocalResult(keywords, 0.4, "카탈로그에 없는 키워드 포함")
+
+    def match_title(self, query: str) -> Optional[int]:
+        """요청 표현을 뗀 질의가 이벤트 제목과 정확히 일치하면 이벤트 ID"""
+        words = strip_query(query)
+        if not words:
+            return None
+        event_id = search_index.match_title(" ".join(words))
+        if event_id is None:
+            # 조사/불용어 제거 전 원문 기준으로도 확인 (예: 제목에 "의"가 포함된 경우)
+            event_id = search_index.match_title(REQUEST_SUFFIX.sub("", normalize(query)))
+        return event_id
+
+    def is_confident(self, result: LocalResult) -> bool:
+        return result.confidence >= self.threshold
+
+    def record(self, kind: str, local: bool) -> None:
+        """로컬 처리/LLM 위임 횟수 기록"""
+        key = f"{kind}_{'local' if local else 'llm'}"
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """종류별 로컬 처리 횟수, LLM 위임 횟수, 로컬 처리율"""
+        with self._lock:
+            counters = dict(self._counters)
+        result = {}
+        for kind in ("intent", "keywords", "title"):
+            local = counters.get(f"{kind}_local", 0)
+            llm = counters.get(f"{kind}_llm", 0)
+            total = local + llm
+            result[kind] = {
+                "local": local,
+                "llm": llm,
+                "hit_rate": round(local / total, 4) if total else 0.0,
+            }
+        return result
+
+
+# 싱글톤 인스턴스
+query_classifier = QueryClassifier()
@@ -0,0 +1,168 @@
+"""
+Redis 키 빌더
+
+이벤트 단위로 함께 사용하는 키(대기열, 좌석 LOCK, 좌석 캐시)와 사용자 단위 키(좌석 홀드)는
+모두 이 모듈에서 생성합니다.
+
+- 해시 태그 모드: 키에 이벤트 해시 태그({e<event_id>})를 넣어 같은 이벤트의 키가
+  Redis Cluster의 같은 슬롯에 배치되도록 함 → 다중 키 Lua/MULTI를 Cluster에서도 실행 가능
+- 호환 모드 (기본): 기존 키 형식을 그대로 사용 (단일 노드 운영 중인 데이터 유지)
+
+REDIS_KEY_HASH_TAGS를 켜거나 REDIS_CLUSTER_NODES를 설정하면 해시 태그 모드가 됩니다.
+대기열/LOCK/좌석 캐시 키는 모두 TTL이 짧으므로 모드 전환은 판매가 없는 시간에 배포하면 됩니다.
+"""
+from typing import Optional
+from app.core.config import settings
+
+
+def hash_tags_enabled() -> bool:
+    return settings.REDIS_KEY_HASH_TAGS or bool(settings.REDIS_CLUSTER_NODES)
+
+
+def event_tag(event_id: int) -> str:
+    """이벤트 해시 태그 (같은 태그의 키는 같은 슬롯)"""
+    return f"{{e{event_id}}}"
+
+
+def user_tag(user_id: int) -> str:
+    """사용자 해시 태그"""
+    return f"{{u{user_id}}}"
+
+
+def _schedule_part(schedule_id: Optional[int]) -> str:
+    return str(schedule_id) if schedule_id else "all"
+
+
+# ============================================================================
+# 대기열
+# ============================================================================
+
+def queue(event_id: int) -> str:
+    """대기열 ZSET (member: user_id, score: 진입 시각)"""
+    if hash_tags_enabled():
+        return f"queue:{event_tag(event_id)}"
+    return f"queue:event:{event_id}"
+
+
+def queue_batch_cursor(event_id: int) -> str:
+    """배치 통과 커서 (마지막으로 통과한 score)"""
+    if hash_tags_enabled():
+        return f"queue_batch_cursor:{event_tag(event_id)}"
+    return f"queue_batch_cursor:event:{event_id}"
+
+
+def queue_batch_last_time(event_id: int) -> str:
+    """마지막 배치 진행 시각"""
+    if hash_tags_enabled():
+        return f"queue_batch_last_time:{event_tag(event_id)}"
+    return f"queue_batch_last_time:event:{event_id}"
+
+
+def queue_token(event_id: int, user_id: int) -> str:
+    """대기열 통과 토큰"""
+    if hash_tags_enabled():
+        return f"queue_token:{event_tag(event_id)}:user:{user_id}"
+    return f"queue_token:event:{event_id}:user:{user_id}"
+
+
+def queue_history(event_id: int) -> str:
+    """대기열 처리 이력 ZSET (처리 속도 계산용)"""
+    if hash_tags_enabled():
+        return f"queue_history:{event_tag(event_id)}"
+    return f"queue_history:event:{event_id}"
+
+
+# ============================================================================
+# 좌석 LOCK / 좌석 캐시
+# ============================================================================
+
+def seat_lock(ticket_id: int, event_id: Optional[int] = None) -> str:
+    """좌석 LOCK (해시 태그 모드에서는 event_id를 전달해야 같은 이벤트 슬롯에 배치됨)"""
+    if hash_tags_enabled() and event_id is not None:
+        return f"seat_lock:{event_tag(event_id)}:{ticket_id}"
+    return f"seat_lock:{ticket_id}"
+
+
+def seat_status(event_id: int, schedule_id: Optional[int]) -> str:
+    """스케줄별 좌석 상태 HASH"""
+    if hash_tags_enabled():
+        return f"seat_status:{event_tag(event_id)}:{_schedule_part(schedule_id)}"
+    return f"seat_status:{event_id}:{_schedule_part(schedule_id)}"
+
+
+def event_seats(event_id: int, schedule_id: Optional[int]) -> str:
+    """스케줄별 좌석 목록 캐시"""
+    if hash_tags_enabled():
+        return f"event_seats:{event_tag(event_id)}:{_schedule_part(schedule_id)}"
+    return f"event_seats:{event_id}:{_schedule_part(schedule_id)}"
+
+
+def seat_cache_index(event_id: int) -> str:
+    """이벤트별 캐시된 스케줄 목록 SET"""
+    if hash_tags_enabled():
+        return f"seat_cache_index:{event_tag(event_id)}"
+    return f"seat_cache_index:{event_id}"
+
+
+def user_held_seats(event_id: int, schedule_id: Optional[int], user_id: int) -> str:
+    """사용자가 회차에서 보유 중인 좌석 ZSET (1인당 좌석 수 제한, 좌석 LOCK과 같은 이벤트 슬롯)"""
+    if hash_tags_enabled():
+        return f"held_seats:{event_tag(event_id)}:{_schedule_part(schedule_id)}:user:{user_id}"
+    return f"held_seats:{event_id}:{_schedule_part(schedule_id)}:user:{user_id}"
+
+
+def seat_fence(event_id: int) -> str:
+    """
+    이벤트 펜싱 토큰 카운터 (좌석 LOCK 획득마다 INCR, 만료 없음)
+    좌석별 키 대신 이벤트 단위 하나로도 좌석마다 단조 증가가 보장되고, 임시 티켓 ID로 잡은
+    LOCK과 실제 티켓 ID로 잡은 LOCK이 같은 순서를 공유함
+    """
+    if hash_tags_enabled():
+        return f"seat_fence:{event_tag(event_id)}"
+    return f"seat_fence:{event_id}"
+
+
+# ============================================================================
+# 좌석 홀드 (사용자 단위)
+# ============================================================================
+
+def seat_hold(user_id: int, hold_id: str) -> str:
+    """홀드 정보 HASH (이벤트, 좌석 목록, 생성/만료 시각)"""
+    if hash_tags_enabled():
+        return f"seat_hold:{user_tag(user_id)}:{hold_id}"
+    return f"seat_hold:user:{user_id}:{hold_id}"
+
+
+def user_seat_holds(user_id: int) -> str:
+    """사용자별 홀드 ID SET (전체 해제/목록 조회용)"""
+    if hash_tags_enabled():
+        return f"seat_holds:{user_tag(user_id)}"
+    return f"seat_holds:user:{user_id}"
+
+
+# ============================================================================
+# 예매 이벤트 (아웃박스 릴레이 → Stream → 소비자)
+# ============================================================================
+
+def booking_events() -> str:
+    """예매 이벤트 Stream (전체 이벤트 공용, 소비자 그룹별로 처리)"""
+    return "booking_events"
+
+
+def booking_events_dead_letter() -> str:
+    """처리 횟수 한도를 넘긴 예매 이벤트 Stream (소비자 그룹 공용, 수동 확인/재처리용)"""
+    return f"{booking_events()}:dead_letter"
+
+
+def booking_stats(event_id: int) -> str:
+    """이벤트별 예매 통계 HASH (예매/취소 좌석 수, 매출)"""
+    if hash_tags_enabled():
+        return f"booking_stats:{event_tag(event_id)}"
+    return f"booking_stats:{event_id}"
+
+
+def booking_stats_applied(event_id: int, outbox_id: int) -> str:
+    """통계에 반영한 아웃박스 ID 표시 (같은 메시지 재전달 시 중복 집계 방지, 통계 HASH와 같은 슬롯)"""
+    if hash_tags_enabled():
+        return f"booking_stats_applied:{event_tag(event_id)}:{outbox_id}"
+    return f"booking_stats_applied:{event_id}:{outbox_id}"
@@ -5,24 +5,215 @@ Redis 서비스: 분산 LOCK 및 캐싱 관리
 import redis
 import time
 import uuid
-from typing import Optional
+from typing import Dict, List, Optional
 from contextlib import contextmanager
+from redis.cache import CacheConfig
+from redis.cluster import ClusterNode, RedisCluster
 from app.core.config import settings
+from app.services import redis_keys
+from app.services.near_cache import NearCache
+
+# 좌석 캐시 인덱스 SET 유지 시간 (초, 좌석 캐시 TTL의 상한)
+SEAT_INDEX_TTL = 3600
+# 무효화 시 DEL 한 번에 삭제할 키 수
+SEAT_INVALIDATE_BATCH = 500
+
+# 값이 일치할 때만 삭제 (LOCK/리스 보유자 확인 후 해제)
+# KEYS[1] = 키, ARGV[1] = 기대 값
+COMPARE_AND_DELETE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# 값이 일치할 때만 만료 시간 연장
+# KEYS[1] = 키, ARGV[1] = 기대 값, ARGV[2] = 만료 시간 (초)
+COMPARE_AND_EXPIRE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# 값이 접두사로 시작할 때만 삭제 (해당 사용자의 좌석 LOCK만 해제)
+# KEYS[1] = 키, ARGV[1] = 접두사 ("{user_id}:")
+DELETE_IF_PREFIX_LUA = """
+local value = redis.call('GET', KEYS[1])
+if value and string.sub(value, 1, string.len(ARGV[1])) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# hold_seat 실패 결과 (성공 시에는 양수 펜싱 토큰 반환)
+HOLD_CONFLICT = 0          # 다른 사용자가 보유 중
+HOLD_LIMIT_EXCEEDED = -1   # 사용자의 회차별 최대 좌석 수 초과
+
+# 좌석 홀드 스크립트 공통: 사용자 홀드 ZSET(회차 단위, member: 티켓 ID, score: LOCK 만료 시각 ms)을
+# LOCK과 같은 스크립트에서 갱신하므로 LOCK 보유 수와 카운터가 어긋나지 않음 (만료된 항목은 획득 시 정리)
+# 시각은 Redis 서버 시각(TIME) 사용
+
+# LOCK이 없거나 같은 사용자의 LOCK이면 새 값으로 설정 (좌석 홀드 획득/이전) + 사용자 좌석 수 제한
+# 획득할 때마다 이벤트 펜싱 카운터를 INCR 해 토큰으로 반환 (DB의 tickets.lock_version과 비교)
+# 카운터가 없으면(최초 또는 Redis 데이터 유실) 서버 시각(초 * 10^6)에서 시작해 이전에 발급한 토큰보다 작아지지 않음
+# KEYS[1] = 좌석 LOCK 키, KEYS[2] = 사용자 홀드 ZSET, KEYS[3] = 이벤트 펜싱 카운터
+# ARGV[1] = 사용자 접두사 ("{user_id}:"), ARGV[2] = LOCK 값, ARGV[3] = 만료 시간 (초),
+# ARGV[4] = 티켓 ID, ARGV[5] = 최대 좌석 수 (0이면 제한 없음)
+# 반환: 펜싱 토큰 (양수) / HOLD_CONFLICT / HOLD_LIMIT_EXCEEDED
+HOLD_SEAT_LUA = """
+local value = redis.call('GET', KEYS[1])
+if value ~= false and string.sub(value, 1, string.len(ARGV[1])) ~= ARGV[1] then
+    return 0
+end
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local ttl_ms = tonumber(ARGV[3]) * 1000
+local limit = tonumber(ARGV[5])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now_ms)
+if limit > 0 and redis.call('ZSCORE', KEYS[2], ARGV[4]) == false and redis.call('ZCARD', KEYS[2]) >= limit then
+    return -1
+end
+redis.call('SET', KEYS[1], ARGV[2], 'PX', ttl_ms)
+redis.call('ZADD', KEYS[2], now_ms + ttl_ms, ARGV[4])
+if redis.call('PTTL', KEYS[2]) < ttl_ms then
+    redis.call('PEXPIRE', KEYS[2], ttl_ms)
+end
+if redis.call('EXISTS', KEYS[3]) == 0 then
+    redis.call('SET', KEYS[3], now[1] .. '000000')
+end
+return redis.call('INCR', KEYS[3])
+"""
+
+# 값이 일치할 때만 LOCK 만료 시간 연장 + 사용자 홀드 ZSET 갱신
+# KEYS[1] = 좌석 LOCK 키, KEYS[2] = 사용자 홀드 ZSET, ARGV[1] = LOCK 값, ARGV[2] = 만료 시간 (초), ARGV[3] = 티켓 ID
+RENEW_SEAT_LUA = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local ttl_ms = tonumber(ARGV[2]) * 1000
+redis.call('PEXPIRE', KEYS[1], ttl_ms)
+redis.call('ZADD', KEYS[2], now_ms + ttl_ms, ARGV[3])
+if redis.call('PTTL', KEYS[2]) < ttl_ms then
+    redis.call('PEXPIRE', KEYS[2], ttl_ms)
+end
+return 1
+"""
+
+# 값이 일치할 때만 LOCK 삭제 + 사용자 홀드 ZSET에서 제거
+# KEYS[1] = 좌석 LOCK 키, KEYS[2] = 사용자 홀드 ZSET, ARGV[1] = LOCK 값, ARGV[2] = 티켓 ID
+RELEASE_SEAT_LUA = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('ZREM', KEYS[2], ARGV[2])
+return 1
+"""
 
 class RedisService:
     """Redis 분산 LOCK 및 캐싱 서비스"""
     
     def __init__(self):
-        self.client = redis.Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            db=settings.REDIS_DB,
-            password=settings.REDIS_PASSWORD,
-            decode_responses=True,
-            socket_connect_timeout=5,
-            socket_timeout=5,
-            retry_on_timeout=True
-        )
+        if settings.REDIS_CLUSTER_NODES:
+            # Redis Cluster: 이벤트 단위 키는 redis_keys의 해시 태그로 같은 슬롯에 배치
+            connection_kwargs = dict(
+                startup_nodes=[
+                    ClusterNode(*node.strip().rsplit(":", 1))
+                    for node in settings.REDIS_CLUSTER_NODES.split(",") if node.strip()
+                ],
+                password=settings.REDIS_PASSWORD,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+            )
+            self.client = RedisCluster(decode_responses=True, **connection_kwargs)
+            self.binary_client = RedisCluster(decode_responses=False, **connection_kwargs)
+            client_class = RedisCluster
+        else:
+            connection_kwargs = dict(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                retry_on_timeout=True
+            )
+            self.client = redis.Redis(decode_responses=True, **connection_kwargs)
+            # 바이너리 클라이언트 (압축된 응답 본문 등 bytes 값 저장용)
+            self.binary_client = redis.Redis(decode_responses=False, **connection_kwargs)
+            client_class = redis.Redis
+        # client-side caching 클라이언트 (RESP3 CLIENT TRACKING, get_near로 지정한 키만 조회)
+        self.near_client = None
+        self.near_cache = None
+        if settings.REDIS_NEAR_CACHE_SIZE > 0:
+            self.near_cache = NearCache(CacheConfig(max_size=settings.REDIS_NEAR_CACHE_SIZE))
+            self.near_client = client_class(
+                decode_responses=True, protocol=3, cache=self.near_cache, **connection_kwargs
+            )
+        # Lua 스크립트 레지스트리 (이름 → Script)
+        self._scripts = {}
+        self.register_script("compare_and_delete", COMPARE_AND_DELETE_LUA)
+        self.register_script("compare_and_expire", COMPARE_AND_EXPIRE_LUA)
+        self.register_script("delete_if_prefix", DELETE_IF_PREFIX_LUA)
+        self.register_script("hold_seat", HOLD_SEAT_LUA)
+        self.register_script("renew_seat", RENEW_SEAT_LUA)
+        self.register_script("release_seat", RELEASE_SEAT_LUA)
+    
+    def register_script(self, name: str, source: str) -> None:
+        """
+        Lua 스크립트 등록
+        
+        스크립트 본문은 등록 시 한 번만 SHA로 변환되고, 실행은 EVALSHA로 SHA만 전송합니다.
+        Redis 재시작 등으로 스크립트 캐시가 비어 있으면(NOSCRIPT) 자동으로 다시 로드합니다.
+        """
+        self._scripts[name] = self.client.register_script(source)
+    
+    def run_script(self, name: str, keys: List[str], args: List = None, client=None):
+        """
+        등록된 Lua 스크립트 실행 (EVALSHA)
+        
+        client에 파이프라인을 넘기면 명령만 쌓이고 결과는 execute()에서 받습니다.
+        """
+        # 클라이언트가 교체되어도(테스트 등) 현재 클라이언트로 실행
+        return self._scripts[name](keys=keys, args=args or [], client=client or self.client)
+    
+    def get_near(self, key: str) -> Optional[str]:
+        """
+        자주 읽고 드물게 바뀌는 키 조회 (client-side caching)
+        
+        값은 워커 메모리에 보관되고 키가 변경되면 서버 푸시로 무효화되므로, 반복 조회는
+        Redis 왕복 없이 처리됩니다. 캐시 세대 번호, 대기열 배치 커서처럼 모든 요청이 읽지만
+        변경은 드문 키에만 사용합니다 (자주 바뀌는 키는 무효화 푸시만 늘어남).
+        """
+        return self.get_near_many([key])[0]
+    
+    def get_near_many(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        여러 키를 한 번에 조회 (get_near 참고, 명령 단위로 캐시됨)
+        
+        Cluster에서는 같은 슬롯의 키만 함께 조회할 수 있습니다 (redis_keys 해시 태그 사용).
+        """
+        client = self.near_client
+        if client is not None:
+            try:
+                values = client.mget(keys) if len(keys) > 1 else [client.get(keys[0])]
+                self.near_cache.record_lookups()
+                return values
+            except redis.ResponseError:
+                # RESP3/CLIENT TRACKING을 지원하지 않는 서버 (Redis 6 미만): 일반 조회로 전환
+                self.near_client = None
+        if len(keys) > 1:
+            return self.client.mget(keys)
+        return [self.client.get(keys[0])]
+    
+    def near_cache_stats(self) -> dict:
+        """client-side caching 지표 (현재 워커 기준, 비활성화 시 enabled=False)"""
+        if self.near_client is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.near_cache.snapshot()}
     
     def ping(self) -> bool:
         """Redis 연결 확인"""
@@ -32,13 +223,14 @@ class RedisService:
             return False
     
     @contextmanager
-    def lock_seat(self, ticket_id: int, timeout: int = None):
+    def lock_seat(self, ticket_id: int, timeout: int = None, event_id: Optional[int] = None):
         """
         좌석 LOCK 획득 (Context Manager)
         
         Args:
             ticket_id: 티켓 ID
             timeout: LOCK 타임아웃 (초), 기본값은 설정값 사용
+            event_id: 이벤트 ID (해시 태그 키 생성용, 같은 좌석은 항상 같은 값으로 호출)
             
         Yields:
             bool: LOCK 획득 성공 여부
@@ -46,7 +238,7 @@ class RedisService:
         Raises:
             Exception: LOCK 획득 실패 시
         """
-        lock_key = f"seat_lock:{ticket_id}"
+        lock_key = redis_keys.seat_lock(ticket_id, event_id)
         lock_value = str(uuid.uuid4())
         lock_timeout = timeout or settings.SEAT_LOCK_TIMEOUT
         
@@ -69,16 +261,11 @@ class RedisService:
             # LOCK 해제 (Lua 스크립트로 원자적 연산)
             if acquired:
                 # 자신이 설정한 값인지 확인 후 삭제 (다른 프로세스가 만료 후 재획득한 경우 방지)
-                lua_script = """
-                if redis.call("get", KEYS[1]) == ARGV[1] then
-                    return redis.call("del", KEYS[1])
-                else
-                    return 0
-                end
-                """
-                self.client.eval(lua_script, 1, lock_key, lock_value)
+                self.run_script("compare_and_delete", [lock_key], [lock_value])
     
-    def try_lock_seat(self, ticket_id: int, timeout: int = None, user_id: int = None) -> bool:
+    def try_lock_seat(
+        self, ticket_id: int, timeout: int = None, user_id: int = None, event_id: Optional[int] = None
+    ) -> bool:
         """
         좌석 LOCK 시도 (논블로킹)
         
@@ -86,11 +273,12 @@ class RedisService:
             ticket_id: 티켓 ID
             timeout: LOCK 타임아웃 (초)
             user_id: 사용자 ID (같은 사용자의 중복 요청 허용용)
+            event_id: 이벤트 ID (해시 태그 키 생성용)
             
         Returns:
             bool: LOCK 획득 성공 여부
         """
-        lock_key = f"seat_lock:{ticket_id}"
+        lock_key = redis_keys.seat_lock(ticket_id, event_id)
         lock_timeout = timeout or settings.SEAT_LOCK_TIMEOUT
         
         try:
@@ -109,40 +297,128 @@ class RedisService:
         except Exception:
             return False
     
-    def unlock_seat(self, ticket_id: int, user_id: Optional[int] = None):
+    def unlock_seat(self, ticket_id: int, user_id: Optional[int] = None, event_id: Optional[int] = None):
         """
         좌석 LOCK 해제
         
         Args:
             ticket_id: 티켓 ID
             user_id: 사용자 ID (제공되면 해당 사용자의 LOCK만 해제)
+            event_id: 이벤트 ID (해시 태그 키 생성용)
         """
-        lock_key = f"seat_lock:{ticket_id}"
+        lock_key = redis_keys.seat_lock(ticket_id, event_id)
         try:
             if user_id:
-                # 사용자 ID가 제공되면 해당 사용자의 LOCK만 해제
-                lock_value = self.client.get(lock_key)
-                if lock_value and ":" in lock_value:
-                    lock_user_id = int(lock_value.split(":")[0])
-                    if lock_user_id == user_id:
-                        self.client.delete(lock_key)
+                # 사용자 ID가 제공되면 해당 사용자의 LOCK만 해제 (확인과 삭제를 원자적으로)
+                self.run_script("delete_if_prefix", [lock_key], [f"{user_id}:"])
             else:
                 # 사용자 ID가 없으면 무조건 삭제
                 self.client.delete(lock_key)
         except Exception:
             pass
     
-    def get_lock_user_id(self, ticket_id: int) -> Optional[int]:
+    def hold_seat(
+        self,
+        ticket_id: int,
+        lock_value: str,
+        user_id: int,
+        timeout: int = None,
+        event_id: Optional[int] = None,
+        schedule_id: Optional[int] = None,
+    ) -> int:
+        """
+        좌석 홀드용 LOCK 획득 (seat_hold_service 참고)
+        
+        LOCK이 없거나 같은 사용자의 LOCK이면 lock_value("{user_id}:{hold_id}")로 설정합니다.
+        같은 사용자가 다시 선택한 좌석은 새 홀드로 이전되어 이전 홀드의 해제/갱신 대상에서 빠집니다.
+        사용자가 회차에서 보유한 좌석이 SEAT_HOLD_MAX_PER_USER에 도달했으면 같은 왕복에서 거부합니다.
+        
+        획득에 성공하면 펜싱 토큰을 반환합니다. 같은 좌석의 토큰은 나중에 획득할수록 크므로,
+        DB 쓰기를 "저장된 토큰 < 내 토큰" 조건으로 하면 LOCK 만료 후 늦게 도착한 쓰기가 거부됩니다.
+        
+        Returns:
+            int: 펜싱 토큰 (양수), HOLD_CONFLICT(다른 사용자가 보유 중), HOLD_LIMIT_EXCEEDED
+        """
+        return int(self.run_script(
+            "hold_seat",
+            [
+                redis_keys.seat_lock(ticket_id, event_id),
+                redis_keys.user_held_seats(event_id, schedule_id, user_id),
+                redis_keys.seat_fence(event_id),
+            ],
+            [
+                f"{user_id}:",
+                lock_value,
+                timeout or settings.SEAT_LOCK_TIMEOUT,
+                ticket_id,
+                settings.SEAT_HOLD_MAX_PER_USER,
+            ],
+        ))
+    
+    def release_seat_holds(
+        self,
+        ticket_ids: List[int],
+        lock_value: str,
+        user_id: int,
+        event_id: Optional[int] = None,
+        schedule_id: Optional[int] = None,
+    ) -> int:
+        """
+        hold_seat으로 잡은 LOCK 일괄 해제 (값이 일치하는 LOCK만, 사용자 좌석 수에서도 제외)
+        
+        Returns:
+            int: 해제된 LOCK 수 (Redis 오류 시 0, 남은 LOCK은 만료 시각에 정리됨)
+        """
+        if not ticket_ids:
+            return 0
+        held_seats_key = redis_keys.user_held_seats(event_id, schedule_id, user_id)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for ticket_id in ticket_ids:
+                self.run_script(
+                    "release_seat", [redis_keys.seat_lock(ticket_id, event_id), held_seats_key],
+                    [lock_value, ticket_id], client=pipe
+                )
+            return sum(1 for released in pipe.execute() if released)
+        except Exception:
+            return 0
+    
+    def renew_seat_holds(
+        self,
+        ticket_ids: List[int],
+        lock_value: str,
+        user_id: int,
+        timeout: int,
+        event_id: Optional[int] = None,
+        schedule_id: Optional[int] = None,
+    ) -> List[bool]:
+        """
+        hold_seat으로 잡은 LOCK 일괄 연장 (한 번의 왕복)
+        
+        Returns:
+            List[bool]: 티켓별 연장 여부 (만료되었거나 다른 값으로 바뀐 LOCK은 False)
+        """
+        held_seats_key = redis_keys.user_held_seats(event_id, schedule_id, user_id)
+        pipe = self.client.pipeline(transaction=False)
+        for ticket_id in ticket_ids:
+            self.run_script(
+                "renew_seat", [redis_keys.seat_lock(ticket_id, event_id), held_seats_key],
+                [lock_value, timeout, ticket_id], client=pipe
+            )
+        return [bool(renewed) for renewed in pipe.execute()]
+    
+    def get_lock_user_id(self, ticket_id: int, event_id: Optional[int] = None) -> Optional[int]:
         """
         LOCK을 가지고 있는 사용자 ID 조회
         
         Args:
             ticket_id: 티켓 ID
+            event_id: 이벤트 ID (해시 태그 키 생성용)
             
         Returns:
             Optional[int]: 사용자 ID, LOCK이 없거나 형식이 맞지 않으면 None
         """
-        lock_key = f"seat_lock:{ticket_id}"
+        lock_key = redis_keys.seat_lock(ticket_id, event_id)
         try:
             lock_value = self.client.get(lock_key)
             if lock_value and ":" in lock_value:
@@ -161,7 +437,7 @@ class RedisService:
     
     def cache_seat_status(self, event_id: int, schedule_id: Optional[int], seat_key: str, available: bool, ttl: int = 300):
         """
-        좌석 상태 캐싱
+        좌석 상태 캐싱 (단일 좌석, cache_seat_statuses 참고)
         
         Args:
             event_id: 이벤트 ID
@@ -170,9 +446,30 @@ class RedisService:
             available: 예약 가능 여부
             ttl: 캐시 만료 시간 (초, 기본 5분)
         """
-        cache_key = self._get_seat_cache_key(event_id, schedule_id, seat_key)
+        self.cache_seat_statuses(event_id, schedule_id, {seat_key: available}, ttl)
+    
+    def cache_seat_statuses(self, event_id: int, schedule_id: Optional[int], statuses: Dict[str, bool], ttl: int = 300):
+        """
+        좌석 상태 일괄 캐싱
+        
+        스케줄당 하나의 HASH(필드: 좌석 키, 값: "1"/"0")에 MULTI로 저장하고 TTL을 갱신합니다.
+        
+        Args:
+            event_id: 이벤트 ID
+            schedule_id: 스케줄 ID
+            statuses: {좌석 키: 예약 가능 여부}
+            ttl: 캐시 만료 시간 (초, 기본 5분, 스케줄 HASH 단위)
+        """
+        if not statuses:
+            return
+        cache_key = self._get_seat_cache_key(event_id, schedule_id)
+        mapping = {seat_key: "1" if available else "0" for seat_key, available in statuses.items()}
         try:
-            self.client.setex(cache_key, ttl, "1" if available else "0")
+            pipe = self.client.pipeline(transaction=True)
+            pipe.hset(cache_key, mapping=mapping)
+            pipe.expire(cache_key, min(ttl, SEAT_INDEX_TTL))
+            self._add_to_event_index(pipe, event_id, schedule_id)
+            pipe.execute()
         except Exception:
             pass
     
@@ -183,28 +480,61 @@ class RedisService:
         Returns:
             bool: 예약 가능 여부, None: 캐시 미스
         """
-        cache_key = self._get_seat_cache_key(event_id, schedule_id, seat_key)
+        cache_key = self._get_seat_cache_key(event_id, schedule_id)
         try:
-            value = self.client.get(cache_key)
+            value = self.client.hget(cache_key, seat_key)
             if value is None:
                 return None
             return value == "1"
         except Exception:
             return None
     
+    def get_seat_statuses(
+        self, event_id: int, schedule_id: Optional[int], seat_keys: Optional[List[str]] = None
+    ) -> Dict[str, Optional[bool]]:
+        """
+        캐시된 좌석 상태 일괄 조회 (한 번의 왕복)
+        
+        Args:
+            seat_keys: 조회할 좌석 키 목록 (None이면 캐시된 전체 좌석, HGETALL)
+        
+        Returns:
+            {좌석 키: 예약 가능 여부 또는 None(캐시 미스)}, Redis 오류 시 모두 캐시 미스
+        """
+        cache_key = self._get_seat_cache_key(event_id, schedule_id)
+        try:
+            if seat_keys is None:
+                values = self.client.hgetall(cache_key)
+            else:
+                values = dict(zip(seat_keys, self.client.hmget(cache_key, seat_keys))) if seat_keys else {}
+        except Exception:
+            return {seat_key: None for seat_key in seat_keys or []}
+        return {seat_key: None if value is None else value == "1" for seat_key, value in values.items()}
+    
     def invalidate_seat_cache(self, event_id: int, schedule_id: Optional[int] = None):
         """
         좌석 상태 캐시 무효화
         
+        스케줄별 좌석 HASH와 좌석 목록 캐시를 삭제합니다 (KEYS 패턴 검색 없음).
+        이벤트 전체 무효화는 이벤트 인덱스 SET에 기록된 스케줄만 삭제합니다.
+        
         Args:
             event_id: 이벤트 ID
             schedule_id: 스케줄 ID (None이면 해당 이벤트의 모든 스케줄)
         """
-        pattern = f"seat_status:{event_id}:*" if schedule_id is None else f"seat_status:{event_id}:{schedule_id}:*"
+        event_index_key = self._get_event_seat_index_key(event_id)
         try:
-            keys = self.client.keys(pattern)
-            if keys:
-                self.client.delete(*keys)
+            if schedule_id is None:
+                schedule_parts = list(self.client.smembers(event_index_key))
+                keys = [event_index_key]
+            else:
+                schedule_parts = [schedule_id]
+                keys = []
+            for schedule_part in schedule_parts:
+                keys.append(redis_keys.seat_status(event_id, schedule_part))
+                keys.append(redis_keys.event_seats(event_id, schedule_part))
+            for start in range(0, len(keys), SEAT_INVALIDATE_BATCH):
+                self.client.delete(*keys[start:start + SEAT_INVALIDATE_BATCH])
         except Exception:
             pass
     
@@ -219,16 +549,19 @@ class RedisService:
             ttl: 캐시 만료 시간 (초, 기본 1분)
         """
         import json
-        cache_key = f"event_seats:{event_id}:{schedule_id or 'all'}"
+        cache_key = redis_keys.event_seats(event_id, schedule_id)
         try:
-            self.client.setex(cache_key, ttl, json.dumps(seats_data))
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(cache_key, json.dumps(seats_data), ex=min(ttl, SEAT_INDEX_TTL))
+            self._add_to_event_index(pipe, event_id, schedule_id)
+            pipe.execute()
         except Exception:
             pass
     
     def get_cached_event_seats(self, event_id: int, schedule_id: Optional[int]) -> Optional[dict]:
         """캐시된 이벤트 좌석 목록 조회"""
         import json
-        cache_key = f"event_seats:{event_id}:{schedule_id or 'all'}"
+        cache_key = redis_keys.event_seats(event_id, schedule_id)
         try:
             data = self.client.get(cache_key)
             if data:
@@ -237,10 +570,19 @@ class RedisService:
             pass
         return None
     
-    def _get_seat_cache_key(self, event_id: int, schedule_id: Optional[int], seat_key: str) -> str:
-        """좌석 캐시 키 생성"""
-        schedule_part = str(schedule_id) if schedule_id else "all"
-        return f"seat_status:{event_id}:{schedule_part}:{seat_key}"
+    def _add_to_event_index(self, pipe, event_id: int, schedule_id: Optional[int]):
+        """이벤트 전체 무효화를 위해 스케줄을 이벤트 인덱스 SET에 등록"""
+        event_index_key = self._get_event_seat_index_key(event_id)
+        pipe.sadd(event_index_key, str(schedule_id) if schedule_id else "all")
+        pipe.expire(event_index_key, SEAT_INDEX_TTL)
+    
+    def _get_seat_cache_key(self, event_id: int, schedule_id: Optional[int]) -> str:
+        """스케줄별 좌석 상태 HASH 키 생성"""
+        return redis_keys.seat_status(event_id, schedule_id)
+    
+    def _get_event_seat_index_key(self, event_id: int) -> str:
+        """이벤트별 캐시된 스케줄 목록 SET"""
+        return redis_keys.seat_cache_index(event_id)
 
 
 # 싱글톤 인스턴스
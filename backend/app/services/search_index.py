@@ -0,0 +1,226 @@
+"""
+이벤트 검색 인덱스: 프로세스 내 역색인 (한국어 bigram 토큰화 + 관련도 순위)
+
+LIKE '%키워드%' 스캔 대신 워커마다 이벤트 역색인을 메모리에 유지합니다.
+- 토큰화: 단어 단위 + 문자 bigram (조사/띄어쓰기에 강한 한국어 부분 일치)
+- 순위: 필드 가중치(제목 > 장르 > 장소 > 설명) × IDF × 키워드 커버리지
+- 동기화: events 캐시 네임스페이스 세대가 바뀌면 마지막 동기화 이후 변경된 이벤트만 다시 색인
+"""
+import math
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.event import Event
+from app.services.cache_service import cache_service, EVENTS_NAMESPACE
+
+# 필드별 가중치
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "genre": 2.0,
+    "sub_genre": 2.0,
+    "location": 1.5,
+    "description": 1.0,
+}
+
+# 키워드별 최소 커버리지 (키워드 bigram 중 문서에 존재해야 하는 비율)
+MIN_COVERAGE = 0.6
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize(text: Optional[str]) -> str:
+    """유니코드 정규화(NFKC) + 소문자 변환"""
+    if not text:
+        return ""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def word_grams(word: str) -> List[str]:
+    """단어의 문자 bigram (한 글자 단어는 그 자체)"""
+    if len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """색인용 토큰: 단어 토큰("w:단어")과 bigram 토큰"""
+    tokens = []
+    for word in WORD_PATTERN.findall(normalize(text)):
+        tokens.append(f"w:{word}")
+        tokens.extend(word_grams(word))
+    return tokens
+
+
+def title_key(text: Optional[str]) -> str:
+    """제목 비교용 키 (정규화 후 공백 제거)"""
+    return "".join(WORD_PATTERN.findall(normalize(text)))
+
+
+def _event_fields(event) -> Dict[str, Optional[str]]:
+    return {
+        "title": event.title,
+        "genre": event.genre.value if event.genre else None,
+        "sub_genre": event.sub_genre.value if event.sub_genre else None,
+        "location": event.location,
+        "description": event.description,
+    }
+
+
+class EventSearchIndex:
+    """이벤트 역색인 (워커 단위)"""
+
+    def __init__(self):
+        # 색인 자료구조 보호 (검색/갱신, DB 조회 중에는 잡지 않음)
+        self._lock = threading.Lock()
+        # 동기화 직렬화 (DB 조회 동안 잡고 있어도 검색은 막지 않음)
+        self._sync_lock = threading.Lock()
+        # 토큰 → {event_id: 가중 빈도}
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        # event_id → 색인된 토큰 (갱신/삭제용)
+        self._doc_tokens: Dict[int, Set[str]] = {}
+        # 공백 제거한 정규화 제목 → event_id 집합 (정확한 제목 일치 조회용)
+        self._titles: Dict[str, Set[int]] = defaultdict(set)
+        self._doc_titles: Dict[int, str] = {}
+        self._version: Optional[int] = None
+        self._watermark: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens)
+
+    def upsert(self, event) -> None:
+        """이벤트 색인 추가/갱신"""
+        with self._lock:
+            self._upsert(event)
+
+    def remove(self, event_id: int) -> None:
+        """이벤트 색인 제거"""
+        with self._lock:
+            self._remove(event_id)
+
+    def ensure_fresh(self, db: Session) -> None:
+        """
+        카탈로그 세대가 바뀌었으면 색인 동기화 (동기 DB/Redis 호출, async 핸들러에서는 스레드에서 실행)
+        처음에는 전체 색인, 이후에는 마지막 동기화 이후 생성/수정된 이벤트만 다시 색인하고,
+        더 이상 카탈로그에 없는 이벤트는 색인에서 제거합니다.
+        """
+        version = cache_service.namespace_version(EVENTS_NAMESPACE)
+        if version == self._version:
+            return
+
+        with self._sync_lock:
+            if version == self._version:
+                return
+            # DB 조회는 색인 LOCK 밖에서 (조회 동안에도 검색은 이전 색인으로 응답)
+            changed_at = func.coalesce(Event.updated_at, Event.created_at)
+            query = db.query(Event)
+            if self._watermark is not None:
+                query = query.filter(changed_at >= self._watermark)
+            # 삭제된 이벤트 제거 (변경분 조회로는 보이지 않으므로 ID 목록과 비교)
+            live_ids = {event_id for (event_id,) in db.query(Event.id)}
+            events = query.all()
+
+            watermark = self._watermark
+            for event in events:
+                event_changed_at = event.updated_at or event.created_at
+                if event_changed_at and (watermark is None or event_changed_at > watermark):
+                    watermark = event_changed_at
+
+            with self._lock:
+                for event_id in set(self._doc_tokens) - live_ids:
+                    self._remove(event_id)
+                for event in events:
+                    self._upsert(event)
+            self._watermark = watermark
+            self._version = version
+
+    def match_title(self, text: str) -> Optional[int]:
+        """
+        정확한 제목 일치 조회 (공백/대소문자 무시)
+
+        Returns:
+            제목이 정확히 일치하는 이벤트가 하나뿐이면 그 ID, 아니면 None
+        """
+        event_ids = self._titles.get(title_key(text))
+        if event_ids and len(event_ids) == 1:
+            return next(iter(event_ids))
+        return None
+
+    def search(self, keywords: List[str], limit: int = 10) -> List[Tuple[int, float]]:
+        """
+        키워드로 이벤트 검색 (관련도 내림차순)
+
+        Args:
+            keywords: 검색 키워드 리스트
+            limit: 최대 반환 개수
+
+        Returns:
+            (event_id, 점수) 리스트
+        """
+        scores: Dict[int, float] = defaultdict(float)
+        with self._lock:
+            total_docs = max(len(self._doc_tokens), 1)
+            for keyword in keywords:
+                for word in WORD_PATTERN.findall(normalize(keyword)):
+                    grams = list(dict.fromkeys(word_grams(word)))
+                    matched: Dict[int, int] = defaultdict(int)
+                    partial: Dict[int, float] = defaultdict(float)
+                    for gram in grams:
+                        postings = self._postings.get(gram, {})
+                        idf = math.log(1 + total_docs / (len(postings) or 1))
+                        for event_id, weight in postings.items():
+                            matched[event_id] += 1
+                            partial[event_id] += idf * weight
+                    # 단어 전체 일치 가산점
+                    exact = self._postings.get(f"w:{word}", {})
+                    for event_id, coverage_hits in matched.items():
+                        coverage = coverage_hits / len(grams)
+                        if coverage < MIN_COVERAGE:
+                            continue
+                        score = partial[event_id] * coverage * coverage
+                        if event_id in exact:
+                            score *= 1.5
+                        scores[event_id] += score
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+    def _upsert(self, event) -> None:
+        self._remove(event.id)
+        weights: Dict[str, float] = defaultdict(float)
+        for field, text in _event_fields(event).items():
+            tokens = tokenize(text)
+            if not tokens:
+                continue
+            # 긴 설명이 점수를 독점하지 않도록 필드 길이로 정규화
+            norm = 1.0 / math.sqrt(len(tokens))
+            for token in tokens:
+                weights[token] += FIELD_WEIGHTS[field] * norm
+        for token, weight in weights.items():
+            self._postings[token][event.id] = weight
+        self._doc_tokens[event.id] = set(weights)
+        key = title_key(event.title)
+        if key:
+            self._titles[key].add(event.id)
+            self._doc_titles[event.id] = key
+
+    def _remove(self, event_id: int) -> None:
+        for token in self._doc_tokens.pop(event_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(event_id, None)
+                if not postings:
+                    del self._postings[token]
+        key = self._doc_titles.pop(event_id, None)
+        if key is not None:
+            self._titles[key].discard(event_id)
+            if not self._titles[key]:
+                del self._titles[key]
+
+
+# 싱글톤 인스턴스
+search_index = EventSearchIndex()
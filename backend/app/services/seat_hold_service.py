@@ -0,0 +1,264 @@
+"""
+좌석 홀드 서비스: 좌석 선택 ~ 예매 완료 사이의 좌석 LOCK 수명 관리
+
+- 홀드: 한 번의 좌석 선택으로 잠근 좌석 묶음 (hold_id), 좌석 LOCK 값은 "{user_id}:{hold_id}"
+- 하트비트: SEAT_LOCK_TIMEOUT만큼 연장하되 생성 후 SEAT_HOLD_MAX_LIFETIME을 넘기지 않음
+- 해제: 홀드 단위 또는 사용자의 모든 홀드 (사용자별 홀드 인덱스 SET)
+- LOCK은 값이 일치할 때만 연장/삭제하므로 만료 후 다른 사용자가 잡은 좌석에는 영향 없음
+- 회차별 1인 최대 좌석 수(SEAT_HOLD_MAX_PER_USER)는 LOCK 스크립트 안에서 확인 (redis_service.hold_seat)
+
+홀드 정보는 사용자 해시 태그 키에, 좌석 LOCK은 이벤트 해시 태그 키에 저장됩니다 (redis_keys).
+"""
+import hashlib
+import json
+import math
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.services import redis_keys
+from app.services.redis_service import redis_service, HOLD_LIMIT_EXCEEDED
+
+# 홀드 생성 실패 시 다른 홀드에서 이전해 온 좌석 LOCK을 이전 값으로 되돌림 (남은 만료 시간 유지)
+# KEYS[1] = 좌석 LOCK 키, ARGV[1] = 이번 홀드의 LOCK 값, ARGV[2] = 이전 LOCK 값
+RESTORE_SEAT_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl > 0 then
+    redis.call('SET', KEYS[1], ARGV[2], 'PX', ttl)
+else
+    redis.call('SET', KEYS[1], ARGV[2])
+end
+return 1
+"""
+redis_service.register_script("restore_seat_lock", RESTORE_SEAT_LOCK_LUA)
+
+
+class SeatUnavailableError(Exception):
+    """다른 사용자가 보유 중인 좌석"""
+
+    def __init__(self, seat: dict):
+        super().__init__(f"Seat {seat['row']}-{seat['number']} is held by another user")
+        self.seat = seat
+
+
+class SeatHoldLimitError(Exception):
+    """회차별 1인 최대 좌석 수 초과"""
+
+    def __init__(self, limit: int):
+        super().__init__(f"Seat hold limit exceeded ({limit} per user)")
+        self.limit = limit
+
+
+def temporary_ticket_id(event_id: int, schedule_id: Optional[int], row: str, number: int) -> int:
+    """
+    아직 티켓 행이 없는 좌석의 LOCK용 임시 ID
+
+    실행(프로세스)마다 값이 달라지는 hash() 대신 고정 해시를 사용해 모든 워커가 같은 LOCK 키를 쓰고,
+    실제 티켓 ID와 겹치지 않도록 음수로 만듭니다 (응답으로 나가므로 JavaScript 안전 정수 범위인 48비트).
+    """
+    seat_key = f"{event_id}:{schedule_id or 0}:{row}:{number}"
+    digest = hashlib.blake2b(seat_key.encode("utf-8"), digest_size=6).digest()
+    return -(int.from_bytes(digest, "big") + 1)
+
+
+@dataclass
+class SeatHold:
+    """사용자의 좌석 홀드"""
+    hold_id: str
+    user_id: int
+    event_id: int
+    schedule_id: Optional[int]
+    seats: List[Dict] = field(default_factory=list)  # [{"row", "number", "ticket_id"}]
+    created_at: float = 0.0
+    expires_at: float = 0.0
+
+    @property
+    def lock_value(self) -> str:
+        return f"{self.user_id}:{self.hold_id}"
+
+    @property
+    def max_expires_at(self) -> float:
+        return self.created_at + settings.SEAT_HOLD_MAX_LIFETIME
+
+
+class SeatHoldService:
+    """좌석 홀드 생성/연장/해제/조회"""
+
+    def acquire(self, user_id: int, event_id: int, schedule_id: Optional[int], seats: List[Dict]) -> SeatHold:
+        """
+        좌석을 모두 잠그고 홀드 생성
+
+        Args:
+            seats: [{"row", "number", "ticket_id"}] (ticket_id는 실제 또는 임시 티켓 ID)
+
+        Raises:
+            SeatUnavailableError: 다른 사용자가 보유 중인 좌석이 있음 (이미 잠근 좌석은 되돌림)
+            SeatHoldLimitError: 회차에서 보유한 좌석이 최대 좌석 수를 넘음 (이미 잠근 좌석은 되돌림)
+        """
+        now = time.time()
+        hold = SeatHold(
+            hold_id=uuid.uuid4().hex,
+            user_id=user_id,
+            event_id=event_id,
+            schedule_id=schedule_id,
+            created_at=now,
+            expires_at=now + settings.SEAT_LOCK_TIMEOUT,
+        )
+        # 같은 사용자의 다른 홀드에 있던 좌석은 이 홀드로 이전되므로, 실패 시 되돌릴 이전 LOCK 값을 기억
+        previous = self._own_lock_values(user_id, event_id, seats)
+        try:
+            for seat in seats:
+                result = redis_service.hold_seat(
+                    seat["ticket_id"], hold.lock_value, user_id, settings.SEAT_LOCK_TIMEOUT, event_id, schedule_id
+                )
+                if result == HOLD_LIMIT_EXCEEDED:
+                    raise SeatHoldLimitError(settings.SEAT_HOLD_MAX_PER_USER)
+                if result <= 0:
+                    raise SeatUnavailableError(seat)
+                hold.seats.append(seat)
+        except Exception:
+            # 하나라도 실패하면 새로 잠근 좌석은 해제하고, 이전해 온 좌석은 원래 홀드로 되돌림
+            self._rollback(hold, previous)
+            raise
+
+        self._save(hold)
+        return hold
+
+    def renew(self, user_id: int, hold_id: str) -> Optional[SeatHold]:
+        """
+        하트비트: 홀드의 좌석 LOCK 만료 시간 연장
+
+        Returns:
+            연장된 홀드 (아직 보유 중인 좌석만 포함), 만료되었거나 최대 유지 시간에 도달했으면 None
+        """
+        hold = self.get(user_id, hold_id)
+        if hold is None:
+            return None
+
+        now = time.time()
+        expires_at = min(now + settings.SEAT_LOCK_TIMEOUT, hold.max_expires_at)
+        if expires_at <= now:
+            self.release(user_id, hold_id)
+            return None
+
+        ttl = math.ceil(expires_at - now)
+        renewed = redis_service.renew_seat_holds(
+            [seat["ticket_id"] for seat in hold.seats], hold.lock_value, user_id, ttl, hold.event_id, hold.schedule_id
+        )
+
+        # 만료 후 다른 사용자가 잡았거나 다른 홀드로 이전된 좌석은 제외
+        hold.seats = [seat for seat, ok in zip(hold.seats, renewed) if ok]
+        if not hold.seats:
+            self._delete(hold)
+            return None
+        hold.expires_at = expires_at
+        self._save(hold)
+        return hold
+
+    def release(self, user_id: int, hold_id: Optional[str] = None) -> int:
+        """
+        홀드 해제 (hold_id가 없으면 사용자의 모든 홀드)
+
+        Returns:
+            해제된 좌석 수
+        """
+        hold_ids = [hold_id] if hold_id else list(redis_service.client.smembers(redis_keys.user_seat_holds(user_id)))
+        released = 0
+        for current_id in hold_ids:
+            hold = self.get(user_id, current_id)
+            if hold is None:
+                redis_service.client.srem(redis_keys.user_seat_holds(user_id), current_id)
+                continue
+            released += self._release_locks(hold)
+            self._delete(hold)
+        return released
+
+    def list_holds(self, user_id: int) -> List[SeatHold]:
+        """사용자의 유효한 홀드 목록 (만료된 홀드는 인덱스에서 정리)"""
+        index_key = redis_keys.user_seat_holds(user_id)
+        holds = []
+        for hold_id in redis_service.client.smembers(index_key):
+            hold = self.get(user_id, hold_id)
+            if hold is None:
+                redis_service.client.srem(index_key, hold_id)
+            else:
+                holds.append(hold)
+        return sorted(holds, key=lambda hold: hold.created_at)
+
+    def get(self, user_id: int, hold_id: str) -> Optional[SeatHold]:
+        """홀드 조회 (없거나 만료되었으면 None)"""
+        raw = redis_service.client.hgetall(redis_keys.seat_hold(user_id, hold_id))
+        if not raw:
+            return None
+        return SeatHold(
+            hold_id=hold_id,
+            user_id=user_id,
+            event_id=int(raw["event_id"]),
+            schedule_id=int(raw["schedule_id"]) if raw.get("schedule_id") else None,
+            seats=json.loads(raw["seats"]),
+            created_at=float(raw["created_at"]),
+            expires_at=float(raw["expires_at"]),
+        )
+
+    def _save(self, hold: SeatHold) -> None:
+        """홀드 정보 저장 (좌석 LOCK과 같은 시각에 만료) + 사용자 인덱스 등록"""
+        hold_key = redis_keys.seat_hold(hold.user_id, hold.hold_id)
+        index_key = redis_keys.user_seat_holds(hold.user_id)
+        pipe = redis_service.client.pipeline(transaction=True)
+        pipe.hset(hold_key, mapping={
+            "event_id": hold.event_id,
+            "schedule_id": hold.schedule_id or "",
+            "seats": json.dumps(hold.seats, ensure_ascii=False),
+            "created_at": hold.created_at,
+            "expires_at": hold.expires_at,
+        })
+        pipe.pexpireat(hold_key, int(hold.expires_at * 1000))
+        pipe.sadd(index_key, hold.hold_id)
+        pipe.expire(index_key, settings.SEAT_HOLD_MAX_LIFETIME)
+        pipe.execute()
+
+    def _delete(self, hold: SeatHold) -> None:
+        pipe = redis_service.client.pipeline(transaction=True)
+        pipe.delete(redis_keys.seat_hold(hold.user_id, hold.hold_id))
+        pipe.srem(redis_keys.user_seat_holds(hold.user_id), hold.hold_id)
+        pipe.execute()
+
+    def _own_lock_values(self, user_id: int, event_id: int, seats: List[Dict]) -> Dict[int, str]:
+        """좌석 중 이 사용자가 이미 (다른 홀드로) 잠근 좌석의 현재 LOCK 값 (티켓 ID → LOCK 값)"""
+        if not seats:
+            return {}
+        ticket_ids = [seat["ticket_id"] for seat in seats]
+        # 좌석 LOCK 키는 이벤트 해시 태그로 같은 슬롯이므로 한 번의 MGET으로 조회
+        values = redis_service.client.mget([redis_keys.seat_lock(ticket_id, event_id) for ticket_id in ticket_ids])
+        prefix = f"{user_id}:"
+        return {
+            ticket_id: value
+            for ticket_id, value in zip(ticket_ids, values)
+            if value and value.startswith(prefix)
+        }
+
+    def _rollback(self, hold: SeatHold, previous: Dict[int, str]) -> None:
+        """실패한 홀드 생성 되돌리기: 새로 잠근 좌석은 해제, 이전해 온 좌석은 이전 LOCK 값으로 복원"""
+        moved = [seat for seat in hold.seats if seat["ticket_id"] in previous]
+        hold.seats = [seat for seat in hold.seats if seat["ticket_id"] not in previous]
+        self._release_locks(hold)
+        for seat in moved:
+            redis_service.run_script(
+                "restore_seat_lock",
+                [redis_keys.seat_lock(seat["ticket_id"], hold.event_id)],
+                [hold.lock_value, previous[seat["ticket_id"]]],
+            )
+
+    def _release_locks(self, hold: SeatHold) -> int:
+        """홀드 값이 그대로인 좌석 LOCK만 삭제(사용자 좌석 수에서도 제외)하고 삭제 수를 반환"""
+        return redis_service.release_seat_holds(
+            [seat["ticket_id"] for seat in hold.seats], hold.lock_value, hold.user_id, hold.event_id, hold.schedule_id
+        )
+
+
+# 싱글톤 인스턴스
+seat_hold_service = SeatHoldService()
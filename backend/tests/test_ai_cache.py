@@ -0,0 +1,66 @@
+"""
+AI 결과 캐시 테스트
+
+질의 정규화, 로컬 LRU 동작, 카탈로그 세대 변경 시 검색 결과 무효화를 확인합니다.
+"""
+import asyncio
+import pytest
+import time
+import uuid
+from app.services.ai_cache import ai_cache, normalize_query, INTENT, KEYWORDS, SEARCH
+from app.services.cache_service import cache_service, EVENTS_NAMESPACE
+from app.services.local_cache import LocalTTLCache
+from app.services.redis_service import redis_service
+
+
+def test_normalize_query():
+    assert normalize_query("  조용필  콘서트 예매해줘!! ") == "조용필 콘서트 예매해줘"
+    assert normalize_query("ＢＴＳ 콘서트?") == normalize_query("bts 콘서트")
+    assert normalize_query("   ") == ""
+
+
+def test_local_cache_lru_and_ttl():
+    cache = LocalTTLCache(maxsize=2, ttl=0.2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    # 가장 오래 사용되지 않은 b가 제거됨
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    time.sleep(0.25)
+    assert cache.get("a") is None
+
+
+@pytest.fixture
+def query():
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+    return f"테스트 질의 {uuid.uuid4().hex[:8]}"
+
+
+def test_keywords_shared_across_normalized_queries(query):
+    ai_cache.set(KEYWORDS, query, ["조용필"], ttl=60)
+    assert ai_cache.get(KEYWORDS, f"  {query}!! ") == ["조용필"]
+
+
+def test_search_result_invalidated_on_catalog_change(query):
+    ai_cache.set(SEARCH, query, {"event_id": 1}, ttl=60)
+    assert ai_cache.get(SEARCH, query) == {"event_id": 1}
+
+    cache_service.bump_namespace(EVENTS_NAMESPACE)
+    assert ai_cache.get(SEARCH, query) is None
+
+
+def test_corrupt_entry_is_cache_miss(query):
+    redis_service.client.set(ai_cache._key(INTENT, query), "{not json", ex=60)
+    assert ai_cache.get(INTENT, query) is None
+
+
+def test_async_access_round_trip(query):
+    async def round_trip():
+        await ai_cache.set_async(KEYWORDS, query, ["임영웅"], ttl=60)
+        return await ai_cache.get_async(KEYWORDS, query)
+
+    assert asyncio.run(round_trip()) == ["임영웅"]
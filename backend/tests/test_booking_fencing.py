@@ -0,0 +1,138 @@
+"""
+좌석 LOCK 펜싱 토큰 테스트
+
+SQLite 파일 DB로 예매 쓰기가 펜싱 토큰 조건부로 처리되는지 확인합니다.
+- 같은 좌석의 LOCK 토큰은 획득할수록 증가
+- LOCK 만료 후 늦게 도착한 (더 작은 토큰의) 예매 쓰기는 409로 거부
+- 같은 좌석 티켓은 유니크 인덱스로 하나만 생성
+"""
+import random
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+import app.models  # noqa: F401 (모든 모델 등록)
+from app.core.dependencies import get_current_user
+from app.database import Base, get_db
+from app.main import app
+from app.models.booking import Booking, BookingStatus
+from app.models.event import Event
+from app.models.ticket import Ticket, TicketGrade
+from app.models.user import User
+from app.models.venue import Venue
+from app.services import redis_keys
+from app.services.redis_service import redis_service
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+    engine = create_engine(f"sqlite:///{tmp_path / 'fencing.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def seeded(session_factory):
+    db = session_factory()
+    users = [
+        User(email=f"{uuid.uuid4().hex}@example.com", username=f"fencing{index}", hashed_password="x")
+        for index in range(2)
+    ]
+    db.add_all(users)
+    venue = Venue(name="테스트 공연장", location="서울", seat_map={})
+    db.add(venue)
+    db.flush()
+    # 테스트마다 다른 이벤트 ID (Redis 키 충돌 방지)
+    event = Event(id=random.randint(10_000_000, 99_999_999), title="펜싱 테스트", location="서울", venue_id=venue.id)
+    db.add(event)
+    db.commit()
+    yield db, event.id, [user.id for user in users]
+    redis_service.client.delete(redis_keys.seat_fence(event.id))
+    db.close()
+
+
+def booking_client(session_factory, user_id: int) -> TestClient:
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def override_current_user():
+        db = session_factory()
+        try:
+            return db.get(User, user_id)
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_current_user
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def clear_overrides():
+    yield
+    app.dependency_overrides.clear()
+
+
+def book(client: TestClient, event_id: int):
+    return client.post("/api/v1/bookings", json={
+        "event_id": event_id,
+        "seats": [{"row": "1", "number": 1, "grade": "VIP", "price": 1000}],
+        "total_price": 1000,
+        "receipt_method": "on_site",
+    })
+
+
+def test_fence_tokens_increase_per_acquisition(seeded):
+    _, event_id, (user_a, user_b) = seeded
+    first = redis_service.hold_seat(1, f"{user_a}:x", user_a, event_id=event_id)
+    redis_service.client.delete(redis_keys.seat_lock(1, event_id))
+    second = redis_service.hold_seat(1, f"{user_b}:y", user_b, event_id=event_id)
+    assert 0 < first < second
+    redis_service.release_seat_holds([1], f"{user_b}:y", user_b, event_id)
+
+
+def test_stale_fence_token_rejected(seeded, session_factory, monkeypatch):
+    db, event_id, (user_a, user_b) = seeded
+
+    # 사용자 B가 좌석을 예매한 뒤 취소 (티켓 행은 B의 토큰을 가진 채 남음)
+    response = book(booking_client(session_factory, user_b), event_id)
+    assert response.status_code == 200
+    ticket = db.query(Ticket).filter(Ticket.event_id == event_id).one()
+    assert ticket.lock_version > 0
+    db.query(Booking).update({Booking.status: BookingStatus.CANCELLED})
+    db.commit()
+
+    # 사용자 A의 요청이 B보다 먼저 LOCK을 받았지만 처리가 지연되어 LOCK이 만료된 경우 (더 작은 토큰)
+    stale_token = ticket.lock_version - 1
+    monkeypatch.setattr(redis_service, "hold_seat", lambda *args, **kwargs: stale_token)
+    response = book(booking_client(session_factory, user_a), event_id)
+    assert response.status_code == 409
+    db.expire_all()
+    assert db.query(Booking).filter(Booking.user_id == user_a).count() == 0
+    assert db.get(Ticket, ticket.id).lock_version == stale_token + 1
+
+
+def test_one_ticket_per_seat(seeded):
+    db, event_id, _ = seeded
+    for _ in range(2):
+        db.add(Ticket(event_id=event_id, seat_row="2", seat_number=1, grade=TicketGrade.VIP, price=1000))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+
+
+def test_unnumbered_tickets_not_unique(seeded):
+    db, event_id, _ = seeded
+    for _ in range(2):
+        db.add(Ticket(event_id=event_id, seat_row=None, seat_number=None, grade=TicketGrade.VIP, price=1000))
+    db.commit()
+    assert db.query(Ticket).filter(Ticket.event_id == event_id, Ticket.seat_row.is_(None)).count() == 2
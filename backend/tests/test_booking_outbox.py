@@ -0,0 +1,210 @@
+"""
+예매 이벤트 아웃박스 테스트
+
+SQLite 파일 DB와 테스트별 Stream으로 예매 후 처리가 아웃박스 → 릴레이 → 소비자 경로로만
+일어나는지, 소비자의 재처리/중복 전달이 안전한지 확인합니다.
+"""
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+import app.models  # noqa: F401 (모든 모델 등록)
+from app.core.config import settings
+from app.core.dependencies import get_current_user
+from app.database import Base, get_db
+from app.main import app
+from app.models.booking_outbox import BookingOutbox
+from app.models.event import Event
+from app.models.user import User
+from app.models.venue import Venue
+from app.services import booking_events as events_module
+from app.services import redis_keys
+from app.services.booking_events import (
+    BOOKING_CREATED, BookingEvent, BookingStatsConsumer, OutboxRelay, SeatAvailabilityConsumer, get_booking_stats
+)
+from app.services.cache_service import seat_map_namespace
+from app.services.redis_service import redis_service
+from app.services.seat_hold_service import temporary_ticket_id
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+    name = f"booking_events:test-{uuid.uuid4().hex}"
+    monkeypatch.setattr(redis_keys, "booking_events", lambda: name)
+    yield name
+    redis_service.client.delete(name, redis_keys.booking_events_dead_letter())
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch, stream):
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(events_module, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def seeded(session_factory):
+    db = session_factory()
+    user = User(email=f"{uuid.uuid4().hex}@example.com", username="outbox", hashed_password="x")
+    db.add(user)
+    venue = Venue(name="테스트 공연장", location="서울", seat_map={})
+    db.add(venue)
+    db.flush()
+    event = Event(id=random.randint(10_000_000, 99_999_999), title="아웃박스 테스트", location="서울", venue_id=venue.id)
+    db.add(event)
+    db.commit()
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield db, event.id, user.id
+    app.dependency_overrides.clear()
+    redis_service.client.delete(
+        redis_keys.booking_stats(event.id), redis_keys.seat_fence(event.id), f"cache_gen:{seat_map_namespace(event.id)}"
+    )
+    db.close()
+
+
+def make_event(event_id: int, outbox_id: int = 1) -> BookingEvent:
+    return BookingEvent(outbox_id, BOOKING_CREATED, event_id, None, {
+        "user_id": 1, "lock_value": "1:x", "hold_id": None,
+        "locked_ticket_ids": [1], "ticket_ids": [1], "booking_ids": [1], "total_price": 1000,
+    })
+
+
+def test_booking_side_effects_run_through_outbox(seeded):
+    db, event_id, user_id = seeded
+    response = TestClient(app).post("/api/v1/bookings", json={
+        "event_id": event_id,
+        "seats": [{"row": "1", "number": 1, "grade": "VIP", "price": 1000}],
+        "total_price": 1000,
+        "receipt_method": "on_site",
+    })
+    assert response.status_code == 200
+
+    # 응답 시점: 이벤트만 기록되고 LOCK/캐시는 그대로
+    row = db.query(BookingOutbox).one()
+    assert row.event_type == BOOKING_CREATED and row.published_at is None
+    lock_id = temporary_ticket_id(event_id, None, "1", 1)
+    assert redis_service.get_lock_user_id(lock_id, event_id=event_id) == user_id
+    generation_key = f"cache_gen:{seat_map_namespace(event_id)}"
+    before = int(redis_service.client.get(generation_key) or 0)
+
+    consumers = [SeatAvailabilityConsumer(), BookingStatsConsumer()]
+    for consumer in consumers:
+        consumer.ensure_group()
+    assert OutboxRelay().relay_once() == 1
+    db.expire_all()
+    assert db.query(BookingOutbox).one().published_at is not None
+    assert [consumer.consume_once() for consumer in consumers] == [1, 1]
+
+    assert redis_service.get_lock_user_id(lock_id, event_id=event_id) is None
+    assert int(redis_service.client.get(generation_key)) == before + 1
+    assert get_booking_stats(event_id) == {"booked_seats": 1, "cancelled_seats": 0, "revenue": 1000.0}
+
+    # 전달 완료 행은 보관 기간이 지나면 정리
+    db.query(BookingOutbox).update({BookingOutbox.published_at: datetime.now(timezone.utc) - timedelta(days=2)})
+    db.commit()
+    assert OutboxRelay().relay_once() == 0
+    assert db.query(BookingOutbox).count() == 0
+
+
+def test_side_effects_run_inline_when_outbox_disabled(seeded, monkeypatch):
+    db, event_id, user_id = seeded
+    monkeypatch.setattr(settings, "BOOKING_OUTBOX_ENABLED", False)
+    generation_key = f"cache_gen:{seat_map_namespace(event_id)}"
+    before = int(redis_service.client.get(generation_key) or 0)
+    response = TestClient(app).post("/api/v1/bookings", json={
+        "event_id": event_id,
+        "seats": [{"row": "1", "number": 1, "grade": "VIP", "price": 1000}],
+        "total_price": 1000,
+        "receipt_method": "on_site",
+    })
+    assert response.status_code == 200
+
+    # 아웃박스 없이 응답 전에 LOCK 해제와 좌석 배치도 세대 증가가 끝남
+    assert db.query(BookingOutbox).count() == 0
+    lock_id = temporary_ticket_id(event_id, None, "1", 1)
+    assert redis_service.get_lock_user_id(lock_id, event_id=event_id) is None
+    assert int(redis_service.client.get(generation_key)) == before + 1
+
+
+def test_stats_applied_once_per_outbox_id(seeded):
+    _, event_id, _ = seeded
+    consumer = BookingStatsConsumer()
+    consumer.handle(make_event(event_id))
+    consumer.handle(make_event(event_id))
+    assert get_booking_stats(event_id)["booked_seats"] == 1
+
+
+def test_failed_message_is_reclaimed(stream, seeded, monkeypatch):
+    _, event_id, _ = seeded
+
+    class FlakyConsumer(BookingStatsConsumer):
+        group = "flaky"
+        failures = 1
+
+        def handle(self, event):
+            if FlakyConsumer.failures:
+                FlakyConsumer.failures -= 1
+                raise RuntimeError("일시 오류")
+            super().handle(event)
+
+    consumer = FlakyConsumer()
+    consumer.ensure_group()
+    redis_service.client.xadd(stream, make_event(event_id).to_fields())
+
+    # 실패한 메시지는 확인하지 않고 남겨둠
+    assert consumer.consume_once() == 0
+    assert redis_service.client.xpending(stream, "flaky")["pending"] == 1
+
+    # 대기 시간이 지나면 (다른 소비자가) 회수해 다시 처리
+    monkeypatch.setattr(settings, "BOOKING_CONSUMER_CLAIM_IDLE_MS", 0)
+    assert FlakyConsumer(consumer_name="other").consume_once() == 1
+    assert redis_service.client.xpending(stream, "flaky")["pending"] == 0
+    assert get_booking_stats(event_id)["booked_seats"] == 1
+
+
+def test_poison_message_moved_to_dead_letter(stream, seeded, monkeypatch):
+    _, event_id, _ = seeded
+
+    class PoisonConsumer(BookingStatsConsumer):
+        group = "poison"
+
+        def handle(self, event):
+            if event.outbox_id == 1:
+                raise RuntimeError("처리 불가")
+            super().handle(event)
+
+    monkeypatch.setattr(settings, "BOOKING_CONSUMER_MAX_DELIVERIES", 2)
+    monkeypatch.setattr(settings, "BOOKING_CONSUMER_CLAIM_IDLE_MS", 0)
+    consumer = PoisonConsumer()
+    consumer.batch_size = 1
+    consumer.ensure_group()
+    redis_service.client.xadd(stream, make_event(event_id, outbox_id=1).to_fields())
+    assert consumer.consume_once() == 0
+
+    # 회수한 메시지가 실패해도 새 메시지는 같은 호출에서 처리 (회수가 새 메시지를 막지 않음)
+    redis_service.client.xadd(stream, make_event(event_id, outbox_id=2).to_fields())
+    assert consumer.consume_once() == 2
+    assert get_booking_stats(event_id)["booked_seats"] == 1
+
+    # 전달 횟수 한도를 넘긴 메시지는 dead-letter Stream으로 옮기고 확인
+    assert redis_service.client.xpending(stream, "poison")["pending"] == 0
+    dead = redis_service.client.xrange(redis_keys.booking_events_dead_letter())
+    assert len(dead) == 1
+    assert dead[0][1]["group"] == "poison" and dead[0][1]["outbox_id"] == "1"
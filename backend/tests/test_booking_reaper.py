@@ -0,0 +1,121 @@
+"""
+결제 대기 예매 만료 처리기 테스트
+
+SQLite 파일 DB로 만료 예매만 배치 취소되는지(좌석 반환 이벤트는 아웃박스 → 소비자 경유),
+Redis 리스로 한 노드만 실행되는지 확인합니다.
+"""
+import json
+import uuid
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+import app.models  # noqa: F401 (모든 모델 등록)
+from app.database import Base
+from app.models.booking import Booking, BookingStatus
+from app.models.event import Event
+from app.models.ticket import Ticket, TicketGrade
+from app.models.user import User
+from app.models.venue import Venue
+from app.services import booking_events as events_module
+from app.services import booking_reaper as reaper_module
+from app.services.booking_events import OutboxRelay, SeatAvailabilityConsumer, seat_availability_channel
+from app.services.booking_reaper import BookingReaper, LEASE_KEY
+from app.services.redis_service import redis_service
+
+
+@pytest.fixture
+def redis_available():
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+    redis_service.client.delete(LEASE_KEY)
+    yield
+    redis_service.client.delete(LEASE_KEY)
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'reaper.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(reaper_module, "SessionLocal", factory)
+    monkeypatch.setattr(events_module, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+def add_bookings(db, event_id: int, ages_in_seconds, status=BookingStatus.PENDING):
+    user = db.query(User).first()
+    now = datetime.now(timezone.utc)
+    # 좌석별 티켓은 하나뿐이므로 호출마다 이어지는 좌석 번호 사용
+    first_number = db.query(Ticket).filter(Ticket.event_id == event_id).count() + 1
+    for index, age in enumerate(ages_in_seconds):
+        ticket = Ticket(event_id=event_id, seat_row="A", seat_number=first_number + index, grade=TicketGrade.VIP, price=1000)
+        db.add(ticket)
+        db.flush()
+        db.add(Booking(
+            user_id=user.id, ticket_id=ticket.id, status=status,
+            total_price=1000, booked_at=now - timedelta(seconds=age),
+        ))
+    db.commit()
+
+
+@pytest.fixture
+def seeded(session_factory):
+    db = session_factory()
+    db.add(User(email=f"{uuid.uuid4().hex}@example.com", username="reaper", hashed_password="x"))
+    venue = Venue(name="테스트 공연장", location="서울", seat_map={})
+    db.add(venue)
+    db.flush()
+    event = Event(title="만료 테스트", location="서울", venue_id=venue.id)
+    db.add(event)
+    db.commit()
+    yield db, event.id
+    db.close()
+
+
+def test_reap_once_cancels_only_expired_pending(redis_available, seeded):
+    db, event_id = seeded
+    add_bookings(db, event_id, [1000, 2000, 3000])
+    add_bookings(db, event_id, [10])
+    add_bookings(db, event_id, [5000], status=BookingStatus.CONFIRMED)
+
+    pubsub = redis_service.client.pubsub()
+    pubsub.subscribe(seat_availability_channel(event_id))
+    pubsub.get_message(timeout=1)
+
+    reaper = BookingReaper(pending_ttl=600, batch_size=2, interval=1)
+    assert reaper.reap_once() == 3
+
+    statuses = sorted(status.value for (status,) in db.query(Booking.status).all())
+    assert statuses == ["cancelled"] * 3 + ["confirmed", "pending"]
+
+    # 배치(2건 + 1건)마다 아웃박스 이벤트 → 소비자가 좌석 반환 이벤트 발행
+    consumer = SeatAvailabilityConsumer()
+    consumer.ensure_group()
+    assert OutboxRelay(batch_size=10).relay_once() == 2
+    assert consumer.consume_once() == 2
+    released = []
+    for _ in range(2):
+        message = pubsub.get_message(timeout=1)
+        released.extend(json.loads(message["data"])["ticket_ids"])
+    assert len(released) == 3
+    pubsub.close()
+
+    assert reaper.reap_once() == 0
+
+
+def test_lease_held_by_one_node(redis_available):
+    first = BookingReaper(interval=1)
+    second = BookingReaper(interval=1)
+
+    assert first.acquire_lease()
+    # 보유자는 연장 가능, 다른 노드는 획득 불가
+    assert first.acquire_lease()
+    assert not second.acquire_lease()
+
+    first.release_lease()
+    assert second.acquire_lease()
+    # 보유자가 아니면 해제되지 않음
+    first.release_lease()
+    assert redis_service.client.get(LEASE_KEY) == second.owner
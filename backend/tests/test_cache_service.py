@@ -0,0 +1,184 @@
+"""
+버전 기반 캐시 서비스 테스트
+
+세대 카운터 무효화, 워커 내 단일 비행(single-flight), stale-while-revalidate 동작을 확인합니다.
+"""
+import pytest
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from app.services.cache_service import cache_service
+from app.services.redis_service import redis_service
+
+
+@pytest.fixture
+def namespace():
+    """테스트마다 고유한 네임스페이스 사용"""
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+    return f"test_ns_{uuid.uuid4().hex[:8]}"
+
+
+def test_bump_namespace_invalidates(namespace):
+    """세대 증가 후에는 새로 계산되어야 함"""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"count": len(calls)}
+
+    first = cache_service.get_or_compute(namespace, "k", loader, ttl=60, beta=0)
+    second = cache_service.get_or_compute(namespace, "k", loader, ttl=60, beta=0)
+    assert first == second == {"count": 1}
+
+    cache_service.bump_namespace(namespace)
+    third = cache_service.get_or_compute(namespace, "k", loader, ttl=60, beta=0)
+    assert third == {"count": 2}
+
+
+def test_single_flight_on_cold_miss(namespace):
+    """동시 캐시 미스에서 loader는 한 번만 실행되어야 함"""
+    calls = []
+    lock = threading.Lock()
+
+    def loader():
+        with lock:
+            calls.append(1)
+        time.sleep(0.3)
+        return [1, 2, 3]
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [
+            executor.submit(cache_service.get_or_compute, namespace, "k", loader, 60, 10, 0)
+            for _ in range(10)
+        ]
+        results = [f.result() for f in futures]
+
+    assert all(r == [1, 2, 3] for r in results)
+    assert len(calls) == 1, f"loader가 {len(calls)}번 실행되었습니다"
+
+
+def test_stale_while_revalidate(namespace):
+    """만료 후 stale 구간에서는 재계산 중에도 이전 값을 반환해야 함"""
+    calls = []
+    started = threading.Event()
+
+    def slow_loader():
+        calls.append(1)
+        if len(calls) > 1:
+            started.set()
+            time.sleep(0.5)
+        return {"version": len(calls)}
+
+    cache_service.get_or_compute(namespace, "k", slow_loader, ttl=1, stale_ttl=30, beta=0)
+    time.sleep(1.1)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        refreshing = executor.submit(
+            cache_service.get_or_compute, namespace, "k", slow_loader, 1, 30, 0
+        )
+        started.wait(timeout=2)
+        stale = cache_service.get_or_compute(namespace, "k", slow_loader, ttl=1, stale_ttl=30, beta=0)
+        assert stale == {"version": 1}
+        assert refreshing.result() == {"version": 2}
+
+
+def test_cached_response_etag(namespace):
+    """캐시된 응답은 ETag를 포함하고, If-None-Match가 같으면 304를 반환해야 함"""
+    from starlette.requests import Request
+
+    def make_request(headers: dict) -> Request:
+        return Request({
+            "type": "http",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        })
+
+    loader = lambda: [{"id": 1, "title": "조용필 콘서트"}]
+
+    response = cache_service.cached_response(make_request({}), namespace, "k", loader, ttl=60)
+    assert response.status_code == 200
+    assert response.body.decode() == '[{"id":1,"title":"조용필 콘서트"}]'
+    etag = response.headers["etag"]
+
+    gzipped = cache_service.cached_response(
+        make_request({"Accept-Encoding": "gzip"}), namespace, "k", loader, ttl=60
+    )
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"] == etag
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+
+    refused = cache_service.cached_response(
+        make_request({"Accept-Encoding": "gzip;q=0, identity"}), namespace, "k", loader, ttl=60
+    )
+    assert "content-encoding" not in refused.headers
+    assert refused.body.decode() == '[{"id":1,"title":"조용필 콘서트"}]'
+
+    not_modified = cache_service.cached_response(
+        make_request({"If-None-Match": etag}), namespace, "k", loader, ttl=60
+    )
+    assert not_modified.status_code == 304
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("GZIP;q=0.5", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.0, *", False),
+    ("*", True),
+    ("*;q=0", False),
+    ("deflate, br", False),
+    ("identity", False),
+    ("", False),
+    (None, False),
+])
+def test_accepts_gzip(header, expected):
+    """Accept-Encoding 토큰과 q 값으로 gzip 협상 (부분 문자열 비교가 아님)"""
+    from app.services.cache_service import accepts_gzip
+    assert accepts_gzip(header) is expected
+
+
+def test_loader_ttl_and_local_layer(namespace):
+    """CachedBody.ttl이 호출부 ttl보다 우선하고, 로컬 캐시도 그 만료 시각을 넘기지 않아야 함"""
+    from app.services.cache_service import CachedBody
+
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return CachedBody(value={"count": len(calls)}, ttl=1)
+
+    entry = cache_service._get_entry(namespace, "k", loader, 60, 0, 0, local_ttl=30)
+    assert entry["expiry"] - time.time() <= 1
+    # 로컬 캐시 히트
+    cache_service._get_entry(namespace, "k", loader, 60, 0, 0, local_ttl=30)
+    assert len(calls) == 1
+
+    time.sleep(1.1)
+    cache_service._get_entry(namespace, "k", loader, 60, 0, 0, local_ttl=30)
+    assert len(calls) == 2
+
+
+def test_async_single_flight_on_cold_miss(namespace):
+    """비동기 버전도 동시 캐시 미스에서 loader를 한 번만 실행해야 함"""
+    import asyncio
+    from starlette.requests import Request
+
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.2)
+        return [1, 2, 3]
+
+    async def scenario():
+        request = Request({"type": "http", "headers": []})
+        return await asyncio.gather(*[
+            cache_service.cached_response_async(request, namespace, "k", loader, ttl=60, beta=0)
+            for _ in range(10)
+        ])
+
+    responses = asyncio.run(scenario())
+    assert all(r.body == b"[1,2,3]" for r in responses)
+    assert len(calls) == 1, f"loader가 {len(calls)}번 실행되었습니다"
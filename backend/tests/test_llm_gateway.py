@@ -0,0 +1,183 @@
+"""
+LLM 게이트웨이 테스트
+
+로컬 스텁 서버(OpenAI 호환 /chat/completions)로 타임아웃, 동시성 제한, 서킷 브레이커,
+이벤트 루프 비차단 동작을 확인합니다.
+"""
+import asyncio
+import json
+import threading
+import time
+import openai
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from app.services.llm_gateway import LLMGateway, LLMUnavailableError, CircuitBreaker
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """OpenAI 채팅 완성 API 스텁"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server = self.server
+        server.request_count += 1
+        time.sleep(server.delay)
+
+        if server.status != 200:
+            body = {"error": {"message": "stub error", "type": "server_error"}}
+        else:
+            body = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "stub",
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": json.dumps(server.result)},
+                    "finish_reason": "stop",
+                }],
+            }
+        payload = json.dumps(body).encode()
+        self.send_response(server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.delay = 0
+    server.status = 200
+    server.result = {"keywords": ["조용필"]}
+    server.request_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_gateway(server, **kwargs):
+    return LLMGateway(api_key="test-key", base_url=server.base_url, model="stub", **kwargs)
+
+
+def test_complete_json(stub_server):
+    gateway = make_gateway(stub_server)
+    result = asyncio.run(gateway.complete_json("system", "user"))
+    assert result == {"keywords": ["조용필"]}
+
+
+def test_timeout_raises_unavailable(stub_server):
+    stub_server.delay = 1.0
+    gateway = make_gateway(stub_server, timeout=0.2)
+
+    started = time.monotonic()
+    with pytest.raises(LLMUnavailableError):
+        asyncio.run(gateway.complete_json("system", "user"))
+    assert time.monotonic() - started < 0.8
+
+
+def test_event_loop_not_blocked(stub_server):
+    """LLM 응답을 기다리는 동안 다른 코루틴이 계속 실행되어야 함"""
+    stub_server.delay = 0.5
+    gateway = make_gateway(stub_server)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.05)
+
+        task = asyncio.create_task(ticker())
+        await gateway.complete_json("system", "user")
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(scenario()) >= 5
+
+
+def test_concurrency_limit(stub_server):
+    stub_server.delay = 0.5
+    gateway = make_gateway(stub_server, max_concurrency=1, queue_timeout=0.1)
+
+    async def scenario():
+        return await asyncio.gather(
+            gateway.complete_json("system", "user"),
+            gateway.complete_json("system", "user"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+    assert sum(isinstance(r, LLMUnavailableError) for r in results) == 1
+    assert stub_server.request_count == 1
+
+
+def test_circuit_breaker_opens_on_repeated_api_errors(stub_server):
+    stub_server.status = 500
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    gateway = make_gateway(stub_server, breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(openai.APIError):
+            asyncio.run(gateway.complete_json("system", "user"))
+    assert breaker.state == "open"
+
+    # 서킷이 열리면 서버를 호출하지 않고 즉시 실패
+    with pytest.raises(LLMUnavailableError):
+        asyncio.run(gateway.complete_json("system", "user"))
+    assert stub_server.request_count == 2
+
+
+def test_circuit_breaker_half_open_recovers():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    time.sleep(0.15)
+    assert breaker.allow()
+    # half-open 상태에서는 시험 호출 하나만 허용
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_half_open_trial_cleared_on_queue_timeout(stub_server):
+    """half-open 시험 호출이 동시성 대기 초과로 끝나도 서킷이 half-open에 갇히지 않음"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    gateway = make_gateway(stub_server, breaker=breaker, max_concurrency=1, queue_timeout=0.1)
+    breaker.record_failure()
+    time.sleep(0.15)
+
+    async def scenario():
+        # 다른 호출이 세마포어를 잡고 있는 동안 시험 호출
+        semaphore = gateway._get_semaphore()
+        await semaphore.acquire()
+        try:
+            with pytest.raises(LLMUnavailableError, match="동시 호출"):
+                await gateway.complete_json("system", "user")
+        finally:
+            semaphore.release()
+        assert breaker.state == "half-open"
+        # 시험 슬롯이 비었으므로 다음 호출이 시험 호출로 나가 성공하면 closed
+        return await gateway.complete_json("system", "user")
+
+    assert asyncio.run(scenario()) == {"keywords": ["조용필"]}
+    assert breaker.state == "closed"
+    assert stub_server.request_count == 1
+
+
+@pytest.mark.parametrize("value, expected", [(12, 12), ("12", 12), (12.0, 12), ("abc", None), (None, None), (True, None), (1.5, None)])
+def test_llm_event_id_coerced_to_int(value, expected):
+    """LLM이 event_id를 문자열로 돌려줘도 후보와 일치해야 하고, 정수가 아니면 null 취급"""
+    from app.api.v1.endpoints.events import coerce_event_id
+    assert coerce_event_id(value) == expected
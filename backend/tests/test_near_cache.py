@@ -0,0 +1,67 @@
+"""
+Redis client-side caching(near cache) 테스트
+
+저장소의 크기 제한/지표는 Redis 없이 확인하고, 서버 푸시 무효화는 Redis 6 이상에서만 확인합니다.
+"""
+import time
+import uuid
+import pytest
+from redis.cache import CacheConfig, CacheEntry, CacheEntryStatus, CacheKey
+from app.services.near_cache import NearCache
+from app.services.redis_service import redis_service
+
+
+def make_entry(key: str, status=CacheEntryStatus.VALID):
+    return CacheEntry(
+        cache_key=CacheKey(command="GET", redis_keys=(key,)),
+        cache_value=b"1",
+        status=status,
+        connection_ref=None,
+    )
+
+
+def test_near_cache_bounded_lru():
+    cache = NearCache(CacheConfig(max_size=2))
+    for key in ["a", "b", "c"]:
+        cache.set(make_entry(key, CacheEntryStatus.IN_PROGRESS))
+
+    assert cache.size == 2
+    assert cache.get(CacheKey(command="GET", redis_keys=("a",))) is None
+    stats = cache.snapshot()
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+
+
+def test_near_cache_counts_invalidations():
+    cache = NearCache(CacheConfig(max_size=10))
+    cache.set(make_entry("cache_gen:events"))
+    cache.set(make_entry("cache_gen:banners"))
+
+    cache.delete_by_redis_keys([b"cache_gen:events", b"missing"])
+    assert cache.size == 1
+    assert cache.snapshot()["invalidations"] == 1
+
+
+def test_get_near_invalidated_by_server_push():
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+    if redis_service.near_client is None:
+        pytest.skip("client-side caching이 비활성화되어 있습니다")
+
+    key = f"cache_gen:test-{uuid.uuid4()}"
+    redis_service.client.set(key, "1", ex=60)
+    try:
+        assert redis_service.get_near(key) == "1"
+        before = redis_service.near_cache_stats()
+        # 두 번째 조회는 워커 메모리에서 응답 (미스 증가 없음)
+        assert redis_service.get_near(key) == "1"
+        assert redis_service.near_cache_stats()["misses"] == before["misses"]
+
+        # 다른 연결에서 변경하면 무효화 푸시로 새 값을 읽음
+        redis_service.client.incr(key)
+        deadline = time.time() + 2
+        while redis_service.get_near(key) != "2" and time.time() < deadline:
+            time.sleep(0.05)
+        assert redis_service.get_near(key) == "2"
+    finally:
+        redis_service.client.delete(key)
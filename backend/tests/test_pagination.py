@@ -0,0 +1,68 @@
+"""
+커서(keyset) 페이지네이션 테스트 (커서 형식 + SQLite 메모리 DB로 페이지 순회)
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException
+from sqlalchemy import Column, DateTime, Integer, create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from app.core.pagination import encode_cursor, decode_cursor, keyset_paginate
+
+PageBase = declarative_base()
+
+
+class Item(PageBase):
+    __tablename__ = "items"
+    id = Column(Integer, primary_key=True)
+    opens_at = Column(DateTime, nullable=True)
+
+
+def test_cursor_round_trip():
+    """커서는 정렬 키 값(datetime 포함)과 id를 그대로 복원해야 함"""
+    created_at = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor("created_at", created_at, 42)
+    assert decode_cursor(cursor, "created_at") == (created_at, 42)
+
+    null_cursor = encode_cursor("-sales_open_date", None, 7)
+    assert decode_cursor(null_cursor, "-sales_open_date") == (None, 7)
+
+
+def test_cursor_is_bound_to_sort():
+    """다른 정렬에서 발급된 커서는 거부해야 함"""
+    cursor = encode_cursor("created_at", None, 1)
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, "-created_at")
+    assert exc_info.value.status_code == 400
+
+
+def test_invalid_cursor():
+    """형식이 잘못된 커서는 400"""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor", "created_at")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_keyset_pages_cover_all_rows_with_nulls_last(descending):
+    """정렬 키 동순위/NULL이 섞여 있어도 페이지를 넘기면 모든 행을 한 번씩, NULL은 마지막에 반환"""
+    engine = create_engine("sqlite://")
+    PageBase.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    base = datetime(2026, 1, 1)
+    opens = [base, base, None, base + timedelta(days=1), None, base + timedelta(days=2), base]
+    db.add_all([Item(id=index + 1, opens_at=value) for index, value in enumerate(opens)])
+    db.commit()
+
+    sort = "-opens_at" if descending else "opens_at"
+    seen, cursor = [], None
+    while True:
+        rows, cursor = keyset_paginate(db.query(Item), sort, Item.opens_at, Item.id, cursor, 2, descending=descending)
+        seen.extend(rows)
+        if cursor is None:
+            break
+
+    valued = sorted((item for item in seen if item.opens_at), key=lambda item: (item.opens_at, item.id), reverse=descending)
+    nulls = sorted((item for item in seen if item.opens_at is None), key=lambda item: item.id, reverse=descending)
+    assert [item.id for item in seen] == [item.id for item in valued + nulls]
+    assert len(seen) == len(opens)
+    db.close()
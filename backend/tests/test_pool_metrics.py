@@ -0,0 +1,64 @@
+"""
+DB 커넥션 풀 지표 테스트
+
+SQLite 파일 DB에 계측 QueuePool을 붙여 체크아웃 집계, 대기 시간, 풀 고갈 시 즉시 실패를 확인합니다.
+"""
+import time
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+from app.services.pool_metrics import PoolMetricsRegistry
+
+
+@pytest.fixture
+def registry_and_engine(tmp_path):
+    registry = PoolMetricsRegistry()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=registry.pool_class("test", QueuePool),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    registry.register("test", engine)
+    yield registry, engine
+    engine.dispose()
+
+
+def test_checkout_metrics(registry_and_engine):
+    registry, engine = registry_and_engine
+
+    connection = engine.connect()
+    stats = registry.snapshot()["test"]
+    assert stats["checked_out"] == 1
+    assert stats["size"] == 1
+    assert stats["pool_class"] == "InstrumentedQueuePool"
+
+    connection.close()
+    with engine.connect():
+        pass
+    stats = registry.snapshot()["test"]
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 0
+
+
+def test_pool_exhaustion_fails_fast(registry_and_engine):
+    registry, engine = registry_and_engine
+
+    with engine.connect():
+        started = time.monotonic()
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+        assert time.monotonic() - started < 1.0
+
+    stats = registry.snapshot()["test"]
+    assert stats["timeouts"] == 1
+    assert stats["wait_max_ms"] >= 200
+
+
+def test_metrics_survive_dispose(registry_and_engine):
+    registry, engine = registry_and_engine
+    engine.dispose()
+    with engine.connect():
+        assert registry.snapshot()["test"]["checked_out"] == 1
@@ -0,0 +1,66 @@
+"""
+로컬 질의 분류기 테스트
+
+의도 규칙, 요청 표현/조사 제거, 제목 일치, 로컬 처리율 지표를 확인합니다.
+"""
+import pytest
+from types import SimpleNamespace
+from app.models.event import EventGenre
+from app.services import query_classifier as qc
+from app.services.search_index import EventSearchIndex
+
+
+@pytest.fixture
+def classifier(monkeypatch):
+    index = EventSearchIndex()
+    for event_id, title in [(1, "조용필 콘서트"), (2, "레미제라블"), (3, "오페라의 유령")]:
+        index.upsert(SimpleNamespace(
+            id=event_id, title=title, genre=EventGenre.CONCERT,
+            sub_genre=None, location="서울", description=None,
+        ))
+    monkeypatch.setattr(qc, "search_index", index)
+    return qc.QueryClassifier(threshold=0.8)
+
+
+@pytest.mark.parametrize("query, intent, confident", [
+    ("조용필 콘서트 예매해줘", "booking", True),
+    ("티켓 구매하고 싶어", "booking", True),
+    ("서울에서 하는 뮤지컬 추천해줘", "search", True),
+    ("어떤 콘서트 있어?", "search", True),
+    ("예매할 만한 공연 찾아줘", "search", False),
+    ("조용필", "search", False),
+])
+def test_classify_intent(classifier, query, intent, confident):
+    result = classifier.classify_intent(query)
+    assert result.value == intent
+    assert classifier.is_confident(result) is confident
+
+
+def test_strip_query_removes_requests_and_particles():
+    assert qc.strip_query("조용필의 콘서트를 예매해줘") == ["조용필", "콘서트"]
+    assert qc.strip_query("서울에서 열리는 뮤지컬 찾아줘") == ["서울", "뮤지컬"]
+    assert qc.strip_query("예매해줘") == []
+
+
+def test_extract_keywords_confident_only_when_in_catalog(classifier):
+    result = classifier.extract_keywords("조용필 콘서트 예매해줘")
+    assert result.value == ["조용필", "콘서트"]
+    assert classifier.is_confident(result)
+
+    result = classifier.extract_keywords("아이유 콘서트 예매해줘")
+    assert not classifier.is_confident(result)
+
+
+def test_match_title(classifier):
+    assert classifier.match_title("레미제라블 예매해줘") == 2
+    assert classifier.match_title("오페라의 유령") == 3
+    assert classifier.match_title("조용필") is None
+
+
+def test_stats(classifier):
+    classifier.record("intent", local=True)
+    classifier.record("intent", local=True)
+    classifier.record("intent", local=False)
+    stats = classifier.stats()
+    assert stats["intent"] == {"local": 2, "llm": 1, "hit_rate": 0.6667}
+    assert stats["keywords"]["hit_rate"] == 0.0
@@ -0,0 +1,86 @@
+"""
+Redis 키 빌더 테스트
+
+해시 태그 모드에서 이벤트 단위 키가 같은 Cluster 슬롯에 배치되는지, 호환 모드에서 기존 키 형식이
+유지되는지 확인합니다. REDIS_CLUSTER_NODES가 설정된 경우 실제 Cluster에서 다중 키 스크립트와
+MULTI를 실행합니다.
+"""
+import asyncio
+import random
+import time
+import pytest
+from redis.crc import key_slot
+from app.core.config import settings
+from app.services import redis_keys
+from app.services.redis_service import redis_service
+
+
+def event_keys(event_id: int):
+    return [
+        redis_keys.queue(event_id),
+        redis_keys.queue_batch_cursor(event_id),
+        redis_keys.queue_batch_last_time(event_id),
+        redis_keys.queue_token(event_id, 7),
+        redis_keys.queue_history(event_id),
+        redis_keys.seat_lock(101, event_id),
+        redis_keys.seat_status(event_id, 3),
+        redis_keys.event_seats(event_id, None),
+        redis_keys.seat_cache_index(event_id),
+        redis_keys.user_held_seats(event_id, 3, 7),
+        redis_keys.seat_fence(event_id),
+        redis_keys.booking_stats(event_id),
+        redis_keys.booking_stats_applied(event_id, 5),
+    ]
+
+
+def test_hash_tagged_keys_share_slot(monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_KEY_HASH_TAGS", True)
+    slots = {key_slot(key.encode()) for key in event_keys(42)}
+    assert len(slots) == 1
+    assert redis_keys.queue(42) == "queue:{e42}"
+    # 다른 이벤트는 (대부분) 다른 슬롯으로 분산
+    assert len({key_slot(redis_keys.queue(event_id).encode()) for event_id in range(100)}) > 50
+
+
+def test_legacy_mode_keeps_existing_keys(monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_KEY_HASH_TAGS", False)
+    monkeypatch.setattr(settings, "REDIS_CLUSTER_NODES", "")
+    assert redis_keys.queue(42) == "queue:event:42"
+    assert redis_keys.queue_token(42, 7) == "queue_token:event:42:user:7"
+    assert redis_keys.seat_lock(101, 42) == "seat_lock:101"
+    assert redis_keys.seat_status(42, None) == "seat_status:42:all"
+
+
+@pytest.fixture
+def cluster_event_id():
+    if not settings.REDIS_CLUSTER_NODES:
+        pytest.skip("REDIS_CLUSTER_NODES가 설정되지 않았습니다")
+    if not redis_service.ping():
+        pytest.skip("Redis Cluster에 연결할 수 없습니다")
+    event_id = random.randint(10_000_000, 99_999_999)
+    yield event_id
+    redis_service.client.delete(*[key for key in event_keys(event_id)])
+
+
+def test_cluster_batch_advance(cluster_event_id):
+    from app.api.v1.endpoints.queue import _try_advance_batch
+
+    now = time.time()
+    redis_service.client.zadd(redis_keys.queue(cluster_event_id), {"1": now, "2": now + 1})
+    cursor = asyncio.run(_try_advance_batch(cluster_event_id))
+    assert cursor == pytest.approx(now + 1)
+
+
+def test_cluster_seat_cache_and_lock(cluster_event_id):
+    redis_service.cache_seat_statuses(cluster_event_id, 3, {"A-1": True, "A-2": False})
+    redis_service.cache_event_seats(cluster_event_id, None, {"A-1": True})
+    assert redis_service.get_seat_statuses(cluster_event_id, 3, ["A-1", "A-2"]) == {"A-1": True, "A-2": False}
+
+    redis_service.invalidate_seat_cache(cluster_event_id)
+    assert redis_service.get_seat_status(cluster_event_id, 3, "A-1") is None
+    assert redis_service.get_cached_event_seats(cluster_event_id, None) is None
+
+    assert redis_service.try_lock_seat(101, user_id=1, event_id=cluster_event_id)
+    assert redis_service.get_lock_user_id(101, event_id=cluster_event_id) == 1
+    redis_service.unlock_seat(101, user_id=1, event_id=cluster_event_id)
+    assert redis_service.get_lock_user_id(101, event_id=cluster_event_id) is None
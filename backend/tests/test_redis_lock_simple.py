@@ -5,6 +5,7 @@
 데이터베이스 연결이 필요 없으므로 더 빠르게 실행할 수 있습니다.
 """
 import pytest
+from app.services import redis_keys
 from app.services.redis_service import redis_service
 import time
 
@@ -121,6 +122,39 @@ def test_concurrent_lock_attempts():
     redis_service.unlock_seat(ticket_id)
 
 
+def test_unlock_only_own_lock():
+    """사용자 ID를 지정한 해제는 해당 사용자의 락만 삭제해야 함"""
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+
+    ticket_id = 99996
+    redis_service.unlock_seat(ticket_id)
+    assert redis_service.try_lock_seat(ticket_id, user_id=1)
+
+    # 다른 사용자(접두사가 겹치는 ID 포함)는 해제할 수 없음
+    redis_service.unlock_seat(ticket_id, user_id=2)
+    redis_service.unlock_seat(ticket_id, user_id=11)
+    assert redis_service.get_lock_user_id(ticket_id) == 1
+
+    redis_service.unlock_seat(ticket_id, user_id=1)
+    assert redis_service.get_lock_user_id(ticket_id) is None
+    print("✅ 본인 락만 해제 테스트 통과")
+
+
+def test_script_reloaded_after_flush():
+    """Redis 스크립트 캐시가 비워져도(NOSCRIPT) 등록된 스크립트가 다시 로드되어야 함"""
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+
+    ticket_id = 99995
+    redis_service.unlock_seat(ticket_id)
+    with redis_service.lock_seat(ticket_id):
+        redis_service.client.script_flush()
+    # lock_seat 종료 시 compare_and_delete 스크립트로 해제됨
+    assert redis_service.client.get(redis_keys.seat_lock(ticket_id)) is None
+    print("✅ 스크립트 재로드 테스트 통과")
+
+
 if __name__ == "__main__":
     """
     테스트 실행 방법:
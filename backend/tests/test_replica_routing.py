@@ -0,0 +1,83 @@
+"""
+읽기 복제본 라우팅 테스트
+
+SQLite 파일을 복제본으로 사용해 라운드 로빈, 장애 복제본 제외/primary 폴백,
+쓰기 직후 read-your-writes 고정을 확인합니다.
+"""
+import asyncio
+import uuid
+import pytest
+from sqlalchemy import text
+from app import database
+from app.database import ReplicaRouter
+from app.services.redis_service import redis_service
+
+
+def replica_name(db) -> str:
+    return db.execute(text("PRAGMA database_list")).fetchone()[2]
+
+
+@pytest.fixture
+def replica_urls(tmp_path):
+    return [f"sqlite:///{tmp_path / 'replica_a.db'}", f"sqlite:///{tmp_path / 'replica_b.db'}"]
+
+
+def test_round_robin(replica_urls):
+    router = ReplicaRouter(replica_urls)
+    names = []
+    for _ in range(4):
+        db = router.open_session()
+        names.append(replica_name(db))
+        db.close()
+    assert names[0] != names[1]
+    assert names[0] == names[2] and names[1] == names[3]
+
+
+def test_unhealthy_replica_is_skipped(tmp_path, replica_urls):
+    # 존재하지 않는 디렉터리의 SQLite 파일은 연결 시 OperationalError
+    broken = f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"
+    router = ReplicaRouter([broken, replica_urls[0]])
+
+    for _ in range(3):
+        db = router.open_session()
+        assert replica_name(db).endswith("replica_a.db")
+        db.close()
+    assert router.replicas[0].down_until > 0
+
+
+def test_falls_back_to_primary_when_all_replicas_down(tmp_path, monkeypatch):
+    primary_url = f"sqlite:///{tmp_path / 'primary.db'}"
+    monkeypatch.setattr(database, "SessionLocal", database.sessionmaker(bind=database.create_engine(primary_url)))
+    router = ReplicaRouter([f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"])
+
+    db = router.open_session()
+    assert replica_name(db).endswith("primary.db")
+    db.close()
+
+
+def test_async_round_robin(replica_urls):
+    pytest.importorskip("aiosqlite")
+    router = ReplicaRouter(replica_urls)
+
+    async def scenario():
+        names = []
+        for _ in range(2):
+            db = await router.open_async_session()
+            result = await db.execute(text("PRAGMA database_list"))
+            names.append(result.fetchone()[2])
+            await db.close()
+        return names
+
+    names = asyncio.run(scenario())
+    assert names[0] != names[1]
+
+
+def test_read_your_writes(replica_urls):
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+    router = ReplicaRouter(replica_urls)
+    scope = database.user_write_scope(f"{uuid.uuid4().hex}@example.com")
+
+    assert not router.has_recent_write(scope)
+    router.mark_write(scope)
+    assert router.has_recent_write(database.CATALOG_WRITE_SCOPE, scope)
@@ -0,0 +1,147 @@
+"""
+이벤트 검색 인덱스 테스트
+
+bigram 부분 일치, 필드 가중치 기반 순위, 색인 갱신/삭제를 확인합니다.
+"""
+from types import SimpleNamespace
+from app.models.event import EventGenre, EventSubGenre
+from app.services.search_index import EventSearchIndex, tokenize
+
+
+def make_event(event_id, title, genre=EventGenre.CONCERT, sub_genre=None, location=None, description=None):
+    return SimpleNamespace(
+        id=event_id,
+        title=title,
+        genre=genre,
+        sub_genre=sub_genre,
+        location=location,
+        description=description,
+    )
+
+
+def build_index(*events):
+    index = EventSearchIndex()
+    for event in events:
+        index.upsert(event)
+    return index
+
+
+def test_tokenize_normalizes_and_splits_bigrams():
+    """NFKC 정규화 + 소문자 변환 후 단어/bigram 토큰 생성"""
+    tokens = tokenize("ＢＴＳ 콘서트")
+    assert "w:bts" in tokens
+    assert "w:콘서트" in tokens
+    assert {"콘서", "서트"} <= set(tokens)
+
+
+def test_partial_match_inside_word():
+    """조사가 붙은 제목도 부분 일치로 검색되어야 함"""
+    index = build_index(
+        make_event(1, "조용필의 50주년 콘서트"),
+        make_event(2, "레미제라블", genre=EventGenre.MUSICAL),
+    )
+    assert [event_id for event_id, _ in index.search(["조용필"])] == [1]
+    assert index.search(["없는공연"]) == []
+
+
+def test_title_ranks_above_description():
+    """제목 일치가 설명 일치보다 높은 순위여야 함"""
+    index = build_index(
+        make_event(1, "여름 페스티벌", description="게스트로 아이유가 출연합니다"),
+        make_event(2, "아이유 콘서트"),
+    )
+    assert [event_id for event_id, _ in index.search(["아이유"])] == [2, 1]
+
+
+def test_genre_and_sub_genre_are_indexed():
+    index = build_index(
+        make_event(1, "공연 A", sub_genre=EventSubGenre.BALLAD),
+        make_event(2, "공연 B", genre=EventGenre.MUSICAL),
+    )
+    assert [event_id for event_id, _ in index.search(["발라드"])] == [1]
+    assert [event_id for event_id, _ in index.search(["뮤지컬"])] == [2]
+
+
+def test_upsert_replaces_and_remove_deletes():
+    index = build_index(make_event(1, "조용필 콘서트"))
+    index.upsert(make_event(1, "임영웅 콘서트"))
+    assert index.search(["조용필"]) == []
+    assert [event_id for event_id, _ in index.search(["임영웅"])] == [1]
+
+    index.remove(1)
+    assert index.search(["임영웅"]) == []
+    assert len(index) == 0
+
+
+def test_ensure_fresh_drops_deleted_events(tmp_path, monkeypatch):
+    """카탈로그 세대가 바뀌면 삭제된 이벤트는 색인에서 빠져야 함"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    import app.models  # noqa: F401 (모든 모델 등록)
+    from app.database import Base
+    from app.models.event import Event
+    from app.models.venue import Venue
+    from app.services import search_index as search_index_module
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    venue = Venue(name="테스트 공연장", location="서울", seat_map={})
+    db.add(venue)
+    db.flush()
+    db.add_all([
+        Event(id=1, title="조용필 콘서트", venue_id=venue.id),
+        Event(id=2, title="임영웅 콘서트", venue_id=venue.id),
+    ])
+    db.commit()
+
+    versions = iter([1, 2])
+    monkeypatch.setattr(search_index_module.cache_service, "namespace_version", lambda namespace: next(versions))
+    index = EventSearchIndex()
+    index.ensure_fresh(db)
+    assert len(index) == 2
+
+    db.query(Event).filter(Event.id == 1).delete()
+    db.commit()
+    index.ensure_fresh(db)
+    assert index.search(["조용필"]) == []
+    assert [event_id for event_id, _ in index.search(["임영웅"])] == [2]
+    db.close()
+    engine.dispose()
+
+
+def test_search_not_blocked_during_sync(monkeypatch):
+    """동기화가 DB를 조회하는 동안에도 검색은 이전 색인으로 바로 응답"""
+    import threading
+    from app.services import search_index as search_index_module
+
+    index = build_index(make_event(1, "조용필 콘서트"))
+    started, finish = threading.Event(), threading.Event()
+
+    class SlowSession:
+        def query(self, *args):
+            started.set()
+            finish.wait(5)
+            raise RuntimeError("조회 중단")
+
+    monkeypatch.setattr(search_index_module.cache_service, "namespace_version", lambda namespace: 1)
+    def sync():
+        try:
+            index.ensure_fresh(SlowSession())
+        except RuntimeError:
+            pass
+
+    syncer = threading.Thread(target=sync)
+    syncer.start()
+    assert started.wait(5)
+    results = []
+    searcher = threading.Thread(target=lambda: results.append(index.search(["조용필"])))
+    searcher.start()
+    searcher.join(1)
+    try:
+        assert not searcher.is_alive()
+        assert [event_id for event_id, _ in results[0]] == [1]
+    finally:
+        finish.set()
+        syncer.join()
+        searcher.join()
@@ -0,0 +1,77 @@
+"""
+좌석 상태 캐시 테스트
+
+스케줄별 HASH 일괄 조회와 스케줄/이벤트 범위 무효화를 확인하고,
+서비스 코드에서 KEYS 명령을 사용하지 않는지 검사합니다.
+"""
+import random
+import re
+from pathlib import Path
+import pytest
+from app.services import redis_keys
+from app.services.redis_service import redis_service
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+# redis 클라이언트의 KEYS 호출 (인자 없는 dict.keys()는 제외)
+KEYS_USAGE = re.compile(r"\.keys\(\s*[^\s)]|execute_command\(\s*['\"]KEYS['\"]", re.IGNORECASE)
+
+
+def test_no_keys_command_in_app():
+    """KEYS는 전체 키 공간을 스캔하며 Redis를 블로킹하므로 사용 금지"""
+    offenders = [
+        f"{path.relative_to(APP_DIR)}:{lineno}"
+        for path in APP_DIR.rglob("*.py")
+        for lineno, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1)
+        if KEYS_USAGE.search(line)
+    ]
+    assert offenders == []
+
+
+@pytest.fixture
+def event_id():
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+    event_id = random.randint(10_000_000, 99_999_999)
+    yield event_id
+    redis_service.invalidate_seat_cache(event_id)
+
+
+def test_batch_read(event_id):
+    redis_service.cache_seat_statuses(event_id, 1, {"A-1": True, "A-2": False})
+    redis_service.cache_seat_status(event_id, 1, "A-3", True)
+
+    assert redis_service.get_seat_statuses(event_id, 1, ["A-1", "A-2", "B-1"]) == {
+        "A-1": True, "A-2": False, "B-1": None,
+    }
+    assert redis_service.get_seat_statuses(event_id, 1) == {"A-1": True, "A-2": False, "A-3": True}
+    # 스케줄당 키 하나
+    assert redis_service.client.type(redis_keys.seat_status(event_id, 1)) == "hash"
+    assert redis_service.client.ttl(redis_keys.seat_status(event_id, 1)) > 0
+
+
+def test_invalidate_single_schedule(event_id):
+    redis_service.cache_seat_status(event_id, 1, "A-1", False)
+    redis_service.cache_seat_status(event_id, 2, "A-1", True)
+    redis_service.cache_event_seats(event_id, 1, {"A-1": False})
+
+    redis_service.invalidate_seat_cache(event_id, 1)
+
+    assert redis_service.get_seat_status(event_id, 1, "A-1") is None
+    assert redis_service.get_cached_event_seats(event_id, 1) is None
+    assert redis_service.get_seat_status(event_id, 2, "A-1") is True
+
+
+def test_invalidate_whole_event(event_id):
+    redis_service.cache_seat_status(event_id, 1, "A-1", False)
+    redis_service.cache_seat_status(event_id, None, "A-2", True)
+    redis_service.cache_seat_status(event_id + 1, 1, "A-1", False)
+
+    redis_service.invalidate_seat_cache(event_id)
+
+    assert redis_service.get_seat_status(event_id, 1, "A-1") is None
+    assert redis_service.get_seat_status(event_id, None, "A-2") is None
+    # 다른 이벤트는 영향 없음
+    assert redis_service.get_seat_status(event_id + 1, 1, "A-1") is False
+    redis_service.invalidate_seat_cache(event_id + 1)
+    # 이벤트 인덱스 SET까지 모두 정리
+    assert not redis_service.client.exists(redis_keys.seat_cache_index(event_id), redis_keys.seat_status(event_id, 1))
@@ -28,6 +28,7 @@ from app.models.refresh_token import RefreshToken
 from app.core.security import get_password_hash
 from app.core.dependencies import get_current_user
 from app.services.redis_service import redis_service
+from app.services.seat_hold_service import temporary_ticket_id
 import redis
 
 
@@ -417,9 +418,8 @@ def test_concurrent_booking_without_lock(db_session: Session, test_users: List[U
     # Redis 락 초기화 (테스트를 위해)
     try:
         # 테스트용 티켓 ID 생성
-        ticket_key = f"{event.id}:{schedule.id}:{seat_row}:{seat_number}"
-        ticket_id = -abs(hash(ticket_key)) % 1000000
-        redis_service.unlock_seat(ticket_id)
+        ticket_id = temporary_ticket_id(event.id, schedule.id, seat_row, seat_number)
+        redis_service.unlock_seat(ticket_id, event_id=event.id)
     except:
         pass
     
@@ -491,9 +491,8 @@ def test_concurrent_booking_with_lock(test_client: TestClient, test_users: List[
     
     # Redis 락 초기화
     try:
-        ticket_key = f"{event.id}:{schedule.id}:{seat_row}:{seat_number}"
-        ticket_id = -abs(hash(ticket_key)) % 1000000
-        redis_service.unlock_seat(ticket_id)
+        ticket_id = temporary_ticket_id(event.id, schedule.id, seat_row, seat_number)
+        redis_service.unlock_seat(ticket_id, event_id=event.id)
     except:
         pass
     
@@ -565,9 +564,8 @@ def test_seat_lock_api(test_client: TestClient, test_users: List[User], test_eve
     
     # Redis 락 초기화
     try:
-        ticket_key = f"{event.id}:{schedule.id}:{seat_row}:{seat_number}"
-        ticket_id = -abs(hash(ticket_key)) % 1000000
-        redis_service.unlock_seat(ticket_id)
+        ticket_id = temporary_ticket_id(event.id, schedule.id, seat_row, seat_number)
+        redis_service.unlock_seat(ticket_id, event_id=event.id)
     except:
         pass
     
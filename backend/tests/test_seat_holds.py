@@ -0,0 +1,111 @@
+"""
+좌석 홀드 수명 관리 테스트 (Redis 필요)
+
+홀드 생성/충돌, 하트비트 연장과 최대 유지 시간, 홀드 단위/전체 해제, 같은 사용자의 좌석 이전,
+회차별 1인 최대 좌석 수를 확인합니다.
+"""
+import random
+import time
+import pytest
+from app.core.config import settings
+from app.services.redis_service import redis_service
+from app.services.seat_hold_service import (
+    seat_hold_service, SeatHoldLimitError, SeatUnavailableError, temporary_ticket_id
+)
+
+
+@pytest.fixture
+def event_id():
+    if not redis_service.ping():
+        pytest.skip("Redis에 연결할 수 없습니다")
+    event_id = random.randint(10_000_000, 99_999_999)
+    yield event_id
+    for user_id in (1, 2):
+        seat_hold_service.release(user_id)
+
+
+def make_seats(event_id, numbers, schedule_id=None):
+    return [
+        {"row": "A", "number": number, "ticket_id": temporary_ticket_id(event_id, schedule_id, "A", number)}
+        for number in numbers
+    ]
+
+
+def test_temporary_ticket_id_is_stable_and_negative():
+    ticket_id = temporary_ticket_id(1, 2, "1열", 5)
+    assert ticket_id == temporary_ticket_id(1, 2, "1열", 5)
+    assert ticket_id < 0
+    assert ticket_id != temporary_ticket_id(1, 2, "1열", 6)
+
+
+def test_acquire_conflict_releases_partial_locks(event_id):
+    hold = seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [1, 2]))
+    assert redis_service.get_lock_user_id(hold.seats[0]["ticket_id"], event_id=event_id) == 1
+
+    with pytest.raises(SeatUnavailableError) as exc_info:
+        seat_hold_service.acquire(2, event_id, None, make_seats(event_id, [3, 2]))
+    assert exc_info.value.seat["number"] == 2
+    # 실패한 요청이 먼저 잡은 3번 좌석은 해제됨
+    seat3 = make_seats(event_id, [3])[0]
+    assert redis_service.get_lock_user_id(seat3["ticket_id"], event_id=event_id) is None
+
+
+def test_failed_acquire_restores_moved_seats(event_id):
+    hold_a = seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [1]))
+    seat_hold_service.acquire(2, event_id, None, make_seats(event_id, [3]))
+
+    # 1번 좌석은 새 홀드로 이전된 뒤 3번 좌석 충돌로 실패 → 1번 좌석은 원래 홀드로 되돌아감
+    with pytest.raises(SeatUnavailableError):
+        seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [1, 3]))
+    renewed = seat_hold_service.renew(1, hold_a.hold_id)
+    assert renewed is not None
+    assert [seat["number"] for seat in renewed.seats] == [1]
+
+
+def test_heartbeat_capped_by_max_lifetime(event_id, monkeypatch):
+    monkeypatch.setattr(settings, "SEAT_HOLD_MAX_LIFETIME", 30)
+    hold = seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [1]))
+
+    renewed = seat_hold_service.renew(1, hold.hold_id)
+    assert renewed is not None
+    assert renewed.expires_at <= hold.created_at + 30
+
+    # 최대 유지 시간이 지나면 연장되지 않고 좌석이 반환됨
+    monkeypatch.setattr(time, "time", lambda: hold.created_at + 31)
+    assert seat_hold_service.renew(1, hold.hold_id) is None
+    assert redis_service.get_lock_user_id(hold.seats[0]["ticket_id"], event_id=event_id) is None
+
+
+def test_release_all_holds_and_takeover(event_id):
+    first = seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [1, 2]))
+    # 같은 사용자가 2번 좌석을 다시 선택하면 새 홀드로 이전
+    second = seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [2, 3]))
+    assert {hold.hold_id for hold in seat_hold_service.list_holds(1)} == {first.hold_id, second.hold_id}
+
+    # 이전 홀드 해제는 이전된 좌석을 건드리지 않음
+    assert seat_hold_service.release(1, first.hold_id) == 1
+    assert redis_service.get_lock_user_id(second.seats[0]["ticket_id"], event_id=event_id) == 1
+
+    assert seat_hold_service.release(1) == 2
+    assert seat_hold_service.list_holds(1) == []
+    assert seat_hold_service.renew(1, second.hold_id) is None
+
+
+def test_per_user_hold_limit(event_id, monkeypatch):
+    monkeypatch.setattr(settings, "SEAT_HOLD_MAX_PER_USER", 2)
+    first = seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [1, 2]))
+
+    with pytest.raises(SeatHoldLimitError):
+        seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [3]))
+    seat3 = make_seats(event_id, [3])[0]
+    assert redis_service.get_lock_user_id(seat3["ticket_id"], event_id=event_id) is None
+
+    # 이미 보유한 좌석을 다시 선택하는 것은 추가 좌석이 아님
+    assert seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [2])) is not None
+    # 다른 회차와 다른 사용자는 별도로 계산
+    assert seat_hold_service.acquire(1, event_id, 7, make_seats(event_id, [1], schedule_id=7)) is not None
+    assert seat_hold_service.acquire(2, event_id, None, make_seats(event_id, [4, 5])) is not None
+
+    # 해제하면 바로 다시 선택 가능
+    seat_hold_service.release(1, first.hold_id)
+    assert seat_hold_service.acquire(1, event_id, None, make_seats(event_id, [3])) is not None
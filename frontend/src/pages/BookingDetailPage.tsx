@@ -13,7 +13,9 @@ const BookingDetailPage: React.FC = () => {
   useEffect(() => {
     const fetchBookingDetail = async () => {
       try {
-        const allBookings = await bookingsApi.getMyBookings();
+        const { bookings: allBookings } = await bookingsApi.getMyBookings({
+          reservation_number: reservationNumber,
+        });
         // 예약번호로 필터링
         const filteredBookings = allBookings.filter(
           (booking) => booking.reservation_number === reservationNumber
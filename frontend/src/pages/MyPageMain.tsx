@@ -8,17 +8,19 @@ const MyPageMain: React.FC = () => {
   const navigate = useNavigate();
   const [user, setUser] = useState<User | null>(null);
   const [bookings, setBookings] = useState<UserBooking[]>([]);
+  const [totalCount, setTotalCount] = useState<number | null>(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [userData, bookingsData] = await Promise.all([
+        const [userData, bookingsPage] = await Promise.all([
           authApi.getMe(),
           bookingsApi.getMyBookings(),
         ]);
         setUser(userData);
-        setBookings(bookingsData);
+        setBookings(bookingsPage.bookings);
+        setTotalCount(bookingsPage.totalCount);
       } catch (error) {
         console.error("데이터를 가져오는 중 오류:", error);
       } finally {
@@ -40,7 +42,7 @@ const MyPageMain: React.FC = () => {
   }, {} as Record<string, UserBooking[]>);
 
   // 예매 내역 개수 계산
-  const reservationCount = Object.keys(groupedBookings).length;
+  const reservationCount = totalCount ?? Object.keys(groupedBookings).length;
 
   if (loading) {
     return (
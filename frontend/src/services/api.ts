@@ -377,6 +377,12 @@ export interface UserBooking {
   quantity: number;
 }
 
+export interface UserBookingPage {
+  bookings: UserBooking[];
+  nextCursor: string | null;
+  totalCount: number | null;
+}
+
 export interface SeatInfo {
   row: string;
   number: number;
@@ -401,6 +407,7 @@ export interface CreateBookingRequest {
     detailAddress?: string;
     postalCode?: string;
   } | null;
+  hold_id?: string | null;
 }
 
 export interface SeatLockRequest {
@@ -413,6 +420,17 @@ export interface SeatLockResponse {
   success: boolean;
   message: string;
   locked_seats: Array<{ row: string; number: number; ticket_id: number }>;
+  hold_id?: string | null;
+  expires_at?: string | null;
+}
+
+export interface SeatHold {
+  hold_id: string;
+  event_id: number;
+  schedule_id?: number | null;
+  seats: Array<{ row: string; number: number; ticket_id: number }>;
+  expires_at: string;
+  max_expires_at: string;
 }
 
 export const bookingsApi = {
@@ -423,13 +441,45 @@ export const bookingsApi = {
     );
     return response.data;
   },
+  // 좌석 홀드 목록
+  getSeatHolds: async (): Promise<SeatHold[]> => {
+    const response = await apiClient.get<SeatHold[]>("/seats/lock");
+    return response.data;
+  },
+  // 좌석 홀드 연장 (예매 정보 입력 중 주기적으로 호출, 만료 시 404)
+  renewSeatHold: async (holdId: string): Promise<SeatHold> => {
+    const response = await apiClient.post<SeatHold>(
+      `/seats/lock/${holdId}/heartbeat`
+    );
+    return response.data;
+  },
+  // 좌석 홀드 해제 (holdId가 없으면 모든 홀드)
+  releaseSeatHolds: async (holdId?: string): Promise<number> => {
+    const response = await apiClient.delete<{ released_seats: number }>(
+      "/seats/lock",
+      { params: holdId ? { hold_id: holdId } : undefined }
+    );
+    return response.data.released_seats;
+  },
   create: async (data: CreateBookingRequest): Promise<Booking[]> => {
     const response = await apiClient.post<Booking[]>("/bookings", data);
     return response.data;
   },
-  getMyBookings: async (): Promise<UserBooking[]> => {
-    const response = await apiClient.get<UserBooking[]>("/bookings/my");
-    return response.data;
+  // 예약번호 단위 페이지 조회 (다음 페이지 커서, 첫 페이지의 전체 예약 수 포함)
+  getMyBookings: async (params?: {
+    cursor?: string;
+    limit?: number;
+    reservation_number?: string;
+  }): Promise<UserBookingPage> => {
+    const response = await apiClient.get<UserBooking[]>("/bookings/my", {
+      params,
+    });
+    const totalCount = response.headers["x-total-count"];
+    return {
+      bookings: response.data,
+      nextCursor: response.headers["x-next-cursor"] ?? null,
+      totalCount: totalCount != null ? Number(totalCount) : null,
+    };
   },
 };
 